@@ -0,0 +1,213 @@
+"""Burst load ke liye request coalescing aur admission control.
+
+Class mein instructor "OSPF poocho" bolta hai aur ek second mein saikdon
+lagbhag same sawal aate hain. Do guard hain:
+
+* `SingleFlight` - same key (normalized question) ke concurrent callers ek
+  hi in-flight computation share karte hain. Leader ka client chala jaaye
+  to bhi computation baaki followers ke liye chalta rehta hai. Shared object
+  kuch bhi ho sakta hai - LLM fallback wahan apna streaming answer rakhta hai.
+* `AdmissionController` + `AdmissionMiddleware` - `max_concurrency` requests
+  ek saath andar; baaki ek bounded FIFO queue mein. Queue bhari ho to
+  turant 429, aur `queue_timeout` tak slot na mile to 503 - dono
+  `Retry-After` ke saath. Isse overload par latency bounded rehti hai,
+  sab requests dheere hone ke bajaye kuch requests jaldi mana ho jaati hain.
+"""
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from metrics import REGISTRY, Counter, observe_stage
+
+ADMISSION = REGISTRY.register(Counter(
+    "netpath_admission_total", "Admission decisions for guarded endpoints by outcome.", ("outcome",),
+))
+COALESCED = REGISTRY.register(Counter(
+    "netpath_coalesced_total", "Single-flight calls by role (leader ran it, follower shared it).", ("role",),
+))
+
+
+class SingleFlight:
+    """Key -> in-flight object; duplicates wahi object share karte hain."""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, Any] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def join(self, key: Hashable, start: Callable[[], Optional[Any]]) -> Tuple[Optional[Any], bool]:
+        """(flight, leader) - key ka in-flight object, warna `start()` ka naya.
+
+        `start()` None de (kaam shuru hi nahi hua) to kuch register nahi hota.
+        Leader kaam khatam hone par `forget(key, flight)` bulata hai.
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.followers += 1
+            COALESCED.inc(("follower",))
+            return flight, False
+        flight = start()
+        if flight is not None:
+            self.leaders += 1
+            COALESCED.inc(("leader",))
+            self._flights[key] = flight
+        return flight, True
+
+    def forget(self, key: Hashable, flight: Any) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def describe(self) -> Dict[str, Any]:
+        total = self.leaders + self.followers
+        return {
+            "in_flight": len(self._flights),
+            "leaders": self.leaders,
+            "followers": self.followers,
+            "coalescing_ratio": round(self.followers / total, 4) if total else 0.0,
+        }
+
+
+class Overloaded(Exception):
+    """Admission mana hua - `status` (429/503) aur `retry_after` seconds ke saath."""
+
+    def __init__(self, status: int, retry_after: int, reason: str):
+        super().__init__(reason)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Concurrency limit + bounded FIFO queue; slot release hote hi agle waiter ko milta hai."""
+
+    def __init__(self, max_concurrency: int = 64, max_queue: int = 256, queue_timeout: float = 1.0):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_full = 0
+        self.rejected_timeout = 0
+        self.peak_queue = 0
+        # Service time ka EWMA (seconds) - Retry-After estimate ke liye
+        self.service_time = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        backlog = (len(self._waiters) + 1) * self.service_time / max(self.max_concurrency, 1)
+        return max(1, math.ceil(backlog))
+
+    async def acquire(self) -> None:
+        if self.active < self.max_concurrency and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            ADMISSION.inc(("admitted",))
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.rejected_full += 1
+            ADMISSION.inc(("rejected_full",))
+            raise Overloaded(429, self.retry_after(), "Too many requests queued, please retry")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        self.peak_queue = max(self.peak_queue, len(self._waiters))
+        ADMISSION.inc(("queued",))
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done():
+                # Slot mil chuka tha par ab use nahi hoga - agle ko de do
+                self._hand_off()
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            self.rejected_timeout += 1
+            ADMISSION.inc(("rejected_timeout",))
+            raise Overloaded(503, self.retry_after(), "Server busy, please retry")
+        self.admitted += 1
+        ADMISSION.inc(("admitted",))
+
+    def release(self, elapsed: float) -> None:
+        self.service_time += 0.1 * (elapsed - self.service_time)
+        self._hand_off()
+
+    def _hand_off(self) -> None:
+        # Slot seedha agle waiter ko - `active` wahi rehta hai
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": len(self._waiters),
+            "peak_queue_depth": self.peak_queue,
+            "max_queue": self.max_queue,
+            "queue_timeout_s": self.queue_timeout,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected_full": self.rejected_full,
+            "rejected_timeout": self.rejected_timeout,
+            "service_time_ms": round(self.service_time * 1000, 3),
+        }
+
+
+class AdmissionMiddleware:
+    """Pure ASGI middleware - sirf `paths` wale HTTP requests controller se guzarte hain."""
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController, paths: Iterable[str]):
+        self.app = app
+        self.controller = controller
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        arrived = time.perf_counter()
+        try:
+            await self.controller.acquire()
+        except Overloaded as exc:
+            await _reject(send, exc)
+            return
+        started = time.perf_counter()
+        # Queue wait apna "queue" stage hai; handler ka "parse" stage yahan se ginta hai
+        observe_stage(scope["path"], "queue", started - arrived)
+        scope.setdefault("state", {})["admitted_at"] = started
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(time.perf_counter() - started)
+
+
+async def _reject(send: Send, exc: Overloaded) -> None:
+    body = json.dumps({"detail": str(exc)}).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": exc.status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"retry-after", str(exc.retry_after).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,84 @@
+"""Normalized-question cache for /ask.
+
+Classroom traffic mein wahi kuch sawal baar-baar aate hain. Cache key
+question ka normalized roop hai aur value final encoded JSON bytes (labels
+ke saath), taaki hit par matching aur serialization dono skip ho jaayein.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+from hinglish import HinglishNormalizer
+
+# Transliteration, stopword/filler aur synonym tables import (startup) par ek baar compile
+NORMALIZER = HinglishNormalizer()
+
+
+def normalize_question(question: str) -> str:
+    """Case, Unicode/script, punctuation, stopwords + Hinglish fillers aur synonyms normalize karta hai."""
+    return NORMALIZER.normalize(question)
+
+
+class AnswerCache:
+    """Bounded LRU + TTL cache, values pre-encoded responses hain."""
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, body = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: Hashable, body: Any) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def recent_keys(self, limit: int) -> List[Hashable]:
+        """Sabse haal mein use hue keys, naye pehle."""
+        with self._lock:
+            keys = list(self._entries)
+        return keys[::-1][:limit]
+
+    def clear(self) -> None:
+        """Knowledge base badalne par saare cached answers hata deta hai."""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
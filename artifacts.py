@@ -0,0 +1,165 @@
+"""Cold start ke liye precompiled artifacts ki ek snapshot file.
+
+Boot par sabse mehnga kaam compiled knowledge (entries, keyword matcher,
+fuzzy trigram index, BM25 index) banana aur UI page ko brotli-11/gzip-9 se
+compress karna hai. Deploy ke build phase mein yeh ek baar hota hai:
+
+    python artifacts.py build [--output build/netpath.snapshot]
+
+aur boot par `main.py` file padh kar seedha ready objects le leta hai.
+File mein pehle ek chhota header pickle hai (format, Python version,
+source/pack/page digests), phir artifacts. Header ka koi bhi digest
+mismatch ho - code badla, pack badla, HTML badla, Python badla - to woh
+hissa ignore hota hai aur normal build hota hai, kabhi stale answer nahi.
+
+Pre-fork mode mein file parent mein ek baar load hoti hai; workers use
+copy-on-write share karte hain.
+
+Environment:
+    NETPATH_ARTIFACTS   snapshot file path (default build/netpath.snapshot; khali = band)
+"""
+import argparse
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from knowledge import KnowledgeSnapshot, pack_digest
+from static_assets import PrecompressedPage
+
+logger = logging.getLogger("netpath.artifacts")
+
+FORMAT_VERSION = 1
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(BASE_DIR, "build", "netpath.snapshot")
+
+# In modules ke classes pickle mein hain - inka code badle to snapshot stale
+SOURCE_MODULES = ("knowledge", "matcher", "fuzzy", "retrieval", "answer_cache", "hinglish", "static_assets")
+
+
+def source_digest() -> str:
+    digest = hashlib.sha256()
+    for module in SOURCE_MODULES:
+        with open(os.path.join(BASE_DIR, module + ".py"), "rb") as handle:
+            digest.update(handle.read())
+    return digest.hexdigest()
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _knowledge_params(snapshot: KnowledgeSnapshot) -> Dict[str, Any]:
+    return {
+        "fuzzy_threshold": snapshot.fuzzy.threshold,
+        "cache_size": snapshot.cache.max_entries,
+        "cache_ttl": snapshot.cache.ttl_seconds,
+    }
+
+
+class Artifacts:
+    """Loaded snapshot file; har hissa tabhi milta hai jab uska digest current se mile."""
+
+    def __init__(self, header: Optional[Dict[str, Any]] = None, body: Optional[Dict[str, Any]] = None):
+        self.header = header or {}
+        self.body = body or {}
+        self.used: List[str] = []
+
+    def knowledge(self, directory: str, **params: Any) -> Optional[KnowledgeSnapshot]:
+        """Pack aur compile params wahi hon to precompiled snapshot, warna None."""
+        snapshot = self.body.get("knowledge")
+        if snapshot is None:
+            return None
+        if self.header.get("pack_digest") != pack_digest(directory):
+            logger.info("Snapshot file knowledge is stale (pack changed), rebuilding")
+            return None
+        if _knowledge_params(snapshot) != params:
+            logger.info("Snapshot file knowledge was built with different settings, rebuilding")
+            return None
+        self.used.append("knowledge")
+        return snapshot
+
+    def page(self, html: str) -> Optional[PrecompressedPage]:
+        page = self.body.get("page")
+        if page is None or self.header.get("page_digest") != text_digest(html):
+            return None
+        self.used.append("page")
+        return page
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "built_at": self.header.get("built_at"),
+            "used": list(self.used),
+        }
+
+
+def load(path: str) -> Artifacts:
+    """Snapshot file padhta hai; na ho / format ya code alag ho to khali Artifacts."""
+    if not path:
+        return Artifacts()
+    try:
+        with open(path, "rb") as handle:
+            header = pickle.load(handle)
+            if (
+                header.get("format") != FORMAT_VERSION
+                or tuple(header.get("python", ())) != tuple(sys.version_info[:2])
+                or header.get("source_digest") != source_digest()
+            ):
+                logger.warning("Snapshot file %s was built by different code, ignoring it", path)
+                return Artifacts()
+            body = pickle.load(handle)
+    except FileNotFoundError:
+        return Artifacts()
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as exc:
+        logger.warning("Could not read snapshot file %s: %s", path, exc)
+        return Artifacts()
+    return Artifacts(header, body)
+
+
+def write(path: str, knowledge: KnowledgeSnapshot, directory: str, page: PrecompressedPage, html: str) -> int:
+    """Snapshot file atomically likhta hai (tmp + rename); bytes lautata hai."""
+    header = {
+        "format": FORMAT_VERSION,
+        "python": tuple(sys.version_info[:2]),
+        "source_digest": source_digest(),
+        "pack_digest": pack_digest(directory),
+        "page_digest": text_digest(html),
+        "built_at": round(time.time(), 3),
+    }
+    directory_name = os.path.dirname(path)
+    if directory_name:
+        os.makedirs(directory_name, exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as handle:
+        pickle.dump(header, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump({"knowledge": knowledge, "page": page}, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary, path)
+    return os.path.getsize(path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the NetPath cold-start snapshot file")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="knowledge + UI page compile karke snapshot file likho")
+    build.add_argument("--output", default=os.environ.get("NETPATH_ARTIFACTS") or DEFAULT_PATH)
+    args = parser.parse_args()
+
+    # Fresh build - purani snapshot file se kuch na uthaya jaye
+    os.environ["NETPATH_ARTIFACTS"] = ""
+    os.environ.setdefault("QUERY_LOG_PATH", "")
+    started = time.perf_counter()
+    import main as app_module
+
+    size = write(
+        args.output, app_module.KNOWLEDGE.current, app_module.KNOWLEDGE_DIR,
+        app_module.UI_PAGE, app_module.HTML_CONTENT,
+    )
+    print(f"Wrote {args.output} ({size / 1024:.1f} KiB) in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""FuzzyMatcher latency jab vocabulary real ~30 words se hazaron tak badhe.
+
+Trigram shortlist ki wajah se per-word latency lagbhag flat rehni chahiye.
+
+Usage: python benchmarks/bench_fuzzy.py [--sizes 0,1000,20000] [--number N]
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fuzzy import FuzzyMatcher  # noqa: E402
+from main import KNOWLEDGE  # noqa: E402
+
+TERMS = [*KNOWLEDGE.current.keywords.items(), *((topic, topic) for topic in KNOWLEDGE.current.entries)]
+
+# (typo, expected topic)
+TYPOS = [
+    ("subneting", "subnetting"),
+    ("opsf", "ospf"),
+    ("vlna", "vlan"),
+    ("tracrt", "tracert"),
+    ("firewal", "firewall"),
+]
+
+# Poore sawal resolve() se (sawal, expected topic) - aas-paas ke chhote words
+# typo correction na rokein, par anjaan acronym ke baad wala word correct na ho
+ACCURACY = [
+    ("ok opsf", "ospf"),
+    ("so tracrt kaise", "tracert"),
+    ("my vlna config", "vlan"),
+    ("what is ap mode", "help"),
+]
+
+
+def check_accuracy() -> bool:
+    snapshot = KNOWLEDGE.current
+    ok = True
+    for question, topic in ACCURACY:
+        resolution = snapshot.resolve(question)
+        passed = resolution.topic == topic
+        ok = ok and passed
+        print(f"{'ok  ' if passed else 'FAIL'} {question!r} -> {resolution.topic} ({resolution.match_type})")
+    return ok
+
+
+def scaled_terms(extra, seed=5):
+    """Real terms pehle (priority), phir random words."""
+    rng = random.Random(seed)
+    terms = list(TERMS)
+    for _ in range(extra):
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 12)))
+        terms.append((word, "help"))
+    return terms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="0,1000,20000", help="extra random vocabulary words")
+    parser.add_argument("--number", type=int, default=500)
+    args = parser.parse_args()
+
+    if not check_accuracy():
+        sys.exit(1)
+    print()
+    print(f"{'vocab':>8}{'build ms':>10}{'mean us':>10}{'max us':>10}{'found':>8}")
+    for extra in (int(s) for s in args.sizes.split(",")):
+        terms = scaled_terms(extra)
+        started = time.perf_counter()
+        matcher = FuzzyMatcher(terms)
+        build_ms = (time.perf_counter() - started) * 1e3
+
+        # Random vocabulary mein chhote typos ("opsf") shortlist se bahar ho sakte hain
+        found = sum(1 for typo, topic in TYPOS if (matcher.correct_word(typo) or (None, None))[1] == topic)
+
+        samples = []
+        for _ in range(args.number):
+            for typo, _ in TYPOS:
+                started = time.perf_counter()
+                matcher.correct_word(typo)
+                samples.append((time.perf_counter() - started) * 1e6)
+        print(f"{len(matcher):>8}{build_ms:>10.1f}{sum(samples) / len(samples):>10.1f}{max(samples):>10.1f}{found:>5}/{len(TYPOS)}")
+
+
+if __name__ == "__main__":
+    main()
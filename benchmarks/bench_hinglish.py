@@ -0,0 +1,154 @@
+"""Hinglish normalization: per-sawal cost aur Hinglish corpus par match accuracy.
+
+Corpus mein English, Latin Hinglish aur Devanagari sawal hain, har ek ke
+saath expected topic. Do pipelines compare hoti hain - "plain" (sirf
+lowercase + punctuation + English stopwords, pehle wala behaviour) aur
+"hinglish" (NFKC + transliteration + fillers + synonyms). Har pipeline ke
+liye knowledge snapshot usi normalization se banta hai, phir har sawal
+`resolve` hota hai.
+
+Usage: python benchmarks/bench_hinglish.py [--number 20000]
+"""
+import argparse
+import os
+import sys
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import knowledge  # noqa: E402
+from hinglish import ENGLISH_STOPWORDS, HinglishNormalizer  # noqa: E402
+
+# (sawal, expected topic)
+CORPUS = (
+    # English - normalization se behaviour nahi badalna chahiye
+    ("what is ospf", "ospf"),
+    ("Explain BGP please", "bgp"),
+    ("tcp vs udp", "tcp vs udp"),
+    ("how does dhcp work", "dhcp"),
+    ("what is a vlan?", "vlan"),
+    ("thank you", "thank you"),
+    # Latin Hinglish
+    ("subnet kaise karte hain", "subnetting"),
+    ("router kya hota hai", "router"),
+    ("switch kya hai bhai", "switch"),
+    ("firewall kaise kaam karta hai", "firewall"),
+    ("dns kya hota hai", "dns"),
+    ("ospf kya hai samjhao", "ospf"),
+    ("vpn ka matlab kya hai", "vpn"),
+    ("ip address kya hota hai", "ip address"),
+    ("ip ka pata kaise pata kare", "ip address"),
+    ("network ki suraksha kaise kare", "network security"),
+    ("suraksha ke liye kya kare", "network security"),
+    # Known gap: "network" keyword "what is network" jeet jata hai (yeh aur Devanagari wala miss)
+    ("network me dikkat aa rahi hai", "network troubleshooting"),
+    ("internet me samasya hai kya kare", "network troubleshooting"),
+    ("shukriya", "thank you"),
+    ("dhanyavad bhai", "thank you"),
+    ("namaste", "hello"),
+    ("alvida", "bye"),
+    ("madad chahiye", "help"),
+    ("acl kya hai", "acl"),
+    ("stp kaise kaam karta hai", "stp"),
+    ("rip protocol kya hai", "rip"),
+    ("eigrp kya hota hai", "eigrp"),
+    ("ping kaise karte hain", "ping"),
+    ("tracert kya hai", "tracert"),
+    ("ipconfig kaise use kare", "ipconfig"),
+    ("osi model kya hai", "osi model"),
+    ("https kya hai", "https"),
+    # Devanagari
+    ("राउटर क्या है", "router"),
+    ("राउटर क्या होता है?", "router"),
+    ("स्विच क्या है", "switch"),
+    ("फ़ायरवॉल कैसे काम करता है", "firewall"),
+    ("फायरवॉल क्या है", "firewall"),
+    ("सबनेट कैसे करते हैं", "subnetting"),
+    ("सबनेटिंग क्या है", "subnetting"),
+    ("डीएनएस क्या है", "dns"),
+    ("डीएचसीपी क्या होता है", "dhcp"),
+    ("ओएसपीएफ क्या है", "ospf"),
+    ("बीजीपी क्या है", "bgp"),
+    ("वीलैन क्या होता है", "vlan"),
+    ("वीपीएन क्या है", "vpn"),
+    ("आईपी पता क्या है", "ip address"),
+    ("नेटवर्क सुरक्षा", "network security"),
+    ("नेटवर्क में समस्या है", "network troubleshooting"),
+    ("पिंग कैसे करते हैं", "ping"),
+    ("धन्यवाद", "thank you"),
+    ("शुक्रिया", "thank you"),
+    ("नमस्ते", "hello"),
+    ("अलविदा", "bye"),
+    ("मदद", "help"),
+    # Mixed script / Unicode forms
+    ("BGP क्या है", "bgp"),
+    ("OSPF कैसे काम करता है", "ospf"),
+    ("ｖｌａｎ kya hai", "vlan"),
+    ("kyā hai router", "router"),
+    # "pata" sirf networking noun ke baad address; ap/me English words hi rahein
+    ("mujhe pata nahi", "help"),
+    ("what is ap mode", "help"),
+    ("wireless ap kya hai", "help"),
+    ("show me vlan", "vlan"),
+)
+
+SAMPLES = {
+    "english": "What is the difference between OSI and TCP/IP?",
+    "hinglish": "subnet kaise karte hain bhai",
+    "devanagari": "राउटर क्या होता है?",
+}
+
+
+def accuracy(normalizer: HinglishNormalizer, directory: str) -> list:
+    """Snapshot isi normalizer se banta hai (direct topics + keywords), phir har sawal resolve."""
+    original = knowledge.normalize_question
+    knowledge.normalize_question = normalizer.normalize
+    try:
+        snapshot = knowledge.KnowledgeSnapshot(*knowledge.load_pack(directory))
+        return [snapshot.resolve(question).topic for question, _ in CORPUS]
+    finally:
+        knowledge.normalize_question = original
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    hinglish = HinglishNormalizer()
+    compile_ms = (time.perf_counter() - started) * 1000
+    plain = HinglishNormalizer(ENGLISH_STOPWORDS, fillers=(), synonyms={}, transliterate=False, context_synonyms={})
+    print(
+        f"tables compiled in {compile_ms:.2f} ms "
+        f"({hinglish.fillers} stopwords/fillers, {hinglish.synonyms} synonym forms)"
+    )
+
+    print(f"\n{'sample':<12}{'plain us':>10}{'hinglish us':>13}  normalized")
+    for name, question in SAMPLES.items():
+        costs = [
+            timeit.timeit(lambda n=normalizer: n.normalize(question), number=args.number) / args.number * 1e6
+            for normalizer in (plain, hinglish)
+        ]
+        print(f"{name:<12}{costs[0]:>10.2f}{costs[1]:>13.2f}  {hinglish.normalize(question)!r}")
+
+    directory = os.path.join(ROOT, "knowledge")
+    results = {name: accuracy(normalizer, directory) for name, normalizer in (("plain", plain), ("hinglish", hinglish))}
+    expected = [topic for _, topic in CORPUS]
+    print()
+    for name, topics in results.items():
+        correct = sum(got == want for got, want in zip(topics, expected))
+        print(f"{name:<9} accuracy {correct}/{len(CORPUS)} ({correct / len(CORPUS):.0%})")
+    misses = [
+        (question, want, got)
+        for (question, want), got in zip(CORPUS, results["hinglish"])
+        if got != want
+    ]
+    for question, want, got in misses:
+        print(f"  miss: {question!r} -> {got!r} (expected {want!r})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Micro-benchmark: purana keyword loop vs KeywordMatcher ke dono strategies.
+
+Aaj ke KEYWORD_MAPPING ke saath synthetic keywords jod kar alag-alag sizes
+par chalta hai, taaki knowledge base badhne par crossover dikh sake.
+
+Usage: python benchmarks/bench_matcher.py [--number N] [--sizes 37,200,1000]
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import KNOWLEDGE  # noqa: E402
+from matcher import KeywordMatcher  # noqa: E402
+
+KEYWORD_MAPPING = dict(KNOWLEDGE.current.keywords)
+
+
+def legacy_match(mapping, question_lower):
+    """find_best_answer ka purana loop, mapping har call par dobara banta tha."""
+    keyword_mapping = dict(mapping)
+    for keyword, answer_key in keyword_mapping.items():
+        if keyword in question_lower:
+            return answer_key
+    return None
+
+
+_FILLER = (
+    "mera lab setup mein kuch devices hain aur main samajhna chahta hoon ki "
+    "packets kaise travel karte hain between hosts in the same building. "
+)
+
+QUESTIONS = {
+    "short": "what is bgp",
+    "medium": (_FILLER * 2 + "please explain ospf areas").lower(),
+    "4kb": ((_FILLER * 40)[:4096 - len(" finally goodbye")] + " finally goodbye").lower(),
+}
+
+
+def scaled_mapping(size, seed=7):
+    """Random keywords pehle, real keywords aakhir mein (worst case for legacy)."""
+    rng = random.Random(seed)
+    mapping = {}
+    while len(mapping) < size - len(KEYWORD_MAPPING):
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+        mapping.setdefault(word, "help")
+    mapping.update(KEYWORD_MAPPING)
+    return mapping
+
+
+def per_call_us(func, number):
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def run(mapping, number):
+    matcher = KeywordMatcher(mapping)
+    print(f"\n{len(mapping)} keywords (match() uses {'automaton' if matcher.use_automaton else 'scan'})")
+    print(f"{'case':<8}{'bytes':>7}{'legacy us':>12}{'scan us':>10}{'automaton us':>14}")
+    for name, question in QUESTIONS.items():
+        expected = legacy_match(mapping, question)
+        assert expected == matcher.match_scan(question) == matcher.match_automaton(question), name
+        print(
+            f"{name:<8}{len(question):>7}"
+            f"{per_call_us(lambda: legacy_match(mapping, question), number):>12.2f}"
+            f"{per_call_us(lambda: matcher.match_scan(question), number):>10.2f}"
+            f"{per_call_us(lambda: matcher.match_automaton(question), number):>14.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=500)
+    parser.add_argument("--sizes", default=f"{len(KEYWORD_MAPPING)},200,1000")
+    args = parser.parse_args()
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        run(scaled_mapping(size), args.number)
+
+
+if __name__ == "__main__":
+    main()
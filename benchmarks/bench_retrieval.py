@@ -0,0 +1,94 @@
+"""TopicIndex latency jab knowledge base ~40 se hazaron entries tak badhe.
+
+Shuru mein retrieval acceptance check bhi chalta hai: off-topic sawal
+(ek rare word ka match) `help` fallback par jaane chahiye, on-topic
+retrieval par. Koi check fail ho to script exit code 1 deti hai.
+
+Usage: python benchmarks/bench_retrieval.py [--sizes 40,1000,20000] [--number N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge import FALLBACK_TOPIC, MATCH_FALLBACK, MATCH_RETRIEVAL  # noqa: E402
+from main import KNOWLEDGE  # noqa: E402
+from retrieval import TopicIndex  # noqa: E402
+
+NETWORK_KNOWLEDGE = dict(KNOWLEDGE.current.entries)
+
+QUERIES = [
+    "ospf vs eigrp convergence",
+    "what port does bgp use",
+    "mac address table in a switch",
+    "how does dns resolution work with dhcp lease",
+    "spanning tree loops and root bridge election",
+]
+
+# (sawal, expected topic, expected match type) - live knowledge pack par
+ACCEPTANCE = [
+    ("what time is it", FALLBACK_TOPIC, MATCH_FALLBACK),
+    ("what is your name", FALLBACK_TOPIC, MATCH_FALLBACK),
+    ("define bandwidth", FALLBACK_TOPIC, MATCH_FALLBACK),
+    ("what is the weather today", FALLBACK_TOPIC, MATCH_FALLBACK),
+    ("who won the match", FALLBACK_TOPIC, MATCH_FALLBACK),
+    ("spanning tree loops and root bridge election", "stp", MATCH_RETRIEVAL),
+    ("link state routing", "ospf", MATCH_RETRIEVAL),
+    ("distance vector protocol", "rip", MATCH_RETRIEVAL),
+    ("hop count metric", "rip", MATCH_RETRIEVAL),
+    ("broadcast domain segmentation", "vlan", MATCH_RETRIEVAL),
+]
+
+
+def check_acceptance() -> bool:
+    snapshot = KNOWLEDGE.current
+    ok = True
+    for question, topic, match_type in ACCEPTANCE:
+        resolution = snapshot.resolve(question)
+        passed = (resolution.topic, resolution.match_type) == (topic, match_type)
+        ok = ok and passed
+        print(f"{'ok  ' if passed else 'FAIL'} {question!r} -> {resolution.topic} ({resolution.match_type})")
+    return ok
+
+
+def synthetic_knowledge(size, seed=11):
+    """Real entries + random topics jo real vocabulary se bane hain."""
+    rng = random.Random(seed)
+    vocab = sorted({word for body in NETWORK_KNOWLEDGE.values() for word in body.lower().split()})
+    knowledge = dict(NETWORK_KNOWLEDGE)
+    while len(knowledge) < size:
+        topic = " ".join(rng.sample(vocab, 3)) + f" {len(knowledge)}"
+        knowledge[topic] = " ".join(rng.choice(vocab) for _ in range(rng.randint(20, 80)))
+    return knowledge
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=f"{len(NETWORK_KNOWLEDGE)},1000,20000")
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    if not check_acceptance():
+        sys.exit(1)
+    print()
+    print(f"{'entries':>8}{'build ms':>10}{'mean us':>10}{'max us':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        knowledge = synthetic_knowledge(size)
+        started = time.perf_counter()
+        index = TopicIndex(knowledge)
+        build_ms = (time.perf_counter() - started) * 1e3
+
+        samples = []
+        for _ in range(args.number):
+            for query in QUERIES:
+                started = time.perf_counter()
+                index.search(query, 5)
+                samples.append((time.perf_counter() - started) * 1e6)
+        print(f"{size:>8}{build_ms:>10.1f}{sum(samples) / len(samples):>10.1f}{max(samples):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
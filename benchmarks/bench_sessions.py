@@ -0,0 +1,60 @@
+"""Session store memory: 100k idle sessions, byte cap aur TTL sweep.
+
+Har round mein `--sessions` naye session ids (UUID jaise, 36 chars) aate
+hain. tracemalloc se store ki asli memory naapi jaati hai aur `used_bytes`
+estimate ke saath dikhayi jaati hai - cap ke baad memory flat rehni chahiye.
+
+Usage: python benchmarks/bench_sessions.py [--sessions 100000] [--rounds 4] [--max-mb 8]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sessions import MemorySessionStore  # noqa: E402
+
+TOPICS = ("bgp", "ospf", "vlan", "tcp", "dns", "subnetting")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--max-mb", type=float, default=8.0)
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    store = MemorySessionStore(max_bytes=int(args.max_mb * 1024 * 1024), ttl=0.5)
+
+    print(f"{'round':>5}{'sessions':>10}{'est MB':>8}{'traced MB':>11}{'evictions':>11}{'remember us':>13}")
+    for round_number in range(1, args.rounds + 1):
+        # Ids baseline ke baad bante hain - store mein rukne wali strings bhi gini jaati hain
+        round_ids = [str(uuid.uuid4()) for _ in range(args.sessions)]
+        started = time.perf_counter()
+        for index, session_id in enumerate(round_ids):
+            store.remember(session_id, TOPICS[index % len(TOPICS)])
+        per_call = (time.perf_counter() - started) / len(round_ids) * 1e6
+        del round_ids
+        traced = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+        print(
+            f"{round_number:>5}{len(store):>10}{store.used_bytes / 2**20:>8.2f}"
+            f"{traced / 2**20:>11.2f}{store.evictions:>11}{per_call:>13.2f}"
+        )
+
+    time.sleep(0.6)
+    started = time.perf_counter()
+    removed = store.sweep()  # benchmark mein ek hi baar, server mein SWEEP_BATCH chunks
+    traced = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+    print(
+        f"sweep after TTL: {removed} idle sessions removed in {(time.perf_counter() - started) * 1000:.1f} ms, "
+        f"{len(store)} left, traced {traced / 2**20:.2f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Subnet engine vs per-item `ipaddress` objects, batch size badhne par.
+
+Usage: python benchmarks/bench_subnet.py [--sizes 100,1000,20000] [--number N]
+"""
+import argparse
+import ipaddress
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import subnet  # noqa: E402
+
+
+def random_cidrs(size, seed=13):
+    rng = random.Random(seed)
+    return [
+        f"{rng.randrange(1, 224)}.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}/{rng.randint(8, 30)}"
+        for _ in range(size)
+    ]
+
+
+def ipaddress_describe(cidrs):
+    """Wahi fields jo subnet.describe_many deta hai, per-item ipaddress se."""
+    rows = []
+    for cidr in cidrs:
+        network = ipaddress.ip_network(cidr, strict=False)
+        hosts = network.num_addresses - 2 if network.prefixlen < 31 else network.num_addresses
+        rows.append((
+            str(network), str(network.network_address), str(network.broadcast_address),
+            str(network.netmask), str(network.hostmask), hosts,
+        ))
+    return rows
+
+
+def ipaddress_summarize(cidrs):
+    return [str(network) for network in ipaddress.collapse_addresses(
+        ipaddress.ip_network(cidr, strict=False) for cidr in cidrs
+    )]
+
+
+def best_ms(func, number):
+    best = float("inf")
+    for _ in range(number):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,20000")
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'cidrs':>7}{'ipaddress ms':>14}{'engine ms':>11}{'collapse ms':>13}{'summarize ms':>14}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        cidrs = random_cidrs(size)
+        assert subnet.summarize(cidrs)["routes"] == ipaddress_summarize(cidrs)
+        print(
+            f"{size:>7}"
+            f"{best_ms(lambda: ipaddress_describe(cidrs), args.number):>14.2f}"
+            f"{best_ms(lambda: subnet.describe_many(cidrs), args.number):>11.2f}"
+            f"{best_ms(lambda: ipaddress_summarize(cidrs), args.number):>13.2f}"
+            f"{best_ms(lambda: subnet.summarize(cidrs), args.number):>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
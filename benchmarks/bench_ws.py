@@ -0,0 +1,114 @@
+"""Chat session: har message ek POST /ask vs ek persistent /ws connection.
+
+Asli uvicorn server start hota hai; `--sessions` students ek saath chat
+karte hain, har ek `--messages` sawal ek ke baad ek bhejta hai. Dono
+transports ke liye throughput, latency aur server process ka CPU time per
+message (Linux /proc se) report hota hai.
+
+Usage: python benchmarks/bench_ws.py [--sessions 200] [--messages 50]
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import httpx
+import websockets
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from loadtest import ROOT, _free_port, summarize  # noqa: E402
+
+QUESTIONS = ["what is ospf", "tcp vs udp", "vlan", "subnetting", "how does dns work", "opsf kya hai"]
+
+
+def server_cpu_seconds(pid: int) -> float:
+    """utime + stime of the server process (Linux)."""
+    with open(f"/proc/{pid}/stat") as handle:
+        fields = handle.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def http_session(base_url: str, messages: int, samples: List[float]) -> None:
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        for index in range(messages):
+            started = time.perf_counter()
+            response = await client.post("/ask", json={"question": QUESTIONS[index % len(QUESTIONS)]})
+            response.raise_for_status()
+            samples.append((time.perf_counter() - started) * 1000)
+
+
+async def ws_session(base_url: str, messages: int, samples: List[float]) -> None:
+    async with websockets.connect(base_url.replace("http", "ws", 1) + "/ws", max_queue=None) as socket:
+        json.loads(await socket.recv())  # hello
+        for index in range(messages):
+            started = time.perf_counter()
+            await socket.send(json.dumps({"id": index, "question": QUESTIONS[index % len(QUESTIONS)]}))
+            reply = json.loads(await socket.recv())
+            assert reply["type"] == "answer" and reply["id"] == index, reply
+            samples.append((time.perf_counter() - started) * 1000)
+
+
+async def run_phase(session: Callable, pid: int, base_url: str, sessions: int, messages: int) -> Dict[str, Any]:
+    samples: List[float] = []
+    cpu_before = server_cpu_seconds(pid)
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(session(base_url, messages, samples) for _ in range(sessions)), return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - started
+    cpu = server_cpu_seconds(pid) - cpu_before
+    errors = sum(isinstance(result, BaseException) for result in results)
+    report = summarize(samples, errors, elapsed)
+    report["server_cpu_us_per_message"] = round(cpu / max(len(samples), 1) * 1e6, 1)
+    return report
+
+
+async def run(sessions: int, messages: int) -> Dict[str, Dict[str, Any]]:
+    port = _free_port()
+    env = dict(os.environ, QUERY_LOG_PATH="", WS_MAX_CONNECTIONS=str(sessions * 2))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            for _ in range(100):
+                try:
+                    await client.get("/health")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+            else:
+                raise RuntimeError("uvicorn server did not start")
+        return {
+            "http": await run_phase(http_session, server.pid, base_url, sessions, messages),
+            "ws": await run_phase(ws_session, server.pid, base_url, sessions, messages),
+        }
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=50)
+    args = parser.parse_args()
+
+    reports = asyncio.run(run(args.sessions, args.messages))
+    print(f"{'transport':<10}{'msg/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'cpu us/msg':>12}{'errors':>8}")
+    for name, report in reports.items():
+        print(
+            f"{name:<10}{report['throughput_rps']:>10}{report['p50_ms']:>9.3f}{report['p99_ms']:>9.3f}"
+            f"{report['server_cpu_us_per_message']:>12}{report['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
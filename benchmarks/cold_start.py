@@ -0,0 +1,76 @@
+"""Cold start: process launch se pehle /ask response tak ka wall time.
+
+Har run mein naya uvicorn process start hota hai aur /ask par tab tak poll
+kiya jata hai jab tak answer na aa jaye. Snapshot file ke saath aur bina
+(NETPATH_ARTIFACTS="") dono measure hote hain, aur aakhri run ki /health
+startup report (import/init phases) bhi print hoti hai.
+
+Usage: python benchmarks/cold_start.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from loadtest import ROOT, _free_port  # noqa: E402
+
+
+def first_answer(env: dict) -> tuple:
+    port = _free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=env,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=5) as client:
+            while True:
+                try:
+                    response = client.post("/ask", json={"question": "what is ospf"})
+                    if response.status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                if time.perf_counter() - started > 30:
+                    raise RuntimeError("server did not answer within 30s")
+                time.sleep(0.005)
+            elapsed = time.perf_counter() - started
+            report = client.get("/health").json()["startup"]
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    return elapsed, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    base_env = dict(os.environ, QUERY_LOG_PATH="")
+    subprocess.run([sys.executable, "artifacts.py", "build"], cwd=ROOT, env=base_env, check=True)
+    modes = {
+        "snapshot": base_env,
+        "no snapshot": dict(base_env, NETPATH_ARTIFACTS=""),
+    }
+    for name, env in modes.items():
+        timings = []
+        for _ in range(args.runs):
+            elapsed, report = first_answer(env)
+            timings.append(elapsed * 1000)
+        print(
+            f"{name:<12} first /ask median {statistics.median(timings):7.1f} ms  "
+            f"min {min(timings):7.1f} ms  max {max(timings):7.1f} ms"
+        )
+        print(f"{'':<12} last run startup report: {json.dumps(report['phases_ms'])}")
+
+
+if __name__ == "__main__":
+    main()
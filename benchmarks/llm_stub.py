@@ -0,0 +1,80 @@
+"""LLM fallback test karne ke liye local OpenAI-compatible stub server.
+
+Asli model ki jagah `/v1/chat/completions` par canned answer deta hai, aur
+delay / failure rate set karke timeout, concurrency limit aur circuit
+breaker ka behaviour bina network ke dekha ja sakta hai. `stream: true`
+par answer word-by-word SSE deltas mein aata hai (`--token-delay` har word ke beech).
+
+Usage:
+    python benchmarks/llm_stub.py [--port 8001] [--delay 0.2] [--jitter 0.1] [--fail-rate 0.0] [--token-delay 0.02]
+    LLM_FALLBACK_URL=http://127.0.0.1:8001/v1 python main.py
+"""
+import argparse
+import asyncio
+import json
+import random
+
+import uvicorn
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+
+
+def create_app(
+    delay: float = 0.2, jitter: float = 0.0, fail_rate: float = 0.0, token_delay: float = 0.02, seed: int = 7,
+) -> FastAPI:
+    app = FastAPI(title="NetPath LLM stub")
+    rng = random.Random(seed)
+    stats = {"requests": 0, "failures": 0}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(payload: dict):
+        stats["requests"] += 1
+        await asyncio.sleep(max(0.0, delay + rng.uniform(-jitter, jitter)))
+        if rng.random() < fail_rate:
+            stats["failures"] += 1
+            raise HTTPException(status_code=503, detail="stub failure")
+        question = payload["messages"][-1]["content"]
+        content = f"(stub) Aapne poocha: {question}"
+        if payload.get("stream"):
+            return StreamingResponse(stream_words(content), media_type="text/event-stream")
+        return {
+            "id": f"stub-{stats['requests']}",
+            "object": "chat.completion",
+            "model": payload.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+        }
+
+    async def stream_words(content: str):
+        for index, word in enumerate(content.split(" ")):
+            if index:
+                await asyncio.sleep(token_delay)
+                word = " " + word
+            chunk = {"choices": [{"index": 0, "delta": {"content": word}}]}
+            yield f"data: {json.dumps(chunk)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--delay", type=float, default=0.2, help="har response se pehle seconds")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="0..1, itne requests 503 denge")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="streaming mein har word ke beech seconds")
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.delay, args.jitter, args.fail_rate, args.token_delay), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""Load test aur latency benchmark for the FastAPI app.
+
+Default mode mein `main.app` ko httpx ke ASGI transport se in-process chalaya
+jata hai; `--server` dene par asli uvicorn server localhost par start hota hai.
+Har endpoint (`/`, `/ask`, `/health`) ka apna phase chalta hai aur report mein
+throughput, p50/p95/p99 aur fixed-bucket latency histogram aata hai.
+
+Usage:
+    python benchmarks/loadtest.py run [--requests N] [--concurrency C] [--server] [--output FILE]
+    python benchmarks/loadtest.py compare BASELINE.json CURRENT.json [--threshold 0.10]
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Latency histogram bucket upper bounds (ms); aakhri bucket +Inf
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000)
+
+_FILLER = (
+    "mere college lab mein do switches aur ek router hai, students apne laptops "
+    "connect karte hain aur kabhi kabhi internet slow ho jata hai. "
+)
+
+# /ask question mix: (category, weight, questions)
+QUESTION_MIX = (
+    ("direct", 40, ["tcp vs udp", "osi model", "subnetting", "hello", "help", "vlan", "bgp"]),
+    ("keyword", 35, ["explain ospf areas", "how does dns work", "what is a firewall", "configure vpn tunnel"]),
+    ("fallback", 15, ["what is the weather today", "tell me a joke", "kuch bhi batao"]),
+    ("long", 10, None),
+)
+
+
+def _long_question(rng: random.Random) -> str:
+    """~4 KB pasted question, har baar alag taaki cache miss ho."""
+    words = (_FILLER * 35).split()
+    rng.shuffle(words)
+    return " ".join(words)[:4000] + f" ticket {rng.randrange(10 ** 9)} ospf"
+
+
+def ask_plan(count: int, seed: int = 42) -> List[Tuple[str, Dict[str, Any]]]:
+    rng = random.Random(seed)
+    categories = [category for category, _, _ in QUESTION_MIX]
+    weights = [weight for _, weight, _ in QUESTION_MIX]
+    pools = {category: questions for category, _, questions in QUESTION_MIX}
+    plan = []
+    for category in rng.choices(categories, weights, k=count):
+        pool = pools[category]
+        question = rng.choice(pool) if pool else _long_question(rng)
+        plan.append((category, {"question": question}))
+    return plan
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    if not sorted_samples:
+        return 0.0
+    rank = min(len(sorted_samples) - 1, max(0, math.ceil(pct / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[rank]
+
+
+def summarize(samples_ms: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    ordered = sorted(samples_ms)
+    histogram = {f"le_{bound}ms": 0 for bound in BUCKETS_MS}
+    histogram["le_inf"] = 0
+    for value in ordered:
+        for bound in BUCKETS_MS:
+            if value <= bound:
+                histogram[f"le_{bound}ms"] += 1
+                break
+        else:
+            histogram["le_inf"] += 1
+    return {
+        "count": len(ordered),
+        "errors": errors,
+        "throughput_rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered), 4) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50), 4),
+        "p95_ms": round(percentile(ordered, 95), 4),
+        "p99_ms": round(percentile(ordered, 99), 4),
+        "max_ms": round(ordered[-1], 4) if ordered else 0.0,
+        "histogram": histogram,
+    }
+
+
+async def run_phase(
+    client: httpx.AsyncClient, method: str, path: str, payloads: List[Tuple[str, Optional[dict]]], concurrency: int
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Ek endpoint par saare requests chalata hai; overall + per-category summary."""
+    samples: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    queue = iter(payloads)
+
+    async def worker() -> None:
+        for category, body in queue:
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            samples.setdefault(category, []).append(elapsed_ms)
+            if not ok:
+                errors[category] = errors.get(category, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    everything = [value for values in samples.values() for value in values]
+    overall = summarize(everything, sum(errors.values()), elapsed)
+    by_category = {
+        category: summarize(values, errors.get(category, 0), elapsed)
+        for category, values in sorted(samples.items())
+    }
+    return overall, by_category
+
+
+async def run_suite(client: httpx.AsyncClient, requests: int, concurrency: int) -> Dict[str, Any]:
+    # Warmup - imports, first-hit caches
+    for path in ("/", "/health"):
+        await client.get(path)
+    await client.post("/ask", json={"question": "warmup"})
+
+    report: Dict[str, Any] = {"endpoints": {}, "ask_mix": {}}
+    phases = (
+        ("/", "GET", [("page", None)] * requests),
+        ("/ask", "POST", ask_plan(requests)),
+        ("/health", "GET", [("health", None)] * requests),
+    )
+    for path, method, payloads in phases:
+        overall, by_category = await run_phase(client, method, path, payloads, concurrency)
+        report["endpoints"][path] = overall
+        if path == "/ask":
+            report["ask_mix"] = by_category
+    return report
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _run_against_server(requests: int, concurrency: int) -> Dict[str, Any]:
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+            for _ in range(100):
+                try:
+                    await client.get("/health")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+            else:
+                raise RuntimeError("uvicorn server did not start")
+            return await run_suite(client, requests, concurrency)
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+async def _run_in_process(requests: int, concurrency: int) -> Dict[str, Any]:
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=30) as client:
+        return await run_suite(client, requests, concurrency)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    header = f"{'endpoint':<18}{'count':>7}{'err':>5}{'rps':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+    print(header)
+    rows = list(report["endpoints"].items()) + [(f"  /ask {name}", stats) for name, stats in report["ask_mix"].items()]
+    for name, stats in rows:
+        print(
+            f"{name:<18}{stats['count']:>7}{stats['errors']:>5}{stats['throughput_rps']:>10.1f}"
+            f"{stats['p50_ms']:>9.3f}{stats['p95_ms']:>9.3f}{stats['p99_ms']:>9.3f}{stats['max_ms']:>9.3f}"
+        )
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    runner = _run_against_server if args.server else _run_in_process
+    report = asyncio.run(runner(args.requests, args.concurrency))
+    report["meta"] = {
+        "mode": "uvicorn" if args.server else "asgi",
+        "requests_per_endpoint": args.requests,
+        "concurrency": args.concurrency,
+        "python": platform.python_version(),
+        "git_revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"\nSaved results to {args.output}")
+    # Har mix category (fallback aur ~4 KB "long" bhi) 200 deni chahiye - 4xx/5xx = bug
+    failed = [
+        f"{name} ({stats['errors']} errors)"
+        for name, stats in [*report["endpoints"].items(), *(("/ask " + k, v) for k, v in report["ask_mix"].items())]
+        if stats["errors"]
+    ]
+    if failed:
+        print(f"\nFAIL: requests errored: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """Regressions ki list - latency threshold se zyada badhi ya throughput utni giri."""
+    regressions = []
+    print(f"{'endpoint':<12}{'metric':<16}{'baseline':>11}{'current':>11}{'change':>9}")
+    for endpoint, base in baseline["endpoints"].items():
+        cur = current["endpoints"].get(endpoint)
+        if cur is None:
+            continue
+        for metric, higher_is_worse in (("p50_ms", True), ("p95_ms", True), ("p99_ms", True), ("throughput_rps", False)):
+            old, new = base[metric], cur[metric]
+            change = (new - old) / old if old else 0.0
+            worse = change > threshold if higher_is_worse else change < -threshold
+            flag = "  REGRESSION" if worse else ""
+            print(f"{endpoint:<12}{metric:<16}{old:>11.3f}{new:>11.3f}{change:>+8.1%}{flag}")
+            if worse:
+                regressions.append(f"{endpoint} {metric}: {old} -> {new} ({change:+.1%})")
+        if cur["errors"] > base["errors"]:
+            regressions.append(f"{endpoint} errors: {base['errors']} -> {cur['errors']}")
+    return regressions
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    with open(args.current, encoding="utf-8") as handle:
+        current = json.load(handle)
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%}.")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="NetPath load test and latency benchmark")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    run = subcommands.add_parser("run", help="benchmark chalao aur report do")
+    run.add_argument("--requests", type=int, default=2000, help="requests per endpoint")
+    run.add_argument("--concurrency", type=int, default=32)
+    run.add_argument("--server", action="store_true", help="asli uvicorn server par chalao")
+    run.add_argument("--output", help="results JSON yahan save karo")
+    run.set_defaults(func=cmd_run)
+
+    comp = subcommands.add_parser("compare", help="baseline ke against regressions dhoondho")
+    comp.add_argument("baseline")
+    comp.add_argument("current")
+    comp.add_argument("--threshold", type=float, default=0.10, help="allowed relative change (0.10 = 10%%)")
+    comp.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""Captured query log (logs/requests*.jsonl) ko app par dobara chalata hai.
+
+Default mein log ke original gaps (`ts`) ke saath replay hota hai, `--speed`
+se tez ya dheema; `--speed 0` par sab requests `--concurrency` workers se
+jitni jaldi ho sake. Report loadtest.py wala hi hai (p50/p95/p99 +
+histogram), aur `--check` dene par har answer ka topic log wale topic se
+milaya jata hai - knowledge pack badalne ke baad behaviour drift dikhta hai.
+
+Usage:
+    python benchmarks/replay.py LOG [LOG ...] [--speed 1.0] [--concurrency 32]
+                                   [--limit N] [--url http://host:port] [--check] [--output FILE]
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from loadtest import ROOT, summarize  # noqa: E402
+
+sys.path.insert(0, ROOT)
+
+
+def load_records(patterns: List[str], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Log files (globs bhi) padh kar `ts` order mein records."""
+    paths = sorted({path for pattern in patterns for path in glob.glob(pattern)})
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # adhuri aakhri line (crash ke waqt)
+                if isinstance(record, dict) and isinstance(record.get("question"), str):
+                    records.append(record)
+    records.sort(key=lambda record: record.get("ts", 0))
+    return records[:limit] if limit else records
+
+
+async def replay(
+    client: httpx.AsyncClient, records: List[Dict[str, Any]], speed: float, concurrency: int, check: bool
+) -> Dict[str, Any]:
+    samples: List[float] = []
+    errors = 0
+    mismatches: Dict[str, int] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(record: Dict[str, Any]) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                if check:
+                    # Topic sirf SSE "done" event mein aata hai
+                    response = await client.get("/ask/stream", params={"question": record["question"]})
+                else:
+                    response = await client.post("/ask", json={"question": record["question"]})
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            samples.append((time.perf_counter() - started) * 1000)
+        if not ok:
+            errors += 1
+        elif check and "topic" in record:
+            topic = _response_topic(response)
+            if topic is not None and topic != record["topic"]:
+                key = f"{record['topic']} -> {topic}"
+                mismatches[key] = mismatches.get(key, 0) + 1
+
+    started = time.perf_counter()
+    if speed > 0 and records:
+        # Original inter-arrival gaps, `speed` guna tez
+        first_ts = records[0].get("ts", 0)
+        tasks = []
+        for record in records:
+            delay = (record.get("ts", first_ts) - first_ts) / speed - (time.perf_counter() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(send(record)))
+        await asyncio.gather(*tasks)
+    else:
+        await asyncio.gather(*(send(record) for record in records))
+    elapsed = time.perf_counter() - started
+
+    report = summarize(samples, errors, elapsed)
+    if check:
+        report["topic_mismatches"] = dict(sorted(mismatches.items(), key=lambda item: -item[1]))
+    return report
+
+
+def _response_topic(response: httpx.Response) -> Optional[str]:
+    """POST /ask ke body mein topic nahi hota - SSE "done" event se nikalte hain."""
+    if not response.headers.get("content-type", "").startswith("text/event-stream"):
+        return None
+    for block in response.text.split("\n\n"):
+        if block.startswith("event: done"):
+            return json.loads(block.split("data: ", 1)[1]).get("topic")
+    return None
+
+
+async def _run(args: argparse.Namespace, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if args.url:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+            return await replay(client, records, args.speed, args.concurrency, args.check)
+    # In-process: replay khud log mein na likhe
+    os.environ.setdefault("QUERY_LOG_PATH", "")
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://replay", timeout=30) as client:
+        return await replay(client, records, args.speed, args.concurrency, args.check)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay a captured NetPath query log")
+    parser.add_argument("logs", nargs="+", help="log files ya globs (rotated files bhi)")
+    parser.add_argument("--speed", type=float, default=1.0, help="original pace ka multiple; 0 = jitna tez ho sake")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--limit", type=int, help="sirf pehle N records")
+    parser.add_argument("--url", help="chalte server par replay (default: in-process ASGI)")
+    parser.add_argument("--check", action="store_true", help="answer topics log se milao")
+    parser.add_argument("--output", help="report JSON yahan save karo")
+    args = parser.parse_args()
+
+    records = load_records(args.logs, args.limit)
+    if not records:
+        print("No records found.")
+        return 1
+    report = asyncio.run(_run(args, records))
+    print(f"{len(records)} requests replayed, {report['errors']} errors, {report['throughput_rps']} req/s")
+    print(f"p50 {report['p50_ms']:.3f} ms  p95 {report['p95_ms']:.3f} ms  p99 {report['p99_ms']:.3f} ms  max {report['max_ms']:.3f} ms")
+    if args.check:
+        mismatches = report["topic_mismatches"]
+        print(f"{sum(mismatches.values())} topic mismatches")
+        for change, count in list(mismatches.items())[:20]:
+            print(f"  {count:>5}  {change}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""Poora chat session ek persistent WebSocket par (/ws).
+
+HTTP par har sawal ek naya request hai - headers parse, pydantic validation,
+middleware, response headers. Yahan connection ek baar khulta hai aur uske
+baad har sawal sirf ek chhota JSON text frame hai. Answer ka pre-encoded
+/ask body seedha reply frame mein splice hota hai, dobara encode nahi hota.
+
+Protocol (UTF-8 JSON text frames):
+    server -> {"type":"hello","protocol":1,"max_message_size":4096,"idle_timeout":300}
+    client -> {"id":7,"question":"ospf kya hai","top_k":0,"session_id":"..."}
+    server -> {"type":"answer","id":7,"topic":"ospf","match_type":"keyword","cached":true,
+               "answer":"...","success":true}
+    client -> {"type":"ping","id":8}
+    server -> {"type":"pong","id":8}
+    galat frame par server -> {"type":"error","id":7,"error":"..."} (connection khula rehta hai)
+
+`id` client chunta hai (string ya integer) aur reply mein wahi wapas aata hai.
+`top_k` aur `session_id` (follow-up sawalon ke liye, sessions.py) optional hain.
+
+Backpressure: ek connection ke messages ek-ek karke process hote hain - agla
+frame tabhi padha jata hai jab pichle ka reply bhej diya gaya ho. Flood karne
+wala client isliye apne hi TCP window mein ruk jata hai, server memory nahi
+bharti (frame ka max size uvicorn ke `ws_max_size` se bhi bound hai). Worker
+par `max_connections` bhar jaaye to naya socket 1013 (try again later) se
+band hota hai, aur `idle_timeout` second tak koi frame na aaye to 1001 se.
+"""
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from knowledge import CachedAnswer
+from metrics import REGISTRY, Counter
+from sessions import MAX_SESSION_ID_LENGTH
+
+PROTOCOL_VERSION = 1
+MAX_ID_LENGTH = 64
+
+# RFC 6455 close codes
+CLOSE_GOING_AWAY = 1001
+CLOSE_TRY_AGAIN_LATER = 1013
+
+WS_CONNECTIONS = REGISTRY.register(Counter(
+    "netpath_ws_connections_total", "WebSocket chat connections by outcome.", ("outcome",),
+))
+WS_MESSAGES = REGISTRY.register(Counter(
+    "netpath_ws_messages_total", "WebSocket chat frames handled by kind.", ("kind",),
+))
+
+# (question, top_k, session_id, client IP) -> (answer, cache hit tha ya nahi)
+AnswerFunc = Callable[[str, int, Optional[str], str], Awaitable[Tuple[CachedAnswer, bool]]]
+RequestId = Union[str, int, None]
+
+
+class ChatProtocolError(ValueError):
+    """Client ka frame protocol ke hisaab se galat hai."""
+
+    def __init__(self, message: str, request_id: RequestId = None):
+        super().__init__(message)
+        self.request_id = request_id
+
+
+def parse_message(
+    text: str, max_size: int, max_question_length: int = 1000,
+) -> Tuple[str, RequestId, str, int, Optional[str]]:
+    """Frame -> (kind, id, question, top_k, session_id); galat frame par ChatProtocolError."""
+    if len(text) > max_size:
+        raise ChatProtocolError(f"message larger than {max_size} characters")
+    try:
+        message = json.loads(text)
+    except ValueError:
+        raise ChatProtocolError("message is not valid JSON")
+    if not isinstance(message, dict):
+        raise ChatProtocolError("message must be a JSON object")
+    request_id = message.get("id")
+    if isinstance(request_id, bool) or not isinstance(request_id, (str, int, type(None))):
+        raise ChatProtocolError("id must be a string or integer")
+    if isinstance(request_id, str) and len(request_id) > MAX_ID_LENGTH:
+        raise ChatProtocolError(f"id longer than {MAX_ID_LENGTH} characters")
+    kind = message.get("type", "ask")
+    if kind == "ping":
+        return kind, request_id, "", 0, None
+    if kind != "ask":
+        raise ChatProtocolError(f"unknown message type {kind!r}", request_id)
+    question = message.get("question")
+    if not isinstance(question, str) or not question.strip():
+        raise ChatProtocolError("question must be a non-empty string", request_id)
+    if len(question) > max_question_length:
+        raise ChatProtocolError(f"question longer than {max_question_length} characters", request_id)
+    top_k = message.get("top_k", 0)
+    if isinstance(top_k, bool) or not isinstance(top_k, int) or not 0 <= top_k <= 20:
+        raise ChatProtocolError("top_k must be an integer between 0 and 20", request_id)
+    session_id = message.get("session_id")
+    if session_id is not None and (
+        not isinstance(session_id, str) or not 0 < len(session_id) <= MAX_SESSION_ID_LENGTH
+    ):
+        raise ChatProtocolError(f"session_id must be a string of 1-{MAX_SESSION_ID_LENGTH} characters", request_id)
+    return kind, request_id, question, top_k, session_id
+
+
+def answer_frame(request_id: RequestId, cached: CachedAnswer, hit: bool) -> str:
+    """Reply frame - meta fields aage, phir cached /ask body bina re-encode ke."""
+    head = (
+        f'{{"type":"answer","id":{json.dumps(request_id)},"topic":{json.dumps(cached.topic)},'
+        f'"match_type":"{cached.match_type}","cached":{"true" if hit else "false"},'
+    )
+    return head + cached.body[1:].decode("utf-8")
+
+
+def _frame(payload: Dict[str, Any]) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+class ChatChannel:
+    """/ws connections ka config aur counters; har connection `serve()` mein chalta hai."""
+
+    def __init__(
+        self,
+        answer: AnswerFunc,
+        max_connections: int = 1000,
+        idle_timeout: float = 300.0,
+        max_message_size: int = 4096,
+        max_question_length: int = 1000,
+    ):
+        self.answer = answer
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.max_message_size = max_message_size
+        self.max_question_length = max_question_length
+        self.open = 0
+        self.peak = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.idle_closed = 0
+        self.answers = 0
+        self.errors = 0
+        self._hello = _frame({
+            "type": "hello",
+            "protocol": PROTOCOL_VERSION,
+            "max_message_size": max_message_size,
+            "idle_timeout": idle_timeout,
+        })
+
+    async def serve(self, websocket: WebSocket) -> None:
+        await websocket.accept()
+        if self.open >= self.max_connections:
+            self.rejected += 1
+            WS_CONNECTIONS.inc(("rejected",))
+            await websocket.close(CLOSE_TRY_AGAIN_LATER, "server busy")
+            return
+        self.open += 1
+        self.peak = max(self.peak, self.open)
+        self.accepted += 1
+        WS_CONNECTIONS.inc(("accepted",))
+
+        # Idle watchdog: har frame par sirf timestamp update hota hai; timer
+        # tabhi dobara lagta hai jab woh fire ho, per-message koi naya timer nahi
+        client = websocket.client.host if websocket.client is not None else ""
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        last_seen = loop.time()
+        timed_out = False
+        timer: Optional[asyncio.TimerHandle] = None
+
+        def check_idle() -> None:
+            nonlocal timer, timed_out
+            remaining = last_seen + self.idle_timeout - loop.time()
+            if remaining > 0:
+                timer = loop.call_later(remaining, check_idle)
+            else:
+                timed_out = True
+                task.cancel()
+
+        if self.idle_timeout > 0:
+            timer = loop.call_later(self.idle_timeout, check_idle)
+        try:
+            await websocket.send_text(self._hello)
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                last_seen = loop.time()
+                text = message.get("text")
+                if text is None:
+                    reply = self._error(ChatProtocolError("binary frames are not supported"))
+                else:
+                    reply = await self._handle(text, client)
+                await websocket.send_text(reply)
+        except WebSocketDisconnect:
+            pass
+        except asyncio.CancelledError:
+            if not timed_out:
+                raise
+            if hasattr(task, "uncancel"):
+                task.uncancel()
+            self.idle_closed += 1
+            WS_CONNECTIONS.inc(("idle_closed",))
+            try:
+                await websocket.close(CLOSE_GOING_AWAY, "idle timeout")
+            except (WebSocketDisconnect, RuntimeError):
+                pass
+        finally:
+            if timer is not None:
+                timer.cancel()
+            self.open -= 1
+
+    async def _handle(self, text: str, client: str) -> str:
+        try:
+            kind, request_id, question, top_k, session_id = parse_message(
+                text, self.max_message_size, self.max_question_length
+            )
+        except ChatProtocolError as exc:
+            return self._error(exc)
+        if kind == "ping":
+            WS_MESSAGES.inc(("ping",))
+            return _frame({"type": "pong", "id": request_id})
+        cached, hit = await self.answer(question, top_k, session_id, client)
+        self.answers += 1
+        WS_MESSAGES.inc(("answer",))
+        return answer_frame(request_id, cached, hit)
+
+    def _error(self, exc: ChatProtocolError) -> str:
+        self.errors += 1
+        WS_MESSAGES.inc(("error",))
+        return _frame({"type": "error", "id": exc.request_id, "error": str(exc)})
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "open": self.open,
+            "peak": self.peak,
+            "max_connections": self.max_connections,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "idle_closed": self.idle_closed,
+            "answers": self.answers,
+            "errors": self.errors,
+            "idle_timeout_s": self.idle_timeout,
+        }
@@ -0,0 +1,166 @@
+"""Typo-tolerant topic matching ("subneting", "opsf", "vlna", "tracrt").
+
+Startup par topic keys aur keywords ke har word ka character trigram index
+banta hai. Query time par question ke har unknown word ke trigrams se pehle
+chhoti candidate shortlist nikalti hai, aur bounded edit distance (adjacent
+swap ek edit) sirf usi shortlist par chalta hai - isliye latency vocabulary
+size ke saath nahi badhti.
+"""
+import heapq
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from retrieval import STOPWORDS, tokenize
+
+# Isse chhote words ("tcp", "rip") mein ek typo bhi doosra valid word ban jata hai
+MIN_WORD_LENGTH = 4
+
+# Networking acronyms jo agle word ke saath ek term banate hain ("ap mode",
+# "pe router", "sa lifetime"); pack unhe na jaane to agla word typo nahi hai
+QUALIFIER_ACRONYMS = frozenset({"ap", "pe", "ce", "sa", "ha", "lb", "poe", "wlc"})
+
+
+class Correction(NamedTuple):
+    """Question ka galat word, uska sahi vocabulary word aur chuna gaya topic."""
+
+    original: str
+    term: str
+    topic: str
+    similarity: float
+
+
+def trigrams(word: str) -> List[str]:
+    """Padded trigrams - "  vlan " se shuru/aakhir ke letters ko bhi weight milta hai."""
+    padded = f"  {word} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def bounded_distance(source: str, target: str, limit: int) -> int:
+    """Optimal string alignment distance; `limit` se zyada ho to `limit + 1`.
+
+    Sirf diagonal ke `limit` chaude band ki cells bharti hain, aur kisi row ka
+    minimum limit paar karte hi loop ruk jata hai - isliye shortlist ke door
+    wale candidates par poori matrix nahi banti.
+    """
+    if abs(len(source) - len(target)) > limit:
+        return limit + 1
+    if source == target:
+        return 0
+    width = len(target)
+    over = limit + 1
+    previous_previous: List[int] = []
+    previous = [j if j <= limit else over for j in range(width + 1)]
+    for i in range(1, len(source) + 1):
+        source_char = source[i - 1]
+        low, high = max(1, i - limit), min(width, i + limit)
+        current = [over] * (width + 1)
+        if i <= limit:
+            current[0] = i
+        row_min = current[0]
+        for j in range(low, high + 1):
+            target_char = target[j - 1]
+            value = previous[j - 1] if source_char == target_char else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (
+                i > 1 and j > 1 and value > 1
+                and source_char == target[j - 2] and source[i - 2] == target_char
+                and previous_previous[j - 2] + 1 < value
+            ):
+                value = previous_previous[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return over
+        previous_previous, previous = previous, current
+    return min(previous[width], over)
+
+
+class FuzzyMatcher:
+    """Vocabulary words -> topic, trigram shortlist + bounded edit distance."""
+
+    __slots__ = ("threshold", "max_candidates", "_words", "_topics", "_grams")
+
+    def __init__(
+        self,
+        terms: Iterable[Tuple[str, str]],
+        threshold: float = 0.75,
+        max_candidates: int = 16,
+    ):
+        """`terms` priority order mein (term, topic) - pehle aaya word jeet-ta hai."""
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        word_topics: Dict[str, str] = {}
+        for term, topic in terms:
+            for word in tokenize(term):
+                if len(word) >= MIN_WORD_LENGTH:
+                    word_topics.setdefault(word, topic)
+        self._words: Tuple[str, ...] = tuple(word_topics)
+        self._topics: Tuple[str, ...] = tuple(word_topics.values())
+        # Word length -> trigram -> word_ids; query sirf allowed length band padhti hai
+        self._grams: Dict[int, Dict[str, List[int]]] = {}
+        for word_id, word in enumerate(self._words):
+            postings = self._grams.setdefault(len(word), {})
+            for gram in set(trigrams(word)):
+                postings.setdefault(gram, []).append(word_id)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def _shortlist(self, word: str) -> List[Tuple[int, int]]:
+        """Sabse zyada trigrams share karne wale (word_id, shared), priority order tie-break."""
+        shared: Dict[int, int] = {}
+        get = shared.get
+        grams = set(trigrams(word))
+        slack = 1 - self.threshold
+        for length, postings in self._grams.items():
+            # Itna lamba/chhota word threshold ke andar aa hi nahi sakta
+            if abs(length - len(word)) > slack * max(length, len(word)):
+                continue
+            for gram in grams:
+                for word_id in postings.get(gram, ()):
+                    shared[word_id] = get(word_id, 0) + 1
+        return heapq.nsmallest(self.max_candidates, shared.items(), key=lambda item: (-item[1], item[0]))
+
+    def correct_word(self, word: str) -> Optional[Tuple[str, str, float]]:
+        """Ek word ka best (term, topic, similarity), threshold se upar ho to."""
+        best: Optional[Tuple[str, str, float]] = None
+        grams = len(set(trigrams(word)))
+        for word_id, shared in self._shortlist(word):
+            candidate = self._words[word_id]
+            longest = max(len(word), len(candidate))
+            limit = int((1 - self.threshold) * longest + 1e-9)
+            # q-gram filter: ek edit (ya swap) zyada se zyada 4 trigrams todta hai
+            if shared < grams - 4 * limit:
+                continue
+            distance = bounded_distance(word, candidate, limit)
+            if distance > limit:
+                continue
+            similarity = round(1 - distance / longest, 4)
+            if best is None or similarity > best[2]:
+                best = (candidate, self._topics[word_id], similarity)
+        return best
+
+    def correct(self, question: str, known: Callable[[str], bool] = lambda word: False) -> Optional[Correction]:
+        """Question ke unknown words mein sabse qareebi vocabulary match.
+
+        `known(word)` True ho to word sahi spelling maana jata hai aur skip
+        hota hai (jaise retrieval index mein pehle se maujood words).
+        `QUALIFIER_ACRONYMS` ke baad wala word bhi skip hota hai ("ap mode"
+        ka "mode" -> "model" galat topic deta), jab tak pack acronym na jaane.
+        """
+        best: Optional[Correction] = None
+        tokens = tokenize(question)
+        qualified = {
+            word for previous, word in zip(tokens, tokens[1:])
+            if previous in QUALIFIER_ACRONYMS and not known(previous)
+        }
+        for word in dict.fromkeys(tokens):
+            if len(word) < MIN_WORD_LENGTH or word in STOPWORDS or word in qualified or known(word):
+                continue
+            hit = self.correct_word(word)
+            if hit is not None and (best is None or hit[2] > best.similarity):
+                best = Correction(word, *hit)
+        return best
@@ -0,0 +1,279 @@
+"""Hinglish query normalization - matching se pehle ka stage.
+
+Users Hindi, Hinglish aur English mila kar likhte hain: "subnet kaise karte
+hain", "router kya hota hai", ya seedha Devanagari mein "राउटर क्या है".
+Matching (direct / keyword / fuzzy / BM25) sirf Latin lowercase words samajhta
+hai, isliye har sawal pehle yahan se guzarta hai:
+
+    1. Unicode NFKC (fullwidth, ligatures, decomposed forms ek jaise)
+    2. Devanagari -> Latin transliteration (Hinglish spelling: है -> hai,
+       करते -> karte) aur IAST diacritics hatana (kyā -> kya)
+    3. punctuation hatana
+    4. English stopwords + Hinglish fillers ("kya", "hai", "kaise") hatana
+    5. synonyms ko canonical words mein badalna (suraksha -> security,
+       राउटर -> router); ambiguous words ("pata") sirf networking noun ke
+       baad ("ip ka pata"), warna "mujhe pata nahi" bhi address ban jata
+
+Saari tables (translate tables, schwa classes, word table) object banate
+waqt ek baar compile hoti hain; har /ask par sirf `str.translate` aur ek
+dict lookup per word chalta hai. ASCII sawal (zyada traffic) step 1-2 skip
+karte hain. Synonym sources bhi isi transliteration se compile hote hain,
+isliye Devanagari source wahi Latin form deta hai jo sawal ka deta.
+"""
+import re
+import unicodedata
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Tuple
+
+# "/" rakha jata hai kyunki "tcp/ip" jaise topic keys mein hai
+_PUNCTUATION_RE = re.compile(r"[^\w\s/]+")
+_DEVANAGARI_RE = re.compile("[\u0900-\u097f]")
+
+# Transliteration ke beech ke markers (private use, input mein nahi aate)
+_INHERENT = "\ue000"  # consonant ka inherent "a" (schwa)
+_KILL = "\ue001"  # matra / virama - pichle consonant ka schwa hatata hai
+_NUKTA = "\u093c"
+_VIRAMA = "\u094d"
+
+CONSONANTS = {
+    "क": "k", "ख": "kh", "ग": "g", "घ": "gh", "ङ": "n",
+    "च": "ch", "छ": "chh", "ज": "j", "झ": "jh", "ञ": "n",
+    "ट": "t", "ठ": "th", "ड": "d", "ढ": "dh", "ण": "n",
+    "त": "t", "थ": "th", "द": "d", "ध": "dh", "न": "n",
+    "प": "p", "फ": "ph", "ब": "b", "भ": "bh", "म": "m",
+    "य": "y", "र": "r", "ल": "l", "ळ": "l", "व": "v",
+    "श": "sh", "ष": "sh", "स": "s", "ह": "h",
+    # Nukta wale consonants (NFKC inhe consonant + nukta mein tod deta hai)
+    "\ue010": "q", "\ue011": "kh", "\ue012": "g", "\ue013": "z",
+    "\ue014": "r", "\ue015": "rh", "\ue016": "f", "\ue017": "y",
+}
+_NUKTA_FORMS = {
+    "क" + _NUKTA: "\ue010", "ख" + _NUKTA: "\ue011", "ग" + _NUKTA: "\ue012", "ज" + _NUKTA: "\ue013",
+    "ड" + _NUKTA: "\ue014", "ढ" + _NUKTA: "\ue015", "फ" + _NUKTA: "\ue016", "य" + _NUKTA: "\ue017",
+}
+# Hinglish spelling mein lambi/chhoti vowel ka farak nahi likha jata (का -> ka)
+VOWEL_SIGNS = {
+    "ा": "a", "ि": "i", "ी": "i", "ु": "u", "ू": "u", "ृ": "ri",
+    "ॅ": "e", "े": "e", "ै": "ai", "ॉ": "o", "ो": "o", "ौ": "au",
+}
+VOWELS = {
+    "अ": "a", "आ": "a", "इ": "i", "ई": "i", "उ": "u", "ऊ": "u", "ऋ": "ri",
+    "ऍ": "e", "ए": "e", "ऐ": "ai", "ऑ": "o", "ओ": "o", "औ": "au",
+}
+SIGNS = {
+    "ं": "n", "ँ": "n", "ः": "h", "ऽ": "", "।": " ", "॥": " ",
+    **{chr(0x0966 + digit): str(digit) for digit in range(10)},
+}
+# Translate se pehle ke multi-character forms (में -> mein, हैं -> hain)
+_CLUSTERS = {"\u0947\u0902": "ein"}
+# IAST / romanized Hindi ke diacritics (NFKC ke baad composed form mein)
+IAST = {
+    "ā": "a", "ī": "i", "ū": "u", "ṛ": "ri", "ṝ": "ri", "ḷ": "l", "ē": "e", "ō": "o",
+    "ṃ": "n", "ṁ": "n", "ḥ": "h", "ṅ": "n", "ñ": "n", "ṭ": "t", "ḍ": "d", "ṇ": "n",
+    "ś": "sh", "ṣ": "sh",
+}
+
+ENGLISH_STOPWORDS = frozenset({"a", "an", "the", "please", "pls", "plz", "kindly"})
+
+# Sawal ka dhancha banane wale words, topic nahi batate. sessions.REFERENCE_WORDS
+# (iska, uska, ye, woh...) jaan-boojh kar bahar hain - follow-up unhi se pehchana jata hai.
+# English/networking se takraane wale roop (ap = access point, me, pe = provider
+# edge, sa) bhi bahar hain - Hinglish sawal mein woh bache rahein to nuksaan nahi.
+HINGLISH_FILLERS = frozenset(
+    """
+    kya kyaa hai hain hei ho hota hoti hote hua hui kaise kaisa kaisi kese kaese
+    kar karte karta karti karna karne karein karen kare kiya kiye
+    ka ki ke ko se mein mai par bhi aur ya toh
+    batao bataiye bataye bata btao batana samjhao samjhaiye samjha samjhana
+    kripya krpya zara jara yaar yar bhai ji na matlab
+    kaun kaunsa kaunsi kis kisko kab kahan kyu kyun kyon liye lie
+    wala wali wale mujhe muje hame hamein humein aap tum tu mera meri kuch koi ek
+    """.split()
+)
+
+# Canonical word -> uske Hinglish / Devanagari roop. Canonical wahi English
+# words hain jo knowledge pack ke topics / keywords mein hain.
+SYNONYMS: Dict[str, tuple] = {
+    "network": ("jaal", "netvark", "नेटवर्क", "जाल"),
+    "router": ("rautar", "राउटर"),
+    "switch": ("svich", "स्विच"),
+    "firewall": ("फ़ायरवॉल", "फायरवॉल"),
+    "subnet": ("sabnet", "सबनेट"),
+    "subnetting": ("सबनेटिंग",),
+    "protocol": ("protokol", "प्रोटोकॉल"),
+    "internet": ("इंटरनेट",),
+    "ip": ("आईपी",),
+    # Devanagari mein likhe acronyms (डीएनएस -> "dienaes")
+    "dns": ("डीएनएस",),
+    "dhcp": ("डीएचसीपी",),
+    "tcp": ("टीसीपी",),
+    "udp": ("यूडीपी",),
+    "osi": ("ओएसआई",),
+    "ospf": ("ओएसपीएफ",),
+    "bgp": ("बीजीपी",),
+    "vlan": ("वीलैन", "वीलेन"),
+    "vpn": ("वीपीएन",),
+    "http": ("एचटीटीपी",),
+    "https": ("एचटीटीपीएस",),
+    "acl": ("एसीएल",),
+    "lan": ("लैन",),
+    "wan": ("वैन",),
+    "address": ("adres", "एड्रेस"),
+    "security": ("suraksha", "सुरक्षा"),
+    "problem": ("samasya", "dikkat", "pareshani", "gadbad", "kharabi", "समस्या", "दिक्कत", "परेशानी", "गड़बड़"),
+    "difference": ("antar", "fark", "farak", "farq", "अंतर", "फ़र्क", "फर्क"),
+    "types": ("prakar", "kism", "kisam", "प्रकार", "किस्म"),
+    "ping": ("पिंग",),
+    "use": ("upyog", "upayog", "istemal", "उपयोग", "इस्तेमाल"),
+    "help": ("madad", "sahayata", "मदद", "सहायता"),
+    "hello": ("namaste", "namaskar", "नमस्ते", "नमस्कार"),
+    "thanks": ("dhanyavad", "dhanyawad", "shukriya", "धन्यवाद", "शुक्रिया"),
+    "bye": ("alvida", "अलविदा"),
+}
+
+# Canonical -> (Hinglish roop, woh words jinke theek baad hi badalna hai).
+# Filler hatne ke baad pichla word dekha jata hai: "ip ka pata" -> "ip address".
+CONTEXT_SYNONYMS: Dict[str, tuple] = {
+    "address": (("pata", "पता"), ("ip", "mac", "email", "web", "website", "server", "gateway", "router")),
+}
+
+
+def _translate_table(mapping: Mapping[str, str]) -> Dict[int, Any]:
+    return {ord(char): (value or None) for char, value in mapping.items()}
+
+
+class HinglishNormalizer:
+    """Compiled normalization tables; `normalize()` har sawal par chalta hai."""
+
+    __slots__ = (
+        "transliterate_enabled", "_mark", "_latin", "_consonants", "_vowels", "_letters",
+        "_words", "_after", "fillers", "synonyms", "transliterated",
+    )
+
+    def __init__(
+        self,
+        stopwords: Iterable[str] = ENGLISH_STOPWORDS,
+        fillers: Iterable[str] = HINGLISH_FILLERS,
+        synonyms: Mapping[str, Iterable[str]] = SYNONYMS,
+        transliterate: bool = True,
+        context_synonyms: Mapping[str, tuple] = CONTEXT_SYNONYMS,
+    ):
+        self.transliterate_enabled = transliterate
+        self.transliterated = 0
+        # Pass 1: consonant ke baad schwa marker, matra/virama se pehle kill marker
+        self._mark = _translate_table({
+            **{char: char + _INHERENT for char in CONSONANTS},
+            **{char: _KILL + char for char in VOWEL_SIGNS},
+            _VIRAMA: _KILL,
+        })
+        # Pass 2: bache hue schwa -> "a", baaki sab Latin
+        self._latin = _translate_table({
+            **CONSONANTS, **VOWEL_SIGNS, **VOWELS, **SIGNS, **IAST,
+            _INHERENT: "a", _KILL: "", _NUKTA: "", "\u200c": "", "\u200d": "",
+        })
+        self._consonants = frozenset(CONSONANTS)
+        self._vowels = frozenset((*VOWEL_SIGNS, *VOWELS, _INHERENT))
+        # Anusvara/chandrabindu/visarga word ka hissa hain, word end nahi
+        self._letters = self._consonants | self._vowels | frozenset("\u0901\u0902\u0903")
+
+        # Ek hi word table: filler/stopword -> "" (drop), synonym -> canonical
+        words: Dict[str, str] = {word: "" for word in (*stopwords, *fillers)}
+        self.fillers = len(words)
+        for canonical, sources in synonyms.items():
+            for source in sources:
+                key = self._table_key(source)
+                if words.get(key, canonical) != canonical:
+                    raise ValueError(f"Hinglish synonym {source!r} ({key!r}) clashes with another table entry")
+                words[key] = canonical
+        self._words = words
+        # Context wale roop word table mein nahi - unka pehla pass mein kuch nahi badalta
+        after: Dict[str, Tuple[str, FrozenSet[str]]] = {}
+        for canonical, (sources, previous) in context_synonyms.items():
+            for source in sources:
+                key = self._table_key(source)
+                if key in words or after.get(key, (canonical,))[0] != canonical:
+                    raise ValueError(f"Hinglish synonym {source!r} ({key!r}) clashes with another table entry")
+                after[key] = (canonical, frozenset(previous))
+        self._after = after
+        self.synonyms = len(words) - self.fillers + len(after)
+
+    def _table_key(self, source: str) -> str:
+        """Synonym source ka table key - sawal wala hi fold, par `transliterated` mein nahi gina jata."""
+        if not self.transliterate_enabled:
+            return source.lower()
+        counted = self.transliterated
+        key = self.fold(source)
+        self.transliterated = counted
+        return key
+
+    def fold(self, text: str) -> str:
+        """Non-ASCII text -> NFKC, lowercase, Latin script."""
+        text = unicodedata.normalize("NFKC", text).lower()
+        if _DEVANAGARI_RE.search(text) is not None:
+            self.transliterated += 1
+            text = self.transliterate(text)
+        elif not text.isascii():
+            text = text.translate(self._latin)
+        return text
+
+    def transliterate(self, text: str) -> str:
+        """Devanagari -> Hinglish Latin (schwa deletion ke saath: करते -> karte)."""
+        if _NUKTA in text:
+            for form, letter in _NUKTA_FORMS.items():
+                text = text.replace(form, letter)
+        text = text.translate(self._mark).replace(_INHERENT + _KILL, "")
+        text = " ".join(self._drop_schwa(word) if _INHERENT in word else word for word in text.split())
+        for cluster, latin in _CLUSTERS.items():
+            text = text.replace(cluster, latin)
+        return text.translate(self._latin)
+
+    def _drop_schwa(self, word: str) -> str:
+        """Hindi schwa deletion, right se left: word ke end par, aur V C _ C V mein."""
+        chars: List[str] = list(word)
+        consonants, vowels, letters = self._consonants, self._vowels, self._letters
+        for index in range(len(chars) - 1, 0, -1):
+            if chars[index] != _INHERENT:
+                continue
+            after = chars[index + 1] if index + 1 < len(chars) else ""
+            if after not in letters:
+                # Word ka aakhri schwa - bas tab jab pehle koi vowel ho (क्या -> kya)
+                if any(char in vowels for char in chars[:index - 1]):
+                    del chars[index]
+            elif (
+                index >= 2
+                and chars[index - 1] in consonants
+                and chars[index - 2] in vowels
+                and after in consonants
+                and index + 2 < len(chars)
+                and chars[index + 2] in vowels
+            ):
+                del chars[index]
+        return "".join(chars)
+
+    def normalize(self, question: str) -> str:
+        """Normalized sawal; sirf fillers hon ("kya hai") to words waise hi rehte hain."""
+        if question.isascii() or not self.transliterate_enabled:
+            text = question.lower()
+        else:
+            text = self.fold(question)
+        words = _PUNCTUATION_RE.sub(" ", text).split()
+        kept = [word for word in map(self._words.get, words, words) if word]
+        if self._after and not self._after.keys().isdisjoint(kept):
+            kept = self._in_context(kept)
+        return " ".join(kept) or " ".join(words)
+
+    def _in_context(self, words: List[str]) -> List[str]:
+        after = self._after
+        result = list(words)
+        for index in range(1, len(words)):
+            rule = after.get(words[index])
+            if rule is not None and words[index - 1] in rule[1]:
+                result[index] = rule[0]
+        return result
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "transliteration": self.transliterate_enabled,
+            "stopwords": self.fillers,
+            "synonyms": self.synonyms,
+            "transliterated": self.transliterated,
+        }
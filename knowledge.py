@@ -0,0 +1,402 @@
+"""External knowledge pack aur uske immutable snapshots.
+
+Knowledge base ab `main.py` mein literal dict nahi hai - ek pack directory
+(`knowledge/` by default) ki JSON/JSONL files se load hota hai:
+
+* ``*.json``  - ``{"entries": {topic: answer}, "keywords": {keyword: topic}}``
+* ``*.jsonl`` - har line ``{"topic": ..., "answer": ..., "keywords": [...]}``
+
+Files filename order mein padhi jaati hain; keyword priority wahi order hai.
+Load hone par sab kuch ek KnowledgeSnapshot mein compile hota hai (entries,
+keyword matcher, fuzzy trigram index, BM25 index, answer cache). File badalne
+par naya snapshot background thread mein banta hai aur ek hi assignment se
+swap hota hai, isliye chal rahe requests ko kabhi adha bana state nahi dikhta.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from answer_cache import AnswerCache, normalize_question
+from fuzzy import Correction, FuzzyMatcher
+from matcher import KeywordMatcher
+from retrieval import TopicIndex
+
+logger = logging.getLogger("netpath.knowledge")
+
+PACK_SUFFIXES = (".json", ".jsonl")
+FALLBACK_TOPIC = "help"
+MIN_RETRIEVAL_SCORE = 2.0
+# Itne alag query terms top topic se match hon (ya ek term uski key ka ho)
+MIN_RETRIEVAL_TERMS = 2
+DEFAULT_FUZZY_THRESHOLD = 0.75
+
+# find_best_answer ne answer kaise dhoonda
+MATCH_DIRECT = "direct"
+MATCH_KEYWORD = "keyword"
+MATCH_FUZZY = "fuzzy"
+MATCH_RETRIEVAL = "retrieval"
+MATCH_FALLBACK = "fallback"
+MATCH_TYPES = (MATCH_DIRECT, MATCH_KEYWORD, MATCH_FUZZY, MATCH_RETRIEVAL, MATCH_FALLBACK)
+
+
+class KnowledgePackError(ValueError):
+    """Pack file ka format galat hai."""
+
+
+def _pack_files(directory: str) -> List[str]:
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.endswith(PACK_SUFFIXES) and not name.startswith(".")
+    )
+
+
+def pack_fingerprint(directory: str) -> Tuple[Tuple[str, int, int], ...]:
+    """Pack files ke (naam, mtime, size) - change detection ke liye sasta check."""
+    fingerprint = []
+    for path in _pack_files(directory):
+        stat = os.stat(path)
+        fingerprint.append((os.path.basename(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
+def pack_digest(directory: str) -> str:
+    """Pack files ke naam + content ka hash - precompiled snapshot (artifacts.py) validate karne ke liye."""
+    digest = hashlib.sha256()
+    for path in _pack_files(directory):
+        digest.update(os.path.basename(path).encode("utf-8") + b"\0")
+        with open(path, "rb") as handle:
+            digest.update(handle.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _load_json_pack(path: str, entries: Dict[str, str], keywords: Dict[str, str]) -> None:
+    with open(path, encoding="utf-8") as handle:
+        data = json.load(handle)
+    if not isinstance(data, dict):
+        raise KnowledgePackError(f"{path}: expected an object with 'entries'/'keywords'")
+    for topic, answer in data.get("entries", {}).items():
+        if not isinstance(answer, str):
+            raise KnowledgePackError(f"{path}: answer for {topic!r} must be a string")
+        entries[topic] = answer
+    for keyword, topic in data.get("keywords", {}).items():
+        keywords.setdefault(keyword, topic)
+
+
+def _load_jsonl_pack(path: str, entries: Dict[str, str], keywords: Dict[str, str]) -> None:
+    with open(path, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                topic, answer = record["topic"], record["answer"]
+            except (ValueError, KeyError, TypeError) as exc:
+                raise KnowledgePackError(f"{path}:{line_number}: {exc}") from exc
+            entries[topic] = answer
+            for keyword in record.get("keywords", ()):
+                keywords.setdefault(keyword, topic)
+
+
+def load_pack(directory: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Pack directory se (entries, keywords) padhta aur validate karta hai."""
+    entries: Dict[str, str] = {}
+    keywords: Dict[str, str] = {}
+    for path in _pack_files(directory):
+        if path.endswith(".jsonl"):
+            _load_jsonl_pack(path, entries, keywords)
+        else:
+            _load_json_pack(path, entries, keywords)
+
+    if FALLBACK_TOPIC not in entries:
+        raise KnowledgePackError(f"{directory}: knowledge pack must define a {FALLBACK_TOPIC!r} entry")
+    unknown = sorted({topic for topic in keywords.values() if topic not in entries})
+    if unknown:
+        raise KnowledgePackError(f"{directory}: keywords point to unknown topics: {', '.join(unknown)}")
+    return entries, keywords
+
+
+def encode_answer(
+    answer: str,
+    topics: Optional[List[Tuple[str, float]]] = None,
+    correction: Optional[Correction] = None,
+) -> bytes:
+    """AnswerResponse ko seedha JSON bytes mein (FastAPI ke JSONResponse jaisa format)."""
+    payload: Dict[str, Any] = {"answer": answer, "success": True}
+    if topics is not None:
+        payload["topics"] = [{"topic": topic, "score": score} for topic, score in topics]
+    if correction is not None:
+        payload["correction"] = correction._asdict()
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class Resolution(NamedTuple):
+    """resolve() ka result - fuzzy match par spelling correction bhi."""
+
+    topic: str
+    match_type: str
+    correction: Optional[Correction] = None
+
+
+class CachedAnswer(NamedTuple):
+    """Answer cache ki value - encoded body aur metrics ke liye labels."""
+
+    body: bytes
+    topic: str
+    match_type: str
+    correction: Optional[Correction] = None
+
+
+class KnowledgeSnapshot:
+    """Ek knowledge pack ka compiled, read-only roop."""
+
+    __slots__ = (
+        "version", "content_hash", "entries", "keywords", "direct_topics",
+        "matcher", "fuzzy", "index", "cache", "built_at", "build_seconds", "_topic_answers",
+    )
+
+    def __init__(
+        self,
+        entries: Dict[str, str],
+        keywords: Dict[str, str],
+        version: int = 1,
+        cache_size: int = 4096,
+        cache_ttl: float = 600.0,
+        fuzzy_threshold: float = DEFAULT_FUZZY_THRESHOLD,
+    ):
+        started = time.perf_counter()
+        self.version = version
+        self.content_hash = hashlib.sha256(
+            json.dumps([entries, list(keywords.items())], ensure_ascii=False).encode("utf-8")
+        ).hexdigest()[:12]
+        self.entries: Mapping[str, str] = MappingProxyType(dict(entries))
+        self.keywords: Mapping[str, str] = MappingProxyType(dict(keywords))
+        # Direct match normalized topic keys par hota hai ("Hello!" -> "hello")
+        self.direct_topics: Mapping[str, str] = MappingProxyType(
+            {normalize_question(topic): topic for topic in entries}
+        )
+        # Keyword bhi sawal wali normalization se ("kya hai" jaise fillers sawal
+        # mein bachte hi nahi); collision par pehla keyword (priority) jeetta hai
+        matcher_keywords: Dict[str, str] = {}
+        for keyword, topic in self.keywords.items():
+            matcher_keywords.setdefault(normalize_question(keyword), topic)
+        self.matcher = KeywordMatcher(matcher_keywords)
+        self.index = TopicIndex(self.entries)
+        # Keywords pehle (unka order hi priority hai), phir topic keys
+        self.fuzzy = FuzzyMatcher(
+            [*self.keywords.items(), *((topic, topic) for topic in self.entries)],
+            threshold=fuzzy_threshold,
+        )
+        self.cache = AnswerCache(max_entries=cache_size, ttl_seconds=cache_ttl)
+        # (topic, top_k, match_type) -> encoded answer; topics ki ginti se bounded
+        self._topic_answers: Dict[Tuple[str, int, str], CachedAnswer] = {}
+        self.built_at = time.time()
+        self.build_seconds = time.perf_counter() - started
+
+    def resolve(self, question: str) -> Resolution:
+        """Question ka (topic, match_type, correction) - match_type MATCH_TYPES mein se ek."""
+        # Matching normalized form par hi hota hai, taaki cache key se answer tay rahe
+        question_lower = normalize_question(question)
+
+        # Direct match
+        topic = self.direct_topics.get(question_lower)
+        if topic is not None:
+            return Resolution(topic, MATCH_DIRECT)
+
+        # Smart keyword matching
+        topic = self.matcher.match(question_lower)
+        if topic is not None:
+            return Resolution(topic, MATCH_KEYWORD)
+
+        # Typo correction - sirf woh words jo retrieval index bhi nahi jaanta
+        correction = self.fuzzy.correct(question_lower, known=self.index.__contains__)
+        if correction is not None:
+            return Resolution(correction.topic, MATCH_FUZZY, correction)
+
+        # Ranked retrieval over keys + answer bodies
+        ranked = self.index.confident(question_lower, MIN_RETRIEVAL_SCORE, MIN_RETRIEVAL_TERMS)
+        if ranked is not None:
+            return Resolution(ranked[0], MATCH_RETRIEVAL)
+
+        return Resolution(FALLBACK_TOPIC, MATCH_FALLBACK)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Sirf compiled tables; answer cache (lock ke saath) runtime state hai
+        return {
+            "version": self.version,
+            "content_hash": self.content_hash,
+            "entries": dict(self.entries),
+            "keywords": dict(self.keywords),
+            "direct_topics": dict(self.direct_topics),
+            "matcher": self.matcher,
+            "fuzzy": self.fuzzy,
+            "index": self.index,
+            "cache_size": self.cache.max_entries,
+            "cache_ttl": self.cache.ttl_seconds,
+            "built_at": self.built_at,
+            "build_seconds": self.build_seconds,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.version = state["version"]
+        self.content_hash = state["content_hash"]
+        self.entries = MappingProxyType(state["entries"])
+        self.keywords = MappingProxyType(state["keywords"])
+        self.direct_topics = MappingProxyType(state["direct_topics"])
+        self.matcher = state["matcher"]
+        self.fuzzy = state["fuzzy"]
+        self.index = state["index"]
+        self.cache = AnswerCache(max_entries=state["cache_size"], ttl_seconds=state["cache_ttl"])
+        self._topic_answers = {}
+        self.built_at = state["built_at"]
+        self.build_seconds = state["build_seconds"]
+
+    def quick_topic(self, question_lower: str) -> Optional[str]:
+        """Sirf direct + keyword match (sasta) - fuzzy/BM25 nahi chalta."""
+        topic = self.direct_topics.get(question_lower)
+        return topic if topic is not None else self.matcher.match(question_lower)
+
+    def topic_answer(self, topic: str, top_k: int = 0, match_type: str = MATCH_DIRECT) -> Tuple[CachedAnswer, bool]:
+        """Pehle se tay topic ka encoded answer (matching skip) aur cache hit tha ya nahi."""
+        key = (topic, top_k, match_type)
+        cached = self._topic_answers.get(key)
+        if cached is not None:
+            return cached, True
+        topics = self.rank_topics(normalize_question(topic), top_k) if top_k else None
+        cached = CachedAnswer(encode_answer(self.entries[topic], topics), topic, match_type)
+        self._topic_answers[key] = cached
+        return cached, False
+
+    def find_best_answer(self, question: str) -> str:
+        return self.entries[self.resolve(question)[0]]
+
+    def rank_topics(self, question: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        return self.index.search(question, top_k)
+
+    def answer(
+        self, question: str, top_k: int = 0, observe: Optional[Callable[[str, float], None]] = None
+    ) -> Tuple[CachedAnswer, bool]:
+        """Encoded /ask response aur cache hit tha ya nahi.
+
+        Cache hit par matching aur serialization dono skip hote hain. `observe`
+        miss par "match" aur "serialize" stages ka time (seconds) paata hai.
+        """
+        cache_key = (normalize_question(question), top_k)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached, True
+        cached = self._encode(cache_key, observe)
+        self.cache.put(cache_key, cached)
+        return cached, False
+
+    def _encode(
+        self, cache_key: Tuple[str, int], observe: Optional[Callable[[str, float], None]] = None
+    ) -> CachedAnswer:
+        question, top_k = cache_key
+        started = time.perf_counter()
+        topic, match_type, correction = self.resolve(question)
+        topics = self.rank_topics(question, top_k) if top_k else None
+        matched = time.perf_counter()
+        body = encode_answer(self.entries[topic], topics, correction)
+        if observe is not None:
+            observe("match", matched - started)
+            observe("serialize", time.perf_counter() - matched)
+        return CachedAnswer(body, topic, match_type, correction)
+
+    def warm(self, cache_keys: Iterable[Hashable]) -> None:
+        """Purane snapshot ke hot questions pehle se encode kar leta hai."""
+        for cache_key in cache_keys:
+            self.cache.put(cache_key, self._encode(cache_key))
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "content_hash": self.content_hash,
+            "entries": len(self.entries),
+            "keywords": len(self.keywords),
+            "fuzzy_vocabulary": len(self.fuzzy),
+            "fuzzy_threshold": self.fuzzy.threshold,
+            "built_at": round(self.built_at, 3),
+            "build_ms": round(self.build_seconds * 1000, 2),
+        }
+
+
+class KnowledgeStore:
+    """Current snapshot rakhta hai aur pack badalne par use atomically badalta hai."""
+
+    def __init__(
+        self,
+        directory: str,
+        cache_size: int = 4096,
+        cache_ttl: float = 600.0,
+        warm_keys: int = 256,
+        fuzzy_threshold: float = DEFAULT_FUZZY_THRESHOLD,
+        snapshot: Optional[KnowledgeSnapshot] = None,
+    ):
+        self.directory = directory
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.fuzzy_threshold = fuzzy_threshold
+        self.warm_keys = warm_keys
+        self.reloads = 0
+        self.reload_errors = 0
+        self._reload_lock = threading.Lock()
+        self._fingerprint = pack_fingerprint(directory)
+        # Precompiled snapshot (artifacts.py) mila ho to rebuild nahi
+        self._current = snapshot if snapshot is not None else self._build(version=1)
+
+    @property
+    def current(self) -> KnowledgeSnapshot:
+        return self._current
+
+    def _build(self, version: int) -> KnowledgeSnapshot:
+        entries, keywords = load_pack(self.directory)
+        return KnowledgeSnapshot(
+            entries, keywords, version=version, cache_size=self.cache_size, cache_ttl=self.cache_ttl,
+            fuzzy_threshold=self.fuzzy_threshold,
+        )
+
+    def reload_if_changed(self) -> bool:
+        """Pack badla ho to naya snapshot bana kar swap karta hai (thread mein chalta hai)."""
+        with self._reload_lock:
+            fingerprint = pack_fingerprint(self.directory)
+            if fingerprint == self._fingerprint:
+                return False
+            # Galat file par bhi fingerprint update - agli edit tak dobara try nahi
+            self._fingerprint = fingerprint
+            previous = self._current
+            try:
+                snapshot = self._build(version=previous.version + 1)
+                snapshot.warm(previous.cache.recent_keys(self.warm_keys))
+            except (OSError, KnowledgePackError, ValueError) as exc:
+                self.reload_errors += 1
+                logger.warning("Knowledge reload failed, keeping version %s: %s", previous.version, exc)
+                return False
+            self._current = snapshot
+            self.reloads += 1
+            logger.info(
+                "Knowledge snapshot v%s loaded (%s entries, %.1f ms)",
+                snapshot.version, len(snapshot.entries), snapshot.build_seconds * 1000,
+            )
+            return True
+
+    async def watch(self, interval: float) -> None:
+        """Har `interval` second pack check karta hai; rebuild event loop ke bahar hota hai."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.reload_if_changed)
+            except Exception:
+                logger.exception("Knowledge watcher error")
+
+    def describe(self) -> Dict[str, Any]:
+        info = self._current.describe()
+        info.update(reloads=self.reloads, reload_errors=self.reload_errors)
+        return info
@@ -0,0 +1,396 @@
+"""Pluggable fallback answers jab knowledge base mein koi match na mile.
+
+Sirf `fallback` match wale sawal yahan aate hain - knowledge base se mile
+answers kabhi iska intezaar nahi karte. Default backend ek OpenAI-compatible
+`/chat/completions` endpoint hai, aur har guard iske saamne hai:
+
+* ek shared, pooled `httpx.AsyncClient` (lifespan mein khulta/band hota hai)
+* har call par strict deadline (`timeout`), connect/pool timeouts alag se
+* concurrency limit - limit bhari ho to intezaar nahi, seedha canned answer
+* circuit breaker - lagataar failures par kuch der backend ko chhoda jata hai
+* repeated misses ke liye LRU + TTL response cache
+* prompt `max_prompt_length` characters par truncate (paid endpoint par lamba text nahi)
+
+Har call ek `LiveAnswer` hai: backend se tokens aate hi uske deltas padhe
+ja sakte hain (`/ask/stream` unhe seedha SSE chunks mein bhejta hai), aur
+same normalized sawal ke concurrent callers wahi LiveAnswer share karte hain.
+`answer()` bas uske complete hone ka intezaar karta hai. Koi bhi guard mana
+kare ya call fail ho to `answer()` None deta hai aur caller wahi purana
+`help` answer bhejta hai.
+
+Environment:
+    LLM_FALLBACK_URL          base URL, e.g. http://127.0.0.1:8001/v1 (khali = band)
+    LLM_FALLBACK_BACKEND      "openai" (default) ya "module:factory" apna backend
+    LLM_FALLBACK_MODEL        model naam (default gpt-4o-mini)
+    LLM_FALLBACK_API_KEY      Bearer token (optional)
+    LLM_FALLBACK_TIMEOUT      per-call deadline seconds (default 3)
+    LLM_FALLBACK_CONCURRENCY  max in-flight calls (default 8)
+    LLM_FALLBACK_MAX_PROMPT   sawal itne characters par truncate (default 1000)
+"""
+import abc
+import asyncio
+import importlib
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Mapping, Optional, Set, Union
+
+from admission import SingleFlight
+from answer_cache import AnswerCache, normalize_question
+from metrics import REGISTRY, Counter, Histogram
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger("netpath.llm_fallback")
+
+# /ask metrics aur query log mein LLM se aaye answers ka match_type
+MATCH_LLM = "llm"
+
+SYSTEM_PROMPT = (
+    "You are NetPath Network AI, a networking tutor for students. Answer networking "
+    "questions briefly and accurately. Students may write in Hinglish; reply in the same "
+    "style. If the question is not about networking, say so politely."
+)
+
+LLM_CALLS = REGISTRY.register(Counter(
+    "netpath_llm_fallback_calls_total", "LLM fallback attempts by outcome.", ("outcome",),
+))
+LLM_LATENCY = REGISTRY.register(Histogram(
+    "netpath_llm_fallback_duration_seconds", "Latency of LLM fallback HTTP calls.",
+))
+
+# stream()/answer() ke outcomes (counter labels + describe() keys)
+OUTCOMES = ("success", "cache_hit", "coalesced", "error", "timeout", "rejected", "short_circuited")
+
+
+class CircuitBreaker:
+    """closed -> (failure_threshold lagataar failures) -> open -> (reset_timeout) -> half-open.
+
+    Half-open mein ek hi trial call jaati hai; safal ho to closed, warna phir open.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                self.trips += 1
+            self.opened_at = time.monotonic()
+
+
+class LiveAnswer:
+    """Ek in-flight LLM answer - deltas aate hi readers ko milte hain, kai readers ek saath."""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        # Complete hone par poora text; fail ho to None
+        self.text: Optional[str] = None
+        self.done = False
+        self._changed = asyncio.Event()
+
+    def _wake(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def feed(self, delta: str) -> None:
+        self.parts.append(delta)
+        self._wake()
+
+    def finish(self, text: Optional[str]) -> None:
+        self.text = text
+        self.done = True
+        self._wake()
+
+    async def deltas(self) -> AsyncIterator[str]:
+        """Ab tak ke deltas, phir naye jaise aayein (baad mein judne wala reader bhi sab paata hai)."""
+        index = 0
+        while True:
+            changed = self._changed
+            while index < len(self.parts):
+                yield self.parts[index]
+                index += 1
+            if self.done:
+                return
+            await changed.wait()
+
+    async def result(self) -> Optional[str]:
+        while not self.done:
+            await self._changed.wait()
+        return self.text
+
+
+class FallbackBackend(abc.ABC):
+    """Fallback backends ka interface - guards (cache, limit, breaker) yahin hain.
+
+    Subclass sirf `_complete_stream(question)` likhti hai: answer ke text
+    deltas yield kare (poora answer ek hi delta bhi chalega) ya exception
+    raise kare.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 3.0,
+        max_concurrency: int = 8,
+        cache_size: int = 1024,
+        cache_ttl: float = 3600.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_prompt_length: int = 1000,
+        flights: Optional[SingleFlight] = None,
+    ):
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_prompt_length = max_prompt_length
+        self.cache = AnswerCache(max_entries=cache_size, ttl_seconds=cache_ttl)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.in_flight = 0
+        self.outcomes: Dict[str, int] = dict.fromkeys(OUTCOMES, 0)
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        # Same normalized sawal ke concurrent misses ek hi LiveAnswer share karte hain
+        self.flights = flights if flights is not None else SingleFlight()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def start(self) -> None:
+        """Lifespan startup - connections waghera yahan khulte hain."""
+
+    async def close(self) -> None:
+        """Lifespan shutdown - chal rahi calls cancel."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    @abc.abstractmethod
+    def _complete_stream(self, question: str) -> AsyncIterator[str]:
+        """Answer ke text deltas (async generator)."""
+
+    def _count(self, outcome: str) -> None:
+        self.outcomes[outcome] += 1
+        LLM_CALLS.inc((outcome,))
+
+    def stream(self, question: str) -> Union[str, LiveAnswer, None]:
+        """Cached answer text, chal rahi / nayi LiveAnswer, ya None (guard ne roka)."""
+        key = normalize_question(question)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._count("cache_hit")
+            return cached
+        live, leader = self.flights.join(key, lambda: self._start(key, question))
+        if live is not None and not leader:
+            self._count("coalesced")
+        return live
+
+    def _start(self, key: str, question: str) -> Optional[LiveAnswer]:
+        if self.in_flight >= self.max_concurrency:
+            self._count("rejected")
+            return None
+        if not self.breaker.allow():
+            self._count("short_circuited")
+            return None
+
+        self.in_flight += 1
+        live = LiveAnswer()
+        # Background task - pehla client chala jaaye to bhi baaki readers aur cache ke liye chalta hai
+        task = asyncio.ensure_future(self._run(key, question[:self.max_prompt_length], live))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return live
+
+    async def answer(self, question: str) -> Optional[str]:
+        """Poora fallback answer, ya None (guard ne roka / call fail hui)."""
+        reply = self.stream(question)
+        if reply is None or isinstance(reply, str):
+            return reply
+        return await reply.result()
+
+    async def _run(self, key: str, prompt: str, live: LiveAnswer) -> None:
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        deltas = self._complete_stream(prompt)
+        text: Optional[str] = None
+        try:
+            # Deadline poore answer par hai, sirf pehle token par nahi
+            while True:
+                try:
+                    delta = await asyncio.wait_for(deltas.__anext__(), max(0.0, deadline - loop.time()))
+                except StopAsyncIteration:
+                    break
+                if delta:
+                    live.feed(delta)
+            text = "".join(live.parts).strip()
+            if not text:
+                raise ValueError("empty completion")
+        except asyncio.TimeoutError:
+            text = None
+            self.breaker.record_failure()
+            self._count("timeout")
+        except asyncio.CancelledError:
+            # Shutdown - backend ki galti nahi, half-open trial wapas
+            text = None
+            self.breaker.trial_in_flight = False
+            raise
+        except Exception as exc:
+            text = None
+            self.breaker.record_failure()
+            self._count("error")
+            logger.warning("LLM fallback call failed: %s", exc)
+        else:
+            self.breaker.record_success()
+            self._count("success")
+            self.cache.put(key, text)
+        finally:
+            self.in_flight -= 1
+            elapsed = time.perf_counter() - started
+            self.latency_total += elapsed
+            self.latency_max = max(self.latency_max, elapsed)
+            LLM_LATENCY.observe(elapsed)
+            self.flights.forget(key, live)
+            live.finish(text)
+            await deltas.aclose()
+
+    def describe(self) -> Dict[str, Any]:
+        calls = sum(self.outcomes[outcome] for outcome in ("success", "error", "timeout"))
+        return {
+            "backend": type(self).__name__,
+            "circuit": self.breaker.state,
+            "circuit_trips": self.breaker.trips,
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            "timeout_s": self.timeout,
+            "outcomes": dict(self.outcomes),
+            "latency_ms": {
+                "avg": round(self.latency_total / calls * 1000, 3) if calls else 0.0,
+                "max": round(self.latency_max * 1000, 3),
+            },
+            "cache": self.cache.stats(),
+        }
+
+
+class OpenAICompatibleBackend(FallbackBackend):
+    """OpenAI-compatible `/chat/completions` (OpenAI, vLLM, llama.cpp server, Ollama...)."""
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str = "gpt-4o-mini",
+        api_key: Optional[str] = None,
+        max_tokens: int = 400,
+        **guards: Any,
+    ):
+        super().__init__(**guards)
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self.api_key = api_key
+        self.max_tokens = max_tokens
+        self.client: Optional["httpx.AsyncClient"] = None
+
+    async def start(self) -> None:
+        # httpx sirf tab import hota hai jab fallback configured ho (cold start se bahar)
+        import httpx
+
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            # Pool utna hi bada jitni concurrency; pool ka intezaar lagbhag zero
+            limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency),
+            timeout=httpx.Timeout(self.timeout, connect=min(1.0, self.timeout), pool=0.1),
+        )
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    def _payload(self, question: str) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": question},
+            ],
+            "max_tokens": self.max_tokens,
+            "temperature": 0.2,
+            "stream": True,
+        }
+
+    async def _complete_stream(self, question: str) -> AsyncIterator[str]:
+        """`stream: true` - SSE `data:` lines se `choices[0].delta.content` deltas."""
+        if self.client is None:
+            raise RuntimeError("backend not started")
+        async with self.client.stream("POST", "/chat/completions", json=self._payload(question)) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                choices = json.loads(data).get("choices") or ()
+                delta = choices[0].get("delta", {}).get("content") if choices else None
+                if isinstance(delta, str) and delta:
+                    yield delta
+
+    def describe(self) -> Dict[str, Any]:
+        info = super().describe()
+        info.update(base_url=self.base_url, model=self.model)
+        return info
+
+
+BACKENDS = {"openai": OpenAICompatibleBackend}
+
+
+def backend_from_env(
+    environ: Mapping[str, str], flights: Optional[SingleFlight] = None,
+) -> Optional[FallbackBackend]:
+    """LLM_FALLBACK_* se backend; URL na ho to None (fallback band). `flights` coalescing stats share karta hai."""
+    base_url = environ.get("LLM_FALLBACK_URL", "")
+    if not base_url:
+        return None
+    name = environ.get("LLM_FALLBACK_BACKEND", "openai")
+    if name in BACKENDS:
+        factory = BACKENDS[name]
+    else:
+        module, _, attribute = name.partition(":")
+        factory = getattr(importlib.import_module(module), attribute)
+    return factory(
+        base_url,
+        model=environ.get("LLM_FALLBACK_MODEL", "gpt-4o-mini"),
+        api_key=environ.get("LLM_FALLBACK_API_KEY") or None,
+        timeout=float(environ.get("LLM_FALLBACK_TIMEOUT", 3)),
+        max_concurrency=int(environ.get("LLM_FALLBACK_CONCURRENCY", 8)),
+        max_prompt_length=int(environ.get("LLM_FALLBACK_MAX_PROMPT", 1000)),
+        flights=flights,
+    )
@@ -1,298 +1,280 @@
+# Cold start report sabse pehle - taaki framework imports ka time bhi gina jaye
+from startup import StartupReport
+STARTUP = StartupReport()
+
 import os
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
-import uvicorn
-from typing import Dict, List
+import json
+import time
+import asyncio
+from functools import partial
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, conint
+from starlette.requests import ClientDisconnect, HTTPConnection
+from typing import Any, AsyncIterator, Callable, Dict, List, Literal, Optional, Tuple
 import random
 
+from answer_cache import NORMALIZER, normalize_question
+from knowledge import (
+    FALLBACK_TOPIC, MATCH_DIRECT, MATCH_FALLBACK, MATCH_KEYWORD, MATCH_RETRIEVAL,
+    CachedAnswer, KnowledgeSnapshot, KnowledgeStore, Resolution, encode_answer,
+)
+from metrics import ANSWERS, CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY, Gauge, MetricsMiddleware, handler_start, observe_stage, request_start
+import server
+from static_assets import FingerprintedStaticFiles, PrecompressedPage
+from suggest import SuggestService, normalize_prefix
+from query_log import QueryLog
+import llm_fallback
+from chat_socket import ChatChannel
+from admission import AdmissionController, AdmissionMiddleware, SingleFlight
+import sessions
+import artifacts
+
+STARTUP.mark("imports")
+
 # NetPath Network AI Configuration
 COMPANY_NAME = "NetPath Network AI"
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Knowledge pack watcher - file badalne par naya snapshot background mein
+    tasks = []
+    if KNOWLEDGE_RELOAD_INTERVAL > 0:
+        tasks.append(asyncio.create_task(KNOWLEDGE.watch(KNOWLEDGE_RELOAD_INTERVAL)))
+    # Typeahead index popular questions ke saath refresh hota rehta hai
+    if SUGGEST_REFRESH_INTERVAL > 0:
+        tasks.append(asyncio.create_task(SUGGEST.refresh(SUGGEST_REFRESH_INTERVAL)))
+    # Query log flusher - shutdown par bache records likh kar hi rukta hai
+    if QUERY_LOG is not None:
+        tasks.append(asyncio.create_task(QUERY_LOG.run()))
+    # Idle sessions TTL ke baad hat'te hain - memory flat rehti hai
+    if SESSIONS is not None and SESSION_SWEEP_INTERVAL > 0:
+        tasks.append(asyncio.create_task(SESSIONS.run(SESSION_SWEEP_INTERVAL)))
+    # LLM fallback ka shared connection pool
+    if LLM_BACKEND is not None:
+        await LLM_BACKEND.start()
+    STARTUP.ready()
+    yield
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if LLM_BACKEND is not None:
+        await LLM_BACKEND.close()
+
 app = FastAPI(
     title=COMPANY_NAME,
     description="Advanced Network Engineering AI for Students",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
 )
 
+# /ask, /ask/stream aur /ws - sirf MB-size bodies rokne ke liye; ~4 KB pasted sawal
+# (loadtest ka "long" mix) matcher ke liye normal hain. LLM prompt alag se
+# LLM_FALLBACK_MAX_PROMPT par truncate hota hai.
+MAX_QUESTION_LENGTH = int(os.environ.get("MAX_QUESTION_LENGTH", 16384))
+
 class QuestionRequest(BaseModel):
-    question: str
+    question: str = Field(..., min_length=1, max_length=MAX_QUESTION_LENGTH)
+    top_k: int = Field(0, ge=0, le=20)
+    # Follow-up sawal ("iska port?") isi session ke pichle topic par resolve hote hain
+    session_id: Optional[str] = Field(None, min_length=1, max_length=sessions.MAX_SESSION_ID_LENGTH)
+
+class TopicScore(BaseModel):
+    topic: str
+    score: float
+
+class Correction(BaseModel):
+    original: str
+    term: str
+    topic: str
+    similarity: float
 
 class AnswerResponse(BaseModel):
     answer: str
     success: bool
+    topics: Optional[List[TopicScore]] = None
+    correction: Optional[Correction] = None
+
+class VlsmRequest(BaseModel):
+    network: str
+    # subnet name -> required hosts; sabse bada pehle allocate hota hai
+    hosts: Dict[str, conint(ge=1, le=2**128)]
+
+class SubnetBatchRequest(BaseModel):
+    cidrs: List[str] = Field(default_factory=list, max_length=100000)
+    summarize: bool = False
+    vlsm: Optional[VlsmRequest] = None
+    # "columns" = har field ki ek list, bade batches ke liye chhota JSON
+    layout: Literal["rows", "columns"] = "rows"
+
+# COMPREHENSIVE NETWORKING KNOWLEDGE BASE - ab knowledge/ pack se load hota hai
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+KNOWLEDGE_DIR = os.environ.get("NETPATH_KNOWLEDGE_DIR", os.path.join(BASE_DIR, "knowledge"))
+KNOWLEDGE_RELOAD_INTERVAL = float(os.environ.get("KNOWLEDGE_RELOAD_INTERVAL", 5))
+# Typo matching ke liye minimum similarity (1 - edit distance / word length)
+FUZZY_THRESHOLD = float(os.environ.get("FUZZY_THRESHOLD", 0.75))
+
+ANSWER_CACHE_SIZE = int(os.environ.get("ANSWER_CACHE_SIZE", 4096))
+ANSWER_CACHE_TTL = float(os.environ.get("ANSWER_CACHE_TTL", 600))
+
+STARTUP.mark("models")
+
+# Build step (`python artifacts.py build`) ki precompiled snapshot file - mile
+# aur current ho to knowledge aur UI page dobara compile nahi hote
+ARTIFACTS = artifacts.load(os.environ.get("NETPATH_ARTIFACTS", artifacts.DEFAULT_PATH))
+STARTUP.mark("artifacts")
+
+KNOWLEDGE = KnowledgeStore(
+    KNOWLEDGE_DIR,
+    cache_size=ANSWER_CACHE_SIZE,
+    cache_ttl=ANSWER_CACHE_TTL,
+    fuzzy_threshold=FUZZY_THRESHOLD,
+    snapshot=ARTIFACTS.knowledge(
+        KNOWLEDGE_DIR, fuzzy_threshold=FUZZY_THRESHOLD, cache_size=ANSWER_CACHE_SIZE, cache_ttl=ANSWER_CACHE_TTL,
+    ),
+)
+STARTUP.mark("knowledge")
+
+SUGGEST_REFRESH_INTERVAL = float(os.environ.get("SUGGEST_REFRESH_INTERVAL", 30))
+# Sawal tabhi suggestion banta hai jab itne alag clients (IP) ne poocha ho
+SUGGEST_MIN_SOURCES = int(os.environ.get("SUGGEST_MIN_SOURCES", 3))
+SUGGEST = SuggestService(KNOWLEDGE, min_sources=SUGGEST_MIN_SOURCES)
+# Sirf pakke matches suggestions mein jaate hain - fallback, typo aur BM25 (retrieval) wale nahi
+SUGGEST_MATCH_TYPES = frozenset({MATCH_DIRECT, MATCH_KEYWORD})
+
+# Har /ask ka JSONL record (logs/requests.jsonl); QUERY_LOG_PATH="" se band
+QUERY_LOG_PATH = os.environ.get("QUERY_LOG_PATH", os.path.join(BASE_DIR, "logs", "requests.jsonl"))
+QUERY_LOG = QueryLog(
+    QUERY_LOG_PATH,
+    max_queue=int(os.environ.get("QUERY_LOG_QUEUE", 10000)),
+    max_bytes=int(os.environ.get("QUERY_LOG_MAX_BYTES", 50 * 1024 * 1024)),
+    max_age=float(os.environ.get("QUERY_LOG_MAX_AGE", 24 * 3600)),
+) if QUERY_LOG_PATH else None
 
-# COMPREHENSIVE NETWORKING KNOWLEDGE BASE
-NETWORK_KNOWLEDGE = {
-    # Basic Networking Concepts
-    "what is network": "A network is a collection of computers and devices connected together to share resources and communicate. Types include LAN (Local Area Network), WAN (Wide Area Network), MAN (Metropolitan Area Network), and WLAN (Wireless LAN).",
-    
-    "network": "Computer network devices ko connect karta hai resource sharing ke liye. Main components: Routers, Switches, Firewalls, Cables, Wireless Access Points. Network topology: Star, Bus, Ring, Mesh.",
-    
-    "types of network": """
-🌐 Network Types:
-• LAN (Local Area Network) - Small geographical area
-• WAN (Wide Area Network) - Large geographical area  
-• MAN (Metropolitan Area Network) - City-wide
-• WLAN (Wireless LAN) - Wireless connectivity
-• PAN (Personal Area Network) - Personal devices
-• VPN (Virtual Private Network) - Secure remote access
-""",
-
-    # Network Models
-    "osi model": """
-📚 OSI Model - 7 Layers:
-1. Physical - Cables, signals, hardware
-2. Data Link - MAC addresses, switches
-3. Network - IP addresses, routers
-4. Transport - TCP/UDP, reliability
-5. Session - Connections, sessions
-6. Presentation - Encryption, compression
-7. Application - HTTP, FTP, SMTP
-""",
-
-    "tcp/ip model": """
-📡 TCP/IP Model - 4 Layers:
-1. Network Interface - Ethernet, WiFi
-2. Internet - IP, ICMP, routing
-3. Transport - TCP (reliable), UDP (fast)
-4. Application - HTTP, DNS, SSH, FTP
-""",
-
-    "difference between osi and tcp/ip": """
-🔄 OSI vs TCP/IP:
-• OSI - 7 layers, theoretical model
-• TCP/IP - 4 layers, practical implementation
-• OSI - Session & Presentation layers separate
-• TCP/IP - Session & Presentation included in Application layer
-""",
-
-    # Network Devices
-    "router": "🔄 Router - Layer 3 device, different networks ko connect karta hai. Routing tables use karta hai. Protocols: OSPF, BGP, EIGRP. Functions: Packet forwarding, path selection.",
-
-    "switch": "🔀 Switch - Layer 2 device, same network ke devices ko connect karta hai. MAC address table maintain karta hai. VLANs create kar sakta hai.",
-
-    "firewall": "🛡️ Firewall - Network security device, incoming/outgoing traffic control karta hai. Types: Packet-filtering, Stateful, Next-gen. ACL rules enforce karta hai.",
-
-    # Protocols
-    "tcp": "📨 TCP (Transmission Control Protocol) - Connection-oriented, reliable, sequencing, flow control. Used for: HTTP, FTP, SSH. Three-way handshake use karta hai.",
-
-    "udp": "⚡ UDP (User Datagram Protocol) - Connectionless, faster, no guarantees. Used for: DNS, VoIP, streaming. No sequencing or flow control.",
-
-    "tcp vs udp": """
-🆚 TCP vs UDP:
-TCP:
-• Connection-oriented
-• Reliable delivery
-• Sequencing & flow control
-• Slower but secure
-• Example: HTTP, FTP
-
-UDP:
-• Connectionless  
-• Faster but unreliable
-• No sequencing
-• Lower overhead
-• Example: DNS, VoIP
-""",
-
-    "http": "🌐 HTTP (Hypertext Transfer Protocol) - Web browsing ke liye, port 80 use karta hai, unencrypted.",
-
-    "https": "🔒 HTTPS (HTTP Secure) - Encrypted version of HTTP, port 443 use karta hai, SSL/TLS encryption.",
-
-    "dns": "📡 DNS (Domain Name System) - Domain names ko IP addresses mein convert karta hai. Hierarchy: Root → TLD → Authoritative servers.",
-
-    "dhcp": "🔌 DHCP (Dynamic Host Configuration Protocol) - Automatic IP address assignment, lease time manage karta hai.",
-
-    # Routing Protocols
-    "ospf": """
-🔄 OSPF (Open Shortest Path First):
-• Link-state routing protocol
-• Areas use karta hai scalability ke liye
-• Fast convergence
-• Dijkstra algorithm use karta hai
-• Metric: Cost (bandwidth based)
-""",
-
-    "bgp": """
-🌍 BGP (Border Gateway Protocol):
-• Internet routing protocol
-• Path vector protocol
-• AS (Autonomous System) numbers use karta hai
-• Policies based routing
-• TCP port 179 use karta hai
-""",
-
-    "eigrp": "🔷 EIGRP (Enhanced Interior Gateway Routing Protocol) - Cisco proprietary, hybrid protocol, DUAL algorithm use karta hai.",
-
-    "rip": "🔄 RIP (Routing Information Protocol) - Distance vector, hop count metric, maximum 15 hops.",
-
-    # IP Addressing & Subnetting
-    "ip address": "📍 IP Address - Device ka network identity. IPv4: 32-bit (192.168.1.1), IPv6: 128-bit. Public aur Private IP addresses.",
-
-    "subnetting": """
-🧮 Subnetting - Large network ko smaller parts mein divide karna:
-• 192.168.1.0/24 = 256 total, 254 usable
-• 192.168.1.0/25 = 128 total, 126 usable
-• 192.168.1.0/26 = 64 total, 62 usable
-• Subnet mask: 255.255.255.0 = /24
-""",
-
-    "ipv4 vs ipv6": """
-🆚 IPv4 vs IPv6:
-IPv4:
-• 32-bit address
-• 4.3 billion addresses
-• Dotted decimal notation
-• NAT required
-
-IPv6:
-• 128-bit address
-• 340 undecillion addresses  
-• Hexadecimal notation
-• Built-in security
-""",
-
-    # VLAN & Switching
-    "vlan": """
-🔷 VLAN (Virtual LAN):
-• Logical network segmentation
-• Broadcast domains control karta hai
-• Security improve karta hai
-• Trunk ports required between switches
-• Types: Data VLAN, Voice VLAN, Native VLAN
-""",
-
-    "stp": "🔄 STP (Spanning Tree Protocol) - Switching loops prevent karta hai. Root bridge election. Port states: Blocking, Listening, Learning, Forwarding.",
-
-    # Network Security
-    "vpn": "🔐 VPN (Virtual Private Network) - Secure encrypted connection public internet par. Types: Site-to-Site, Remote Access. Protocols: IPsec, SSL VPN.",
-
-    "acl": "📋 ACL (Access Control List) - Traffic ko allow/deny karne ke rules. Types: Standard ACL (source based), Extended ACL (source/destination both).",
-
-    "network security": """
-🛡️ Network Security Best Practices:
-• Strong passwords use karein
-• Regular updates karein
-• Firewall configure karein
-• VPN use karein remote access ke liye
-• Network monitoring karein
-• Access controls implement karein
-""",
-
-    # Troubleshooting
-    "ping": "🔄 Ping - Network connectivity check karne ke liye. ICMP protocol use karta hai. Command: ping google.com",
-
-    "tracert": "🛣️ Tracert - Packet ka path trace karta hai source se destination tak. Command: tracert 8.8.8.8",
-
-    "ipconfig": "💻 IPConfig - Network configuration dikhata hai. Command: ipconfig /all (Windows), ifconfig (Linux)",
-
-    "network troubleshooting": """
-🔧 Network Troubleshooting Steps:
-1. Physical connections check karein
-2. IP configuration verify karein
-3. Ping se connectivity test karein
-4. DNS resolution check karein
-5. Router/switch configuration verify karein
-6. Firewall rules check karein
-""",
-
-    # Basic Greetings
-    "Abhishek": "Namaste! 🙏 Abhishek NetPath AI Owner!",
-    
-    "hello": "Hello! 👋 I'm NetPath Network AI. How can I help you with networking topics today?",
-    
-    "hi": "Hi there! 😊 I'm your Network Engineering assistant. Ask me anything about networking!",
-    
-    "help": """
-🆘 How I can help you:
-
-📚 Networking Concepts:
-• OSI Model, TCP/IP Model
-• Network devices, protocols
-• IP addressing, subnetting
-
-🔄 Routing & Switching:
-• OSPF, BGP, EIGRP protocols
-• VLANs, STP, switching concepts
-
-🛡️ Security:
-• Firewalls, VPNs, ACLs
-• Network security best practices
-
-🔧 Troubleshooting:
-• Ping, tracert, ipconfig
-• Network issue resolution
-
-Koi bhi topic puchiye! 🎓
-""",
-
-    "thank you": "You're welcome! 😊 Agar koi aur sawal ho toh zaroor puchiye!",
-    
-    "bye": "Alvida! 👋 Aapse baat karke accha laga. Phir milenge!",
-}
+# Ek hi sawal ke concurrent duplicates ek hi LLM call share karte hain. Knowledge
+# matching synchronous + cached hai (overlap ho hi nahi sakta), isliye coalescing
+# sirf LLM fallback mein hai - /ask, /ws aur /ask/stream teeno usi se guzarte hain
+FLIGHTS = SingleFlight()
+
+# No-match sawalon ke liye optional LLM backend (LLM_FALLBACK_URL na ho to band)
+LLM_BACKEND = llm_fallback.backend_from_env(os.environ, flights=FLIGHTS)
+
+# Per-session recent topics (SESSION_STORE=off par band)
+SESSIONS = sessions.store_from_env(os.environ)
+SESSION_SWEEP_INTERVAL = float(os.environ.get("SESSION_SWEEP_INTERVAL", 60))
+
+async def _answer_in_session(
+    snapshot: KnowledgeSnapshot,
+    question: str,
+    top_k: int,
+    session_id: Optional[str],
+    observe: Optional[Callable[[str, float], None]] = None,
+) -> Tuple[CachedAnswer, bool]:
+    """Follow-up ho to session ka recent topic (bina full matching), warna normal answer"""
+    if session_id is None or SESSIONS is None:
+        return snapshot.answer(question, top_k, observe=observe)
+    question_lower = normalize_question(question)
+    if sessions.is_followup(question_lower) and snapshot.quick_topic(question_lower) is None:
+        for topic in await SESSIONS.recent_async(session_id):
+            # Knowledge reload ke baad purana topic gayab bhi ho sakta hai
+            if topic in snapshot.entries:
+                SESSIONS.followups += 1
+                await SESSIONS.remember_async(session_id, topic)
+                return snapshot.topic_answer(topic, top_k, sessions.MATCH_FOLLOWUP)
+    cached, hit = snapshot.answer(question, top_k, observe=observe)
+    if cached.match_type != MATCH_FALLBACK:
+        await SESSIONS.remember_async(session_id, cached.topic)
+    return cached, hit
+
+# /ask aur /ask/stream ke liye bounded queue; bhara ho to 429/503 + Retry-After
+# (ADMISSION_MAX_CONCURRENCY=0 = band)
+ADMISSION_PATHS = ("/ask", "/ask/stream")
+ADMISSION = AdmissionController(
+    max_concurrency=int(os.environ.get("ADMISSION_MAX_CONCURRENCY", 64)),
+    max_queue=int(os.environ.get("ADMISSION_MAX_QUEUE", 256)),
+    queue_timeout=float(os.environ.get("ADMISSION_QUEUE_TIMEOUT", 1.0)),
+)
+
+async def _with_llm_fallback(snapshot: KnowledgeSnapshot, question: str, top_k: int, cached: CachedAnswer) -> Tuple[CachedAnswer, str]:
+    """(answer, answer text) - knowledge match ho to LLM ko chhua bhi nahi jata"""
+    if cached.match_type != MATCH_FALLBACK or LLM_BACKEND is None:
+        return cached, snapshot.entries[cached.topic]
+    text = await LLM_BACKEND.answer(question)
+    if text is None:
+        return cached, snapshot.entries[cached.topic]
+    return _llm_answer(snapshot, question, top_k, text), text
+
+def _llm_answer(snapshot: KnowledgeSnapshot, question: str, top_k: int, text: str) -> CachedAnswer:
+    topics = snapshot.rank_topics(normalize_question(question), top_k) if top_k else None
+    return CachedAnswer(encode_answer(text, topics), FALLBACK_TOPIC, llm_fallback.MATCH_LLM)
+
+def _client_key(connection: HTTPConnection) -> str:
+    """Suggestions ke distinct-source count ke liye client (IP); store sirf hash hota hai"""
+    return connection.client.host if connection.client is not None else ""
+
+def _record_answer(endpoint: str, question: str, cached: CachedAnswer, hit: bool, started: float, client: str) -> None:
+    """Answer ke metrics, typeahead popularity aur query log - sab in-memory, koi I/O nahi"""
+    if STARTUP.first_answer_at is None:
+        STARTUP.answered()
+    ANSWERS.inc((endpoint, cached.match_type, cached.topic, "hit" if hit else "miss"))
+    if cached.match_type in SUGGEST_MATCH_TYPES:
+        SUGGEST.record(question, client)
+    if QUERY_LOG is not None:
+        QUERY_LOG.record({
+            "ts": round(time.time(), 3),
+            "endpoint": endpoint,
+            "question": question,
+            "normalized": normalize_question(question),
+            "topic": cached.topic,
+            "match_type": cached.match_type,
+            "cached": hit,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 3),
+        })
+
+async def _answer_for_socket(question: str, top_k: int, session_id: Optional[str], client: str) -> Tuple[CachedAnswer, bool]:
+    started = time.perf_counter()
+    snapshot = KNOWLEDGE.current
+    cached, hit = await _answer_in_session(snapshot, question, top_k, session_id)
+    cached, _ = await _with_llm_fallback(snapshot, question, top_k, cached)
+    _record_answer("/ws", question, cached, hit, started, client)
+    return cached, hit
+
+# /ws chat - ek connection par poora session (chat_socket.py)
+CHAT = ChatChannel(
+    _answer_for_socket,
+    max_connections=int(os.environ.get("WS_MAX_CONNECTIONS", 1000)),
+    idle_timeout=float(os.environ.get("WS_IDLE_TIMEOUT", 300)),
+    max_message_size=int(os.environ.get("WS_MAX_MESSAGE_SIZE", 4096)),
+    max_question_length=MAX_QUESTION_LENGTH,
+)
+
+STARTUP.mark("services")
+
+def rank_topics(question: str, top_k: int = 5) -> List[TopicScore]:
+    """Question ke liye top-k topics, BM25 score ke saath"""
+    return [TopicScore(topic=topic, score=score) for topic, score in KNOWLEDGE.current.rank_topics(question, top_k)]
 
 def find_best_answer(question: str) -> str:
     """Question ka best answer dhoondhta hai"""
-    question_lower = question.lower().strip()
-    
-    # Direct match
-    if question_lower in NETWORK_KNOWLEDGE:
-        return NETWORK_KNOWLEDGE[question_lower]
-    
-    # Smart keyword matching
-    keyword_mapping = {
-        "network": "what is network",
-        "types of network": "types of network",
-        "osi": "osi model",
-        "tcp": "tcp/ip model", 
-        "ip model": "tcp/ip model",
-        "router": "router",
-        "switch": "switch",
-        "firewall": "firewall",
-        "tcp vs udp": "tcp vs udp",
-        "udp": "tcp vs udp",
-        "http": "http",
-        "https": "https",
-        "dns": "dns",
-        "dhcp": "dhcp",
-        "ospf": "ospf",
-        "bgp": "bgp",
-        "eigrp": "eigrp",
-        "rip": "rip",
-        "ip address": "ip address",
-        "subnet": "subnetting",
-        "ipv4": "ipv4 vs ipv6",
-        "ipv6": "ipv4 vs ipv6",
-        "vlan": "vlan",
-        "stp": "stp",
-        "vpn": "vpn",
-        "acl": "acl",
-        "security": "network security",
-        "ping": "ping",
-        "tracert": "tracert",
-        "ipconfig": "ipconfig",
-        "troubleshoot": "network troubleshooting",
-        "problem": "network troubleshooting",
-        "issue": "network troubleshooting",
-        "thanks": "thank you",
-        "thank": "thank you",
-        "bye": "bye",
-        "goodbye": "bye",
-    }
-    
-    for keyword, answer_key in keyword_mapping.items():
-        if keyword in question_lower:
-            return NETWORK_KNOWLEDGE[answer_key]
-    
-    # If no match found
-    suggestions = [
-        "I can help you with networking topics! Try asking about:",
-        "OSI Model, TCP/IP protocols, routers, switches",
-        "Subnetting, VLANs, network security, troubleshooting",
-        "Routing protocols like OSPF, BGP, EIGRP"
-    ]
-    return f"{NETWORK_KNOWLEDGE['help']}"
+    return KNOWLEDGE.current.find_best_answer(question)
+
+def find_best_answers(questions: List[str]) -> List[str]:
+    """Batch ke saare answers - ek batch mein repeat hue questions ek hi baar match hote hain"""
+    snapshot = KNOWLEDGE.current
+    return [snapshot.entries[resolution.topic] for resolution in _resolve_batch(snapshot, questions)]
+
+def _resolve_batch(snapshot: KnowledgeSnapshot, questions: List[str]) -> List[Resolution]:
+    """Har question ka (topic, match_type, correction), duplicates ek hi baar resolve"""
+    resolved: Dict[str, Resolution] = {}
+    results = []
+    for question in questions:
+        key = normalize_question(question)
+        result = resolved.get(key)
+        if result is None:
+            result = resolved[key] = snapshot.resolve(key)
+        results.append(result)
+    return results
 
 # HTML Interface (same as before)
 HTML_CONTENT = """
@@ -401,6 +383,14 @@ HTML_CONTENT = """
             font-style: italic;
             color: #666;
         }
+        .answer-text {
+            white-space: pre-wrap;
+        }
+        .correction {
+            margin-top: 8px;
+            font-size: 13px;
+            color: #888;
+        }
     </style>
 </head>
 <body>
@@ -419,7 +409,10 @@ HTML_CONTENT = """
         <div class="input-container">
             <input type="text" id="userInput" 
                    placeholder="Ask about OSPF, BGP, subnetting, VLANs... (Hindi or English)" 
-                   onkeypress="handleKeyPress(event)">
+                   onkeypress="handleKeyPress(event)"
+                   oninput="scheduleSuggest()"
+                   list="suggestions" autocomplete="off">
+            <datalist id="suggestions"></datalist>
             <button onclick="sendMessage()">Send 🚀</button>
         </div>
     </div>
@@ -431,28 +424,183 @@ HTML_CONTENT = """
             }
         }
         
-        async function sendMessage() {
-            const userInput = document.getElementById('userInput');
-            const chatContainer = document.getElementById('chatContainer');
-            const question = userInput.value.trim();
-            
-            if (!question) return;
-            
-            // User message display
-            const userMessage = document.createElement('div');
-            userMessage.className = 'message user-message';
-            userMessage.innerHTML = `<strong>You:</strong> ${question}`;
-            chatContainer.appendChild(userMessage);
-            
-            // Clear input
-            userInput.value = '';
-            
-            // Show typing indicator
-            const typingMessage = document.createElement('div');
-            typingMessage.className = 'message ai-message';
-            typingMessage.innerHTML = '<strong>AI:</strong> <span class="typing">Thinking...</span>';
-            chatContainer.appendChild(typingMessage);
-            
+        // Typeahead - typing rukne ke 150ms baad hi /suggest, purani request cancel
+        let suggestTimer = null;
+        let suggestController = null;
+        function scheduleSuggest() {
+            clearTimeout(suggestTimer);
+            suggestTimer = setTimeout(fetchSuggestions, 150);
+        }
+        
+        async function fetchSuggestions() {
+            const query = document.getElementById('userInput').value;
+            const list = document.getElementById('suggestions');
+            if (suggestController) suggestController.abort();
+            if (!query.trim()) {
+                list.replaceChildren();
+                return;
+            }
+            suggestController = new AbortController();
+            try {
+                const response = await fetch('/suggest?q=' + encodeURIComponent(query), {
+                    signal: suggestController.signal
+                });
+                const data = await response.json();
+                list.replaceChildren(...data.suggestions.map((item) => {
+                    const option = document.createElement('option');
+                    option.value = item.text;
+                    return option;
+                }));
+            } catch (error) {
+                // Aborted ya network error - suggestions optional hain
+            }
+        }
+        
+        // Typo correct hua ho to answer ke neeche chhota note
+        function showCorrection(aiMessage, correction) {
+            if (!correction) return;
+            const note = document.createElement('div');
+            note.className = 'correction';
+            note.textContent = `Showing results for "${correction.term}" (you typed "${correction.original}")`;
+            aiMessage.appendChild(note);
+        }
+        
+        // Tab ka session id - follow-up sawal ("iska port?") pichle topic par jaate hain
+        let sessionId = sessionStorage.getItem('netpathSession');
+        if (!sessionId) {
+            sessionId = window.crypto && crypto.randomUUID
+                ? crypto.randomUUID()
+                : Date.now().toString(36) + Math.random().toString(36).slice(2);
+            sessionStorage.setItem('netpathSession', sessionId);
+        }
+        
+        // Chat /ws par - ek connection, har sawal ek frame; reply `id` se milta hai
+        let chatSocket = null;
+        let socketReady = null;
+        let socketRetryAt = 0;
+        let nextRequestId = 1;
+        const pendingReplies = new Map();
+        
+        function openSocket() {
+            if (socketReady) return socketReady;
+            if (!window.WebSocket || Date.now() < socketRetryAt) {
+                return Promise.reject(new Error('WebSocket unavailable'));
+            }
+            socketReady = new Promise((resolve, reject) => {
+                const scheme = location.protocol === 'https:' ? 'wss://' : 'ws://';
+                const socket = new WebSocket(scheme + location.host + '/ws');
+                socket.onmessage = (event) => {
+                    const data = JSON.parse(event.data);
+                    if (data.type === 'hello') {
+                        chatSocket = socket;
+                        resolve(socket);
+                        return;
+                    }
+                    const pending = pendingReplies.get(data.id);
+                    if (!pending) return;
+                    pendingReplies.delete(data.id);
+                    clearTimeout(pending.timer);
+                    if (data.type === 'error') {
+                        pending.reject(new Error(data.error));
+                    } else {
+                        pending.resolve(data);
+                    }
+                };
+                socket.onclose = () => {
+                    if (chatSocket !== socket) {
+                        // Hello se pehle hi band (busy/proxy) - kuch der HTTP hi use karo
+                        socketRetryAt = Date.now() + 30000;
+                        reject(new Error('WebSocket closed'));
+                    }
+                    // Idle timeout ke baad agla sawal naya connection kholega
+                    chatSocket = null;
+                    socketReady = null;
+                    for (const pending of pendingReplies.values()) {
+                        clearTimeout(pending.timer);
+                        pending.reject(new Error('WebSocket closed'));
+                    }
+                    pendingReplies.clear();
+                };
+            });
+            return socketReady;
+        }
+        
+        async function askOverSocket(question) {
+            const socket = await openSocket();
+            const id = nextRequestId++;
+            return new Promise((resolve, reject) => {
+                const timer = setTimeout(() => {
+                    pendingReplies.delete(id);
+                    reject(new Error('WebSocket reply timed out'));
+                }, 10000);
+                pendingReplies.set(id, { resolve, reject, timer });
+                socket.send(JSON.stringify({ id: id, question: question, session_id: sessionId }));
+            });
+        }
+        
+        // Answer/sawal hamesha textContent se - LLM ya user ka text HTML nahi banta
+        function chatMessage(className, label, text) {
+            const message = document.createElement('div');
+            message.className = 'message ' + className;
+            const strong = document.createElement('strong');
+            strong.textContent = label;
+            const body = document.createElement('span');
+            body.className = 'answer-text';
+            body.textContent = text;
+            message.append(strong, ' ', body);
+            return message;
+        }
+        
+        function showAnswer(data, typingMessage, chatContainer) {
+            chatContainer.removeChild(typingMessage);
+            const aiMessage = chatMessage('ai-message', 'AI:', data.answer);
+            showCorrection(aiMessage, data.correction);
+            chatContainer.appendChild(aiMessage);
+        }
+        
+        // Answer /ask/stream se chunk-by-chunk aata hai; stream na chale to /ask
+        function streamAnswer(question, typingMessage, chatContainer) {
+            return new Promise((resolve, reject) => {
+                if (!window.EventSource) {
+                    reject(new Error('EventSource not supported'));
+                    return;
+                }
+                const source = new EventSource(
+                    '/ask/stream?question=' + encodeURIComponent(question) +
+                    '&session_id=' + encodeURIComponent(sessionId)
+                );
+                let answerText = null;
+                
+                source.addEventListener('chunk', (event) => {
+                    if (answerText === null) {
+                        // Pehla chunk aate hi "Thinking..." hatao
+                        chatContainer.removeChild(typingMessage);
+                        const aiMessage = chatMessage('ai-message', 'AI:', '');
+                        answerText = aiMessage.querySelector('.answer-text');
+                        chatContainer.appendChild(aiMessage);
+                    }
+                    answerText.textContent += JSON.parse(event.data).text;
+                    chatContainer.scrollTop = chatContainer.scrollHeight;
+                });
+                source.addEventListener('done', (event) => {
+                    source.close();
+                    if (answerText !== null) {
+                        showCorrection(answerText.parentNode, JSON.parse(event.data).correction);
+                    }
+                    resolve();
+                });
+                source.onerror = () => {
+                    source.close();
+                    if (answerText === null) {
+                        reject(new Error('stream failed'));
+                    } else {
+                        resolve();
+                    }
+                };
+            });
+        }
+        
+        async function askOverHttp(question, typingMessage, chatContainer) {
             try {
                 // API call
                 const response = await fetch('/ask', {
@@ -461,20 +609,15 @@ HTML_CONTENT = """
                         'Content-Type': 'application/json',
                     },
                     body: JSON.stringify({
-                        question: question
+                        question: question,
+                        session_id: sessionId
                     })
                 });
                 
                 const data = await response.json();
                 
-                // Remove typing message
-                chatContainer.removeChild(typingMessage);
-                
                 // AI response
-                const aiMessage = document.createElement('div');
-                aiMessage.className = 'message ai-message';
-                aiMessage.innerHTML = `<strong>AI:</strong> ${data.answer}`;
-                chatContainer.appendChild(aiMessage);
+                showAnswer(data, typingMessage, chatContainer);
                 
             } catch (error) {
                 // Remove typing message
@@ -486,6 +629,37 @@ HTML_CONTENT = """
                 errorMessage.innerHTML = '<strong>AI:</strong> Sorry, technical issue. Please try again.';
                 chatContainer.appendChild(errorMessage);
             }
+        }
+        
+        async function sendMessage() {
+            const userInput = document.getElementById('userInput');
+            const chatContainer = document.getElementById('chatContainer');
+            const question = userInput.value.trim();
+            
+            if (!question) return;
+            
+            // User message display
+            chatContainer.appendChild(chatMessage('user-message', 'You:', question));
+            
+            // Clear input
+            userInput.value = '';
+            
+            // Show typing indicator
+            const typingMessage = document.createElement('div');
+            typingMessage.className = 'message ai-message';
+            typingMessage.innerHTML = '<strong>AI:</strong> <span class="typing">Thinking...</span>';
+            chatContainer.appendChild(typingMessage);
+            
+            // WebSocket -> SSE stream -> plain POST /ask
+            try {
+                showAnswer(await askOverSocket(question), typingMessage, chatContainer);
+            } catch (socketError) {
+                try {
+                    await streamAnswer(question, typingMessage, chatContainer);
+                } catch (streamError) {
+                    await askOverHttp(question, typingMessage, chatContainer);
+                }
+            }
             
             // Scroll to bottom
             chatContainer.scrollTop = chatContainer.scrollHeight;
@@ -495,15 +669,299 @@ HTML_CONTENT = """
 </html>
 """
 
-@app.get("/")
-async def home():
-    return HTMLResponse(HTML_CONTENT)
+# UI page ek baar build hota hai - gzip/br variants + ETag
+UI_PAGE = ARTIFACTS.page(HTML_CONTENT) or PrecompressedPage(HTML_CONTENT)
+STARTUP.mark("ui_page")
+
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+app.mount("/static", FingerprintedStaticFiles(directory=STATIC_DIR, check_dir=False), name="static")
+
+@app.get("/", response_class=HTMLResponse)
+async def home(request: Request):
+    return UI_PAGE.response(request)
 
-@app.post("/ask")
-async def ask_question(request: QuestionRequest):
+@app.post("/ask", response_model=AnswerResponse, response_model_exclude_none=True)
+async def ask_question(request: QuestionRequest, http_request: Request):
     """AI questions ka answer dein"""
-    answer = find_best_answer(request.question)
-    return AnswerResponse(answer=answer, success=True)
+    # Parse stage = admission ke baad se handler tak (body read + pydantic validation);
+    # queue wait alag "queue" stage hai, query log latency end-to-end
+    received = request_start(http_request.scope) or time.perf_counter()
+    admitted = handler_start(http_request.scope)
+    if admitted is not None:
+        observe_stage("/ask", "parse", time.perf_counter() - admitted)
+    snapshot = KNOWLEDGE.current
+    cached, hit = await _answer_in_session(snapshot, request.question, request.top_k, request.session_id, _observe_ask_stage)
+    cached, _ = await _with_llm_fallback(snapshot, request.question, request.top_k, cached)
+    _record_answer("/ask", request.question, cached, hit, received, _client_key(http_request))
+    return Response(content=cached.body, media_type="application/json")
+
+# Batch /ask - quiz banks ke liye, results NDJSON mein stream hote hain
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+BATCH_CHUNK_SIZE = 64
+
+# (id, question, error) - error ho to question None hota hai
+BatchItem = Tuple[Any, Optional[str], Optional[str]]
+
+def _parse_batch_item(position: int, raw: Any) -> BatchItem:
+    """Ek batch item ko (id, question, error) mein badalta hai"""
+    if isinstance(raw, str):
+        raw = {"question": raw}
+    if not isinstance(raw, dict):
+        return position, None, "item must be a string or an object with a 'question' field"
+    item_id = raw.get("id", position)
+    question = raw.get("question")
+    if not isinstance(question, str) or not question.strip():
+        return item_id, None, "'question' must be a non-empty string"
+    return item_id, question, None
+
+def _encode_batch(items: List[BatchItem]) -> bytes:
+    """Ek chunk resolve karke uski NDJSON lines banata hai"""
+    snapshot = KNOWLEDGE.current
+    started = time.perf_counter()
+    resolved = iter(_resolve_batch(snapshot, [question for _, question, error in items if error is None]))
+    matched = time.perf_counter()
+    lines = []
+    for item_id, question, error in items:
+        if error is None:
+            topic, match_type, correction = next(resolved)
+            ANSWERS.inc(("/ask/batch", match_type, topic, "none"))
+            record = {"id": item_id, "answer": snapshot.entries[topic], "success": True}
+            if correction is not None:
+                record["correction"] = correction._asdict()
+        else:
+            record = {"id": item_id, "success": False, "error": error}
+        lines.append(json.dumps(record, ensure_ascii=False))
+    body = ("\n".join(lines) + "\n").encode("utf-8")
+    observe_stage("/ask/batch", "match", matched - started)
+    observe_stage("/ask/batch", "serialize", time.perf_counter() - matched)
+    return body
+
+async def _ndjson_chunks(request: Request) -> AsyncIterator[List[BatchItem]]:
+    """Request body ko stream karte hue har aaye hue hisse ki complete lines parse karta hai"""
+    position = 0
+    buffer = b""
+    async for data in request.stream():
+        *lines, buffer = (buffer + data).split(b"\n")
+        items = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                items.append(_parse_batch_item(position, json.loads(line)))
+            except ValueError:
+                items.append((position, None, "invalid JSON line"))
+            position += 1
+        for start in range(0, len(items), BATCH_CHUNK_SIZE):
+            yield items[start:start + BATCH_CHUNK_SIZE]
+    if buffer.strip():
+        try:
+            yield [_parse_batch_item(position, json.loads(buffer))]
+        except ValueError:
+            yield [(position, None, "invalid JSON line")]
+
+async def _list_chunks(questions: List[Any]) -> AsyncIterator[List[BatchItem]]:
+    for start in range(0, len(questions), BATCH_CHUNK_SIZE):
+        yield [
+            _parse_batch_item(position, raw)
+            for position, raw in enumerate(questions[start:start + BATCH_CHUNK_SIZE], start)
+        ]
+
+class _DuplexStreamingResponse(StreamingResponse):
+    """StreamingResponse jo response bhejte hue request body bhi padh sake.
+
+    Default StreamingResponse disconnect sunne ke liye khud `receive()` karta
+    hai, jo NDJSON body ke chunks kha jata hai. Disconnect yahan body stream
+    ya `send` ke fail hone se pata chal jata hai.
+    """
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+        if self.background is not None:
+            await self.background()
+
+async def _stream_batch(chunks: AsyncIterator[List[BatchItem]]) -> AsyncIterator[bytes]:
+    async for items in chunks:
+        yield _encode_batch(items)
+
+@app.post("/ask/batch")
+async def ask_batch(request: Request):
+    """Bahut saare questions ek request mein - JSON list ya NDJSON, answers NDJSON stream mein"""
+    if request.headers.get("content-type", "").startswith(NDJSON_MEDIA_TYPE):
+        chunks = _ndjson_chunks(request)
+    else:
+        try:
+            payload = json.loads(await request.body())
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Body must be a JSON list or NDJSON")
+        if isinstance(payload, dict):
+            payload = payload.get("questions")
+        if not isinstance(payload, list):
+            raise HTTPException(status_code=400, detail="Body must be a JSON list of questions")
+        chunks = _list_chunks(payload)
+    return _DuplexStreamingResponse(_stream_batch(chunks), media_type=NDJSON_MEDIA_TYPE)
+
+_observe_ask_stage = partial(observe_stage, "/ask")
+
+# Server-Sent Events - answer chunks jaise hi ready hon, aakhir mein metadata
+SSE_MEDIA_TYPE = "text/event-stream"
+
+def _sse_event(event: str, data: Dict[str, Any]) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+
+def _answer_chunks(answer: str) -> List[str]:
+    """Answer ko lines mein todta hai taaki UI incrementally render kare"""
+    return answer.splitlines(keepends=True) or [answer]
+
+_observe_stream_stage = partial(observe_stage, "/ask/stream")
+
+@app.get("/ask/stream")
+async def ask_stream(
+    http_request: Request,
+    question: str = Query(..., min_length=1, max_length=MAX_QUESTION_LENGTH),
+    top_k: int = Query(0, ge=0, le=20),
+    session_id: Optional[str] = Query(None, min_length=1, max_length=sessions.MAX_SESSION_ID_LENGTH),
+):
+    """Answer SSE stream mein - "chunk" events, phir topic/match type ke saath "done" event.
+
+    LLM fallback ke tokens backend se aate hi chunks ban jaate hain; beech mein
+    call fail ho to "done" mein `truncated: true` aata hai.
+    """
+    received = request_start(http_request.scope) or time.perf_counter()
+    client = _client_key(http_request)
+    snapshot = KNOWLEDGE.current
+    cached, hit = await _answer_in_session(snapshot, question, top_k, session_id, _observe_stream_stage)
+    answer_text = snapshot.entries[cached.topic]
+    live: Optional[llm_fallback.LiveAnswer] = None
+    if cached.match_type == MATCH_FALLBACK and LLM_BACKEND is not None:
+        reply = LLM_BACKEND.stream(question)
+        if isinstance(reply, str):
+            cached, answer_text = _llm_answer(snapshot, question, top_k, reply), reply
+        elif reply is not None:
+            live = reply
+    if live is None:
+        _record_answer("/ask/stream", question, cached, hit, received, client)
+
+    async def events() -> AsyncIterator[bytes]:
+        nonlocal cached
+        truncated = False
+        if live is None:
+            for chunk in _answer_chunks(answer_text):
+                yield _sse_event("chunk", {"text": chunk})
+        else:
+            streamed = False
+            try:
+                async for delta in live.deltas():
+                    streamed = True
+                    yield _sse_event("chunk", {"text": delta})
+                if live.text is not None or streamed:
+                    cached = _llm_answer(snapshot, question, top_k, live.text or "".join(live.parts))
+                    truncated = live.text is None
+            finally:
+                _record_answer("/ask/stream", question, cached, hit, received, client)
+            if not streamed:
+                # Pehla token aane se pehle hi fail - wahi purana help answer
+                for chunk in _answer_chunks(answer_text):
+                    yield _sse_event("chunk", {"text": chunk})
+        done: Dict[str, Any] = {
+            "topic": cached.topic,
+            "match_type": cached.match_type,
+            "cached": hit,
+            "knowledge_version": snapshot.version,
+        }
+        if truncated:
+            done["truncated"] = True
+        if cached.correction is not None:
+            done["correction"] = cached.correction._asdict()
+        if top_k:
+            done["topics"] = [
+                {"topic": topic, "score": score}
+                for topic, score in snapshot.rank_topics(normalize_question(question), top_k)
+            ]
+        yield _sse_event("done", done)
+
+    return StreamingResponse(
+        events(),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.websocket("/ws")
+async def chat_socket(websocket: WebSocket):
+    """Chat session WebSocket par - har sawal ek JSON frame, reply mein wahi id"""
+    await CHAT.serve(websocket)
+
+# Typeahead - har keystroke par aata hai, isliye sirf pre-built index ka lookup
+@app.get("/suggest")
+async def suggest(
+    q: str = Query("", max_length=200),
+    limit: int = Query(8, ge=1, le=20),
+):
+    """Prefix ke liye popular completions (topic keys, keywords, past questions)"""
+    body = SUGGEST.current.encoded(normalize_prefix(q), limit)
+    return Response(content=body, media_type="application/json", headers={"Cache-Control": "public, max-age=30"})
+
+# Subnet calculator - students ke "is /22 ko /26 mein todo" wale sawal
+def _json_response(payload: Dict[str, Any]) -> Response:
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return Response(content=body, media_type="application/json")
+
+# Dono handlers sync hain - CPU wala kaam threadpool mein chalta hai, event loop par nahi
+@app.get("/subnet")
+def subnet_info(
+    cidr: str = Query(..., min_length=1, max_length=64),
+    split: Optional[int] = Query(None, ge=0, le=128),
+):
+    """Ek CIDR ka network, broadcast, mask aur host range; `split` do to subnets bhi"""
+    import subnet  # numpy wala engine pehli /subnet call par load hota hai, boot par nahi
+    try:
+        result = subnet.describe(cidr)
+        if split is not None:
+            result["subnets"] = subnet.split(cidr, split)
+    except subnet.SubnetError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return _json_response(result)
+
+@app.post("/subnet/batch")
+def subnet_batch(request: SubnetBatchRequest):
+    """Poore assignment ke CIDRs ek call mein - describe, summarization aur VLSM"""
+    import subnet
+    started = time.perf_counter()
+    columns, errors = subnet.describe_many(request.cidrs)
+    result: Dict[str, Any] = {"count": len(request.cidrs), "error_count": len(errors)}
+    if request.layout == "columns":
+        result["columns"] = columns
+        result["errors"] = [
+            {"index": index, "input": request.cidrs[index], "error": message} for index, message in errors
+        ]
+    else:
+        rows: List[Dict[str, Any]] = subnet.rows_from_columns(columns)
+        for row in rows:
+            row["success"] = True
+        for index, message in errors:
+            rows[index] = {"input": request.cidrs[index], "success": False, "error": message}
+        result["results"] = rows
+
+    try:
+        if request.summarize:
+            valid = [cidr for cidr in columns["cidr"] if cidr is not None]
+            result["summary"] = subnet.summarize(valid) if valid else None
+        if request.vlsm is not None:
+            result["vlsm"] = subnet.allocate_vlsm(request.vlsm.network, list(request.vlsm.hosts.items()))
+    except subnet.SubnetError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    computed = time.perf_counter()
+    response = _json_response(result)
+    observe_stage("/subnet/batch", "compute", computed - started)
+    observe_stage("/subnet/batch", "serialize", time.perf_counter() - computed)
+    return response
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus text format metrics"""
+    return Response(content=REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
 
 @app.get("/health")
 async def health_check():
@@ -511,10 +969,62 @@ async def health_check():
         "status": "healthy", 
         "service": "NetPath AI",
         "version": "2.0.0",
-        "knowledge_topics": len(NETWORK_KNOWLEDGE)
+        "knowledge_topics": len(KNOWLEDGE.current.entries),
+        "knowledge": KNOWLEDGE.describe(),
+        "answer_cache": KNOWLEDGE.current.cache.stats(),
+        "normalizer": NORMALIZER.describe(),
+        "suggest": SUGGEST.describe(),
+        "query_log": QUERY_LOG.describe() if QUERY_LOG is not None else None,
+        "llm_fallback": LLM_BACKEND.describe() if LLM_BACKEND is not None else None,
+        "websocket": CHAT.describe(),
+        "admission": ADMISSION.describe(),
+        "sessions": SESSIONS.describe() if SESSIONS is not None else None,
+        "startup": {**STARTUP.describe(), "artifacts": ARTIFACTS.describe()},
+        "coalescing": FLIGHTS.describe(),
     }
 
-# Render deployment
+# Knowledge snapshot aur answer cache scrape ke waqt padhe jaate hain
+REGISTRY.register(Gauge(
+    "netpath_knowledge_snapshot_version", "Version of the live knowledge snapshot.",
+    lambda: [((), KNOWLEDGE.current.version)],
+))
+REGISTRY.register(Gauge(
+    "netpath_knowledge_entries", "Topics in the live knowledge snapshot.",
+    lambda: [((), len(KNOWLEDGE.current.entries))],
+))
+REGISTRY.register(Gauge(
+    "netpath_answer_cache_events_total", "Answer cache events for the live snapshot (resets on swap).",
+    lambda: [((event,), KNOWLEDGE.current.cache.stats()[event]) for event in ("hits", "misses", "evictions", "expirations")],
+    labelnames=("event",),
+    kind="counter",
+))
+
+REGISTRY.register(Gauge(
+    "netpath_admission_queue_depth", "Requests waiting for an admission slot.",
+    lambda: [((), ADMISSION.queue_depth)],
+))
+REGISTRY.register(Gauge(
+    "netpath_admission_active", "Requests currently holding an admission slot.",
+    lambda: [((), ADMISSION.active)],
+))
+REGISTRY.register(Gauge(
+    "netpath_ws_open_connections", "Open /ws chat connections in this worker.",
+    lambda: [((), CHAT.open)],
+))
+
+if QUERY_LOG is not None:
+    REGISTRY.register(Gauge(
+        "netpath_query_log_records_total", "Query log records written to disk or dropped (queue full / write error).",
+        lambda: [(("written",), QUERY_LOG.written), (("dropped",), QUERY_LOG.dropped)],
+        labelnames=("outcome",),
+        kind="counter",
+    ))
+
+if ADMISSION.max_concurrency > 0:
+    app.add_middleware(AdmissionMiddleware, controller=ADMISSION, paths=ADMISSION_PATHS)
+app.add_middleware(MetricsMiddleware, endpoints=[route.path for route in app.routes], prefixes=["/static"])
+STARTUP.mark("app")
+
+# Render deployment - PORT default, WEB_CONCURRENCY > 1 par pre-fork workers (server.py)
 if __name__ == "__main__":
-    port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    server.run(app)
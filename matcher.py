@@ -0,0 +1,84 @@
+"""Keyword matching for find_best_answer.
+
+keyword_mapping ko import par hi ek compiled regex mein badal diya jata hai,
+taaki har /ask par ek hi pass mein saare keyword hits mil jaayein.
+"""
+import re
+from typing import Dict, Iterable, Optional, Tuple
+
+# Isse kam keywords par CPython ka C-level `in` scan regex se tez padta hai
+# (benchmarks/bench_matcher.py se naapa gaya crossover ~150 keywords hai).
+SCAN_THRESHOLD = 128
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Words ka prefix-trie regex banata hai (har position par longest match)."""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional: pehle lamba keyword try hota hai, phir yahin khatam
+        return "(?:" + body + ")?" if "" in node else body
+
+    return emit(trie)
+
+
+class KeywordMatcher:
+    """keyword -> topic mapping, jisme mapping ka order hi priority hai."""
+
+    __slots__ = ("_pattern", "_best", "_ordered", "use_automaton")
+
+    def __init__(self, mapping: Dict[str, str]):
+        keywords = [keyword for keyword in mapping if keyword]
+        priority = {keyword: rank for rank, keyword in enumerate(keywords)}
+
+        # Ek position par match hone wale saare keywords ek dusre ke prefix hote
+        # hain, isliye longest match se us position ka best keyword pehle se
+        # nikala ja sakta hai.
+        self._best: Dict[str, Tuple[int, str]] = {}
+        for keyword in keywords:
+            prefixes = [keyword[:n] for n in range(1, len(keyword) + 1) if keyword[:n] in priority]
+            winner = min(prefixes, key=priority.__getitem__)
+            self._best[keyword] = (priority[winner], mapping[winner])
+
+        self._ordered = tuple((keyword, mapping[keyword]) for keyword in keywords)
+        self._pattern = re.compile(_trie_pattern(keywords)) if keywords else None
+        self.use_automaton = len(keywords) > SCAN_THRESHOLD
+
+    def match(self, text: str) -> Optional[str]:
+        """Sabse pehle (mapping order mein) aane wale keyword ka topic lautata hai."""
+        if self.use_automaton:
+            return self.match_automaton(text)
+        return self.match_scan(text)
+
+    def match_scan(self, text: str) -> Optional[str]:
+        """Priority order mein ek-ek keyword ka substring scan."""
+        for keyword, topic in self._ordered:
+            if keyword in text:
+                return topic
+        return None
+
+    def match_automaton(self, text: str) -> Optional[str]:
+        """Compiled trie regex se ek pass mein saare keyword hits."""
+        if self._pattern is None:
+            return None
+        search = self._pattern.search
+        best: Optional[Tuple[int, str]] = None
+        hit = search(text)
+        while hit is not None:
+            rank, topic = self._best[hit.group()]
+            if best is None or rank < best[0]:
+                best = (rank, topic)
+                if rank == 0:
+                    break
+            # Overlapping hits bhi chahiye ("types of network" ke andar "network")
+            hit = search(text, hit.start() + 1)
+        return best[1] if best else None
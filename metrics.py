@@ -0,0 +1,226 @@
+"""Low-overhead request instrumentation aur Prometheus text exposition.
+
+Counters aur histograms fixed buckets wale hain: ek observation sirf ek
+bisect aur do in-place increments hai, koi lock nahi (event loop single
+thread hai; worker threads se aane wale rare updates ke liye GIL kaafi hai).
+Label sets pehli baar dikhne par hi allocate hote hain.
+"""
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Request latency buckets (seconds) - 50us se 2.5s tak
+LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter, label values ke tuple se keyed."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...] = (), amount: float = 1) -> None:
+        values = self._values
+        values[labels] = values.get(labels, 0) + amount
+
+    def value(self, labels: Tuple[str, ...] = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class Histogram:
+    """Fixed-bucket histogram; har label set ke liye ek counts list."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, labels: Tuple[str, ...] = ()) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, labels: Tuple[str, ...] = ()) -> int:
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def render(self) -> List[str]:
+        lines = []
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, hits in zip(self.buckets + (float("inf"),), series):
+                cumulative += hits
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound!r}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Gauge:
+    """Scrape ke waqt callback se padha jane wala gauge (cache size, snapshot version...)."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Iterable[Tuple[Tuple[str, ...], float]]],
+        labelnames: Sequence[str] = (),
+        kind: str = "gauge",
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.kind = kind
+        self._collect = collect
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in self._collect()
+        ]
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: List = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+REQUESTS = REGISTRY.register(Counter(
+    "netpath_http_requests_total", "HTTP requests by endpoint, method and status.",
+    ("endpoint", "method", "status"),
+))
+REQUEST_LATENCY = REGISTRY.register(Histogram(
+    "netpath_http_request_duration_seconds", "End-to-end HTTP request latency.", ("endpoint",),
+))
+STAGE_LATENCY = REGISTRY.register(Histogram(
+    "netpath_stage_duration_seconds", "Time spent per request stage (queue, parse, match, serialize).",
+    ("endpoint", "stage"),
+))
+ANSWERS = REGISTRY.register(Counter(
+    "netpath_answers_total", "Answers served by endpoint, match type, topic and cache result.",
+    ("endpoint", "match_type", "topic", "cache"),
+))
+
+
+def observe_stage(endpoint: str, stage: str, seconds: float) -> None:
+    STAGE_LATENCY.observe(seconds, (endpoint, stage))
+
+
+def request_start(scope: Scope) -> Optional[float]:
+    """MetricsMiddleware ka recorded start time (perf_counter), agar hai."""
+    state = scope.get("state")
+    return state.get("metrics_start") if state else None
+
+
+def handler_start(scope: Scope) -> Optional[float]:
+    """Parse stage ka start - admission queue se nikalne ka time, warna `request_start`."""
+    state = scope.get("state")
+    if not state:
+        return None
+    return state.get("admitted_at", state.get("metrics_start"))
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware - har HTTP request ka count aur latency record karta hai.
+
+    Endpoint label sirf jaane-pehchaane paths ka hota hai, baaki sab "other",
+    taaki 404 scans se label cardinality na badhe.
+    """
+
+    def __init__(self, app: ASGIApp, endpoints: Iterable[str], prefixes: Iterable[str] = ()):
+        self.app = app
+        self.endpoints = frozenset(endpoints)
+        self.prefixes = tuple(prefixes)
+
+    def _label(self, path: str) -> str:
+        if path in self.endpoints:
+            return path
+        for prefix in self.prefixes:
+            if path.startswith(prefix):
+                return prefix
+        return "other"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        scope.setdefault("state", {})["metrics_start"] = started
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            endpoint = self._label(scope["path"])
+            REQUESTS.inc((endpoint, scope["method"], str(status)))
+            REQUEST_LATENCY.observe(time.perf_counter() - started, (endpoint,))
@@ -0,0 +1,154 @@
+"""Har /ask ka record JSONL mein - knowledge tuning aur replay load tests ke liye.
+
+Request path sirf ek bounded in-memory deque mein dict daalta hai (koi I/O,
+koi await nahi). Buffer bhara ho to record drop hota hai aur `dropped`
+badhta hai - event loop kabhi disk ka intezaar nahi karta. Background task
+har `flush_interval` second (ya `batch_size` records jamaa hote hi) saare
+pending records ek write mein thread ke andar likhta hai, aur file
+`max_bytes` ya `max_age` paar karte hi rotate hoti hai.
+
+Path mein "{pid}" ho to har worker process ki apni file banti hai
+(WEB_CONCURRENCY > 1 ke liye).
+"""
+import asyncio
+import glob
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger("netpath.query_log")
+
+
+class QueryLog:
+    """Non-blocking, batched JSONL writer with size/time based rotation."""
+
+    def __init__(
+        self,
+        path: str,
+        max_queue: int = 10000,
+        batch_size: int = 512,
+        flush_interval: float = 1.0,
+        max_bytes: int = 50 * 1024 * 1024,
+        max_age: float = 24 * 3600,
+        backups: int = 7,
+    ):
+        self.path_template = path
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backups = backups
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._opened_at: Optional[float] = None
+        self.written = 0
+        self.dropped = 0
+        self.rotations = 0
+        self.write_errors = 0
+
+    @property
+    def path(self) -> str:
+        # pid fork ke baad padha jata hai, isliye property
+        return self.path_template.replace("{pid}", str(os.getpid()))
+
+    def record(self, entry: Dict[str, Any]) -> bool:
+        """Entry queue karta hai; buffer bhara ho to drop karke False."""
+        if len(self._pending) >= self.max_queue:
+            self.dropped += 1
+            return False
+        self._pending.append(entry)
+        if len(self._pending) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    def _take(self) -> List[Dict[str, Any]]:
+        pending = self._pending
+        return [pending.popleft() for _ in range(len(pending))]
+
+    def _rotate_if_needed(self, path: str, incoming: int) -> None:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._opened_at = None
+            return
+        if self._opened_at is None:
+            self._opened_at = stat.st_mtime
+        too_big = stat.st_size + incoming > self.max_bytes
+        too_old = time.time() - self._opened_at > self.max_age
+        if not (too_big or too_old) or stat.st_size == 0:
+            return
+        root, ext = os.path.splitext(path)
+        rotated = f"{root}.{time.strftime('%Y%m%d-%H%M%S')}{ext}"
+        suffix = 1
+        while os.path.exists(rotated):
+            rotated = f"{root}.{time.strftime('%Y%m%d-%H%M%S')}-{suffix}{ext}"
+            suffix += 1
+        os.replace(path, rotated)
+        self._opened_at = None
+        self.rotations += 1
+        # Purani rotated files - sirf `backups` sabse nayi rakhni hain
+        rotated_files = sorted(glob.glob(f"{glob.escape(root)}.*{ext}"), key=os.path.getmtime)
+        for old in rotated_files[:-self.backups or None]:
+            os.remove(old)
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        data = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in batch).encode("utf-8")
+        path = self.path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._rotate_if_needed(path, len(data))
+        # O_APPEND + ek write() per batch - dusre process ki lines beech mein nahi aati
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        if self._opened_at is None:
+            self._opened_at = time.time()
+        self.written += len(batch)
+
+    async def flush(self) -> None:
+        batch = self._take()
+        if not batch:
+            return
+        try:
+            await asyncio.to_thread(self._write, batch)
+        except OSError as exc:
+            self.write_errors += 1
+            self.dropped += len(batch)
+            logger.warning("Query log write failed, dropped %s records: %s", len(batch), exc)
+
+    async def run(self) -> None:
+        """Background flush loop; cancel hone par bache records likh kar rukta hai."""
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                await self.flush()
+        finally:
+            batch = self._take()
+            if batch:
+                try:
+                    self._write(batch)
+                except OSError as exc:
+                    logger.warning("Query log final flush failed: %s", exc)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "pending": len(self._pending),
+            "max_queue": self.max_queue,
+            "written": self.written,
+            "dropped": self.dropped,
+            "rotations": self.rotations,
+            "write_errors": self.write_errors,
+        }
@@ -0,0 +1,128 @@
+"""BM25 ranked retrieval over NETWORK_KNOWLEDGE.
+
+Startup par har topic key aur answer body ko tokenize karke ek compact
+inverted index banaya jata hai. Har posting ka BM25 weight pehle se
+calculate hota hai, isliye query time par sirf query terms ki postings
+jodni padti hain - corpus size ka scan nahi hota.
+"""
+import heapq
+import math
+import re
+from array import array
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# English + Hinglish filler words jo har answer mein aate hain
+STOPWORDS = frozenset(
+    """
+    a about an and anything are as at be between by can do does explain for from how i
+    in is it me of on or please tell the there to use used vs what which why with you your
+    aur bhi hai hain hota hoti ka karna karne karta karte ke ki ko koi kuch kya liye mein se
+    """.split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens, stopwords hata kar."""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+class TopicIndex:
+    """Topic keys + answer bodies ka BM25 inverted index."""
+
+    __slots__ = ("topics", "_postings", "_key_tokens", "max_postings")
+
+    def __init__(
+        self,
+        knowledge: Dict[str, str],
+        k1: float = 1.2,
+        b: float = 0.75,
+        key_boost: int = 3,
+        max_postings: int = 256,
+    ):
+        self.topics: Tuple[str, ...] = tuple(knowledge)
+        self.max_postings = max_postings
+
+        # Term frequencies - topic key ke tokens body se zyada weight paate hain
+        doc_terms: List[Counter] = []
+        key_tokens: List[FrozenSet[str]] = []
+        for topic, body in knowledge.items():
+            terms = Counter(tokenize(body))
+            for token in tokenize(topic):
+                terms[token] += key_boost
+            doc_terms.append(terms)
+            key_tokens.append(frozenset(tokenize(topic)))
+        self._key_tokens: Tuple[FrozenSet[str], ...] = tuple(key_tokens)
+
+        lengths = [sum(terms.values()) for terms in doc_terms]
+        avg_length = (sum(lengths) / len(lengths)) if lengths else 1.0
+        total_docs = len(doc_terms)
+
+        raw: Dict[str, List[Tuple[float, int]]] = {}
+        for doc_id, terms in enumerate(doc_terms):
+            norm = k1 * (1 - b + b * lengths[doc_id] / avg_length)
+            for token, tf in terms.items():
+                raw.setdefault(token, []).append((tf * (k1 + 1) / (tf + norm), doc_id))
+
+        # Postings impact order mein (sabse bhaari pehle), arrays mein packed
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        for token, entries in raw.items():
+            idf = math.log(1 + (total_docs - len(entries) + 0.5) / (len(entries) + 0.5))
+            entries.sort(reverse=True)
+            self._postings[token] = (
+                array("I", [doc_id for _, doc_id in entries]),
+                array("f", [weight * idf for weight, _ in entries]),
+            )
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    def __contains__(self, token: str) -> bool:
+        """Token index ki vocabulary mein hai ya nahi."""
+        return token in self._postings
+
+    def _scores(self, tokens: Iterable[str]) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        get = scores.get
+        limit = self.max_postings
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            doc_ids, weights = posting
+            # Bahut common terms ki sirf top-impact postings - unka idf waise bhi kam hai
+            for doc_id, weight in zip(doc_ids[:limit], weights[:limit]):
+                scores[doc_id] = get(doc_id, 0.0) + weight
+        return scores
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[str, float]]:
+        """Query ke top-k topics (topic, score) lautata hai, best pehle."""
+        best = heapq.nlargest(k, self._scores(set(tokenize(query))).items(), key=itemgetter(1))
+        return [(self.topics[doc_id], round(score, 4)) for doc_id, score in best]
+
+    def confident(self, query: str, min_score: float, min_terms: int = 2) -> Optional[Tuple[str, float]]:
+        """Top topic sirf tab jab jawab pe bharosa ho, warna None.
+
+        Ek rare body word akela hi ~3-4 score de deta hai ("what time is it"
+        -> dhcp), isliye score ke saath yeh bhi chahiye ki top topic kam se kam
+        `min_terms` alag query terms match kare, ya koi matched term uski topic
+        key ka ho.
+        """
+        tokens = set(tokenize(query))
+        scores = self._scores(tokens)
+        if not scores:
+            return None
+        doc_id, score = max(scores.items(), key=itemgetter(1))
+        if score < min_score:
+            return None
+        limit = self.max_postings
+        matched = [
+            token for token in tokens
+            if token in self._postings and doc_id in self._postings[token][0][:limit]
+        ]
+        if len(matched) < min_terms and self._key_tokens[doc_id].isdisjoint(matched):
+            return None
+        return self.topics[doc_id], round(score, 4)
@@ -0,0 +1,197 @@
+"""Production launch mode for `python main.py`.
+
+Sab settings environment se aati hain. `WEB_CONCURRENCY` 1 ho (default) to
+pehle jaisa single-process `uvicorn.run` chalta hai. Usse zyada par ek
+pre-fork supervisor chalta hai: app aur knowledge snapshot parent mein ek
+baar ban jaate hain, listening socket parent kholta hai, aur workers
+`os.fork()` se bante hain - isliye compiled knowledge copy-on-write share
+hota hai, har worker use dobara nahi banata.
+
+Environment:
+    HOST, PORT              bind address (default 0.0.0.0:8000)
+    WEB_CONCURRENCY         worker processes (default 1)
+    UVICORN_LOOP            auto | uvloop | asyncio (auto = uvloop agar installed)
+    UVICORN_HTTP            auto | httptools | h11 (auto = httptools agar installed)
+    KEEP_ALIVE_TIMEOUT      idle keep-alive seconds (default 5)
+    BACKLOG                 listen() backlog (default 2048)
+    GRACEFUL_TIMEOUT        SIGTERM ke baad in-flight requests drain hone ka time (default 30)
+    LIMIT_CONCURRENCY       per-worker max concurrent connections (optional, 503 beyond)
+    WS_MAX_SIZE             /ws frame ka max size bytes (default 65536)
+    WS_PING_INTERVAL        /ws protocol pings seconds - mare hue clients pakadne ke liye (default 20)
+"""
+import gc
+import importlib.util
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Any, Dict, Optional
+
+import uvicorn
+
+logger = logging.getLogger("netpath.server")
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def _optional_int(value: Optional[str]) -> Optional[int]:
+    return int(value) if value else None
+
+
+def settings_from_env(environ: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    env = os.environ if environ is None else environ
+    loop = env.get("UVICORN_LOOP", "auto")
+    http = env.get("UVICORN_HTTP", "auto")
+    return {
+        "host": env.get("HOST", "0.0.0.0"),
+        "port": int(env.get("PORT", 8000)),
+        "workers": max(1, int(env.get("WEB_CONCURRENCY", 1))),
+        "loop": ("uvloop" if _installed("uvloop") else "asyncio") if loop == "auto" else loop,
+        "http": ("httptools" if _installed("httptools") else "h11") if http == "auto" else http,
+        "timeout_keep_alive": int(env.get("KEEP_ALIVE_TIMEOUT", 5)),
+        "backlog": int(env.get("BACKLOG", 2048)),
+        "timeout_graceful_shutdown": int(env.get("GRACEFUL_TIMEOUT", 30)),
+        "limit_concurrency": _optional_int(env.get("LIMIT_CONCURRENCY")),
+        "ws_max_size": int(env.get("WS_MAX_SIZE", 65536)),
+        "ws_ping_interval": float(env.get("WS_PING_INTERVAL", 20)),
+    }
+
+
+def _bind(host: str, port: int, backlog: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _worker(app: Any, sock: socket.socket, settings: Dict[str, Any]) -> None:
+    """Forked child - parent ke signal handlers hata kar uvicorn chalata hai."""
+    for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+        signal.signal(signum, signal.SIG_DFL)
+    config = uvicorn.Config(
+        app,
+        loop=settings["loop"],
+        http=settings["http"],
+        timeout_keep_alive=settings["timeout_keep_alive"],
+        timeout_graceful_shutdown=settings["timeout_graceful_shutdown"],
+        limit_concurrency=settings["limit_concurrency"],
+        ws_max_size=settings["ws_max_size"],
+        ws_ping_interval=settings["ws_ping_interval"],
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class PreforkSupervisor:
+    """Workers fork karta hai, crash hone par dobara banata hai, SIGTERM par drain karta hai."""
+
+    def __init__(self, app: Any, settings: Dict[str, Any]):
+        self.app = app
+        self.settings = settings
+        self.children: Dict[int, float] = {}
+        self.stopping = False
+        self.sock: Optional[socket.socket] = None
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                _worker(self.app, self.sock, self.settings)
+            except BaseException:
+                logger.exception("Worker crashed")
+                code = 1
+            finally:
+                os._exit(code)
+        self.children[pid] = time.monotonic()
+
+    def _handle_stop(self, signum, frame) -> None:
+        self.stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _reap(self, block: bool = False) -> None:
+        flags = 0 if block else os.WNOHANG
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, flags)
+            except ChildProcessError:
+                self.children.clear()
+                return
+            if pid == 0:
+                return
+            flags = os.WNOHANG
+            started = self.children.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+            logger.warning("Worker %s exited with status %s, restarting", pid, status)
+            # Turant crash hone wale worker ke liye chhota backoff
+            if time.monotonic() - started < 1:
+                time.sleep(1)
+            self._spawn()
+
+    def run(self) -> None:
+        settings = self.settings
+        self.sock = _bind(settings["host"], settings["port"], settings["backlog"])
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+
+        # Fork se pehle ki saari objects permanent generation mein - GC unhe
+        # chhuega nahi, isliye copy-on-write pages share rehte hain
+        gc.collect()
+        gc.freeze()
+
+        logger.info(
+            "Starting %s workers on %s:%s (loop=%s, http=%s)",
+            settings["workers"], settings["host"], settings["port"], settings["loop"], settings["http"],
+        )
+        for _ in range(settings["workers"]):
+            self._spawn()
+
+        while self.children and not self.stopping:
+            self._reap()
+            time.sleep(0.2)
+
+        # Drain: workers ko GRACEFUL_TIMEOUT (+ thoda) milta hai, phir SIGKILL
+        deadline = time.monotonic() + settings["timeout_graceful_shutdown"] + 5
+        while self.children and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+        for pid in list(self.children):
+            logger.warning("Worker %s did not drain in time, killing", pid)
+            os.kill(pid, signal.SIGKILL)
+        self._reap(block=True)
+        self.sock.close()
+
+
+def run(app: Any, environ: Optional[Dict[str, str]] = None) -> None:
+    """Environment ke hisaab se single-process ya pre-fork mode mein app chalata hai."""
+    settings = settings_from_env(environ)
+    if settings["workers"] == 1:
+        uvicorn.run(
+            app,
+            host=settings["host"],
+            port=settings["port"],
+            loop=settings["loop"],
+            http=settings["http"],
+            timeout_keep_alive=settings["timeout_keep_alive"],
+            backlog=settings["backlog"],
+            timeout_graceful_shutdown=settings["timeout_graceful_shutdown"],
+            limit_concurrency=settings["limit_concurrency"],
+            ws_max_size=settings["ws_max_size"],
+            ws_ping_interval=settings["ws_ping_interval"],
+        )
+        return
+    if not hasattr(os, "fork"):
+        sys.exit("WEB_CONCURRENCY > 1 needs os.fork (Linux/macOS)")
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:     %(message)s")
+    PreforkSupervisor(app, settings).run()
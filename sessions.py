@@ -0,0 +1,348 @@
+"""Follow-up sawalon ke liye per-session recent topics.
+
+`/ask` stateless hai, isliye BGP ke baad "what port does it use?" seedha
+`help` par gir jata tha. Ab request ke saath optional `session_id` aata hai
+aur store us session ke haal ke topics yaad rakhta hai. Chhota sawal jisme
+"it" / "iska" / "uska" jaisa reference word ho aur koi direct/keyword topic
+na mile, woh session ke latest topic par resolve hota hai - fuzzy aur BM25
+matching dobara nahi chalti.
+
+Do stores hain, dono ka interface ek hi:
+
+* `MemorySessionStore` - process ke andar; `__slots__` wale records, LRU
+  order, sliding TTL aur ek strict global memory cap (bytes). Idle sessions
+  TTL par sweep hote hain, isliye 100k idle sessions par bhi memory cap ke
+  neeche flat rehti hai.
+* `SqliteSessionStore` - WEB_CONCURRENCY > 1 par workers ke beech shared
+  local key-value stand-in (WAL mode SQLite file); production mein isi
+  interface ke peeche Redis/memcached aa sakta hai. Uski blocking calls ek
+  dedicated thread par chalti hain, aur DB error par sawal bina history ke
+  (stateless) answer hota hai, 500 nahi.
+
+Request handlers `*_async` methods use karte hain; sync methods store ke
+andar aur benchmarks ke liye hain.
+
+Environment:
+    SESSION_STORE         "memory" (default), "sqlite:PATH" ya "off"
+    SESSION_TTL           idle session kitne second zinda rahe (default 1800)
+    SESSION_MAX_BYTES     memory store ka cap (default 32 MB)
+    SESSION_MAX_SESSIONS  sqlite store ka cap (default 1000000)
+"""
+import abc
+import asyncio
+import logging
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger("netpath.sessions")
+
+# Session ke recent topic se resolve hua answer
+MATCH_FOLLOWUP = "followup"
+
+MAX_SESSION_ID_LENGTH = 64
+MAX_FOLLOWUP_WORDS = 8
+# Ek sweep step mein itne sessions; beech mein event loop doosre requests chalata hai
+SWEEP_BATCH = 2048
+
+# Pichle topic ki taraf ishara karne wale words (English + Hinglish)
+REFERENCE_WORDS = frozenset({
+    "it", "its", "this", "that", "these", "those", "they", "them", "their",
+    "iska", "iske", "iski", "isko", "ise", "isme", "isse",
+    "uska", "uske", "uski", "usko", "usme", "usse",
+    "ye", "yeh", "woh", "wo", "vo",
+})
+
+
+def is_followup(question_lower: str) -> bool:
+    """Normalized sawal chhota hai aur pichle topic ka reference deta hai?"""
+    words = question_lower.split()
+    return len(words) <= MAX_FOLLOWUP_WORDS and any(word in REFERENCE_WORDS for word in words)
+
+
+class SessionStore(abc.ABC):
+    """Session stores ka interface; subclass `recent`, `remember`, `sweep` likhti hai.
+
+    `*_async` wrappers event loop se bulaye jaate hain - default mein seedhe
+    sync method (in-memory store block nahi karta); blocking stores inhe
+    override karte hain.
+    """
+
+    def __init__(self, ttl: float = 1800.0, max_topics: int = 3):
+        self.ttl = ttl
+        self.max_topics = max_topics
+        self.followups = 0
+
+    @abc.abstractmethod
+    def recent(self, session_id: str) -> Tuple[str, ...]:
+        """Session ke recent topics, naya pehle (na ho / expire ho to khali)."""
+
+    @abc.abstractmethod
+    def remember(self, session_id: str, topic: str) -> None:
+        """Topic ko session ka latest banata hai aur TTL aage badhata hai."""
+
+    @abc.abstractmethod
+    def sweep(self, limit: Optional[int] = None) -> int:
+        """Zyada se zyada `limit` expired (ya cap se upar) sessions hatata hai; kitne hate."""
+
+    async def recent_async(self, session_id: str) -> Tuple[str, ...]:
+        return self.recent(session_id)
+
+    async def remember_async(self, session_id: str, topic: str) -> None:
+        self.remember(session_id, topic)
+
+    async def sweep_async(self, limit: Optional[int] = None) -> int:
+        return self.sweep(limit)
+
+    def _push(self, topics: Tuple[str, ...], topic: str) -> Tuple[str, ...]:
+        if topics and topics[0] == topic:
+            return topics
+        return (topic, *(existing for existing in topics if existing != topic))[:self.max_topics]
+
+    async def run(self, interval: float) -> None:
+        """Background sweep - idle sessions TTL ke baad memory/disk chhod dete hain."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                while await self.sweep_async(SWEEP_BATCH) == SWEEP_BATCH:
+                    await asyncio.sleep(0)
+            except Exception:
+                logger.exception("Session sweep failed")
+
+    def describe(self) -> Dict[str, Any]:
+        return {"backend": type(self).__name__, "ttl_s": self.ttl, "followups": self.followups}
+
+
+class SessionRecord:
+    """Ek session - sirf topics tuple (snapshot ke shared topic strings) aur expiry."""
+
+    __slots__ = ("topics", "expires_at")
+
+    def __init__(self, topics: Tuple[str, ...], expires_at: float):
+        self.topics = topics
+        self.expires_at = expires_at
+
+
+class MemorySessionStore(SessionStore):
+    """In-process LRU + sliding TTL + global byte cap.
+
+    Har touch par record LRU ke end mein jata hai aur expiry aage badhti hai,
+    isliye LRU order hi expiry order hai - sweep sirf aage se expired records
+    nikalta hai. Byte cap per-entry estimate (`entry_bytes`) par hai: record,
+    topics tuple, session id string aur dict/LRU bookkeeping - tracemalloc se
+    milaya hua (benchmarks/bench_sessions.py), cap par asli memory ~1% ke andar.
+    """
+
+    # OrderedDict ki per-entry bookkeeping - hash table slot + linked list node,
+    # aur table ka khali hissa (load factor <= 2/3; churn par table chhoti nahi hoti)
+    DICT_ENTRY_BYTES = 168
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, ttl: float = 1800.0, max_topics: int = 3):
+        super().__init__(ttl, max_topics)
+        self.max_bytes = max_bytes
+        self._sessions: "OrderedDict[str, SessionRecord]" = OrderedDict()
+        self._fixed_bytes = (
+            sys.getsizeof(SessionRecord((), 0.0))
+            + sys.getsizeof(tuple(range(max_topics)))
+            + self.DICT_ENTRY_BYTES
+        )
+        self.used_bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def entry_bytes(self, session_id: str) -> int:
+        return self._fixed_bytes + sys.getsizeof(session_id)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def recent(self, session_id: str) -> Tuple[str, ...]:
+        record = self._sessions.get(session_id)
+        if record is None:
+            return ()
+        if record.expires_at <= time.monotonic():
+            self._drop(session_id)
+            self.expirations += 1
+            return ()
+        return record.topics
+
+    def remember(self, session_id: str, topic: str) -> None:
+        expires_at = time.monotonic() + self.ttl
+        record = self._sessions.get(session_id)
+        if record is not None:
+            record.topics = self._push(record.topics, topic)
+            record.expires_at = expires_at
+            self._sessions.move_to_end(session_id)
+            return
+        self._sessions[session_id] = SessionRecord((topic,), expires_at)
+        self.used_bytes += self.entry_bytes(session_id)
+        while self.used_bytes > self.max_bytes and self._sessions:
+            oldest = next(iter(self._sessions))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def _drop(self, session_id: str) -> None:
+        del self._sessions[session_id]
+        self.used_bytes -= self.entry_bytes(session_id)
+
+    def sweep(self, limit: Optional[int] = None) -> int:
+        now = time.monotonic()
+        removed = 0
+        for record in self._sessions.values():
+            if record.expires_at > now or removed == limit:
+                break
+            removed += 1
+        for _ in range(removed):
+            session_id, _ = self._sessions.popitem(last=False)
+            self.used_bytes -= self.entry_bytes(session_id)
+        self.expirations += removed
+        return removed
+
+    def describe(self) -> Dict[str, Any]:
+        info = super().describe()
+        info.update(
+            sessions=len(self._sessions),
+            used_bytes=self.used_bytes,
+            max_bytes=self.max_bytes,
+            evictions=self.evictions,
+            expirations=self.expirations,
+        )
+        return info
+
+
+class SqliteSessionStore(SessionStore):
+    """Workers ke beech shared sessions ek local SQLite file mein (WAL, bina fsync).
+
+    Connection har process mein fork ke baad lazily khulta hai. Expiry
+    column sliding TTL hai, isliye cap se upar "sabse pehle expire hone
+    wale" hatana hi LRU eviction hai. Async calls ek single-thread executor
+    par serialize hoti hain (busy DB par `timeout` tak ruk sakti hain -
+    event loop par nahi).
+    """
+
+    def __init__(self, path: str, ttl: float = 1800.0, max_sessions: int = 1_000_000, max_topics: int = 3):
+        super().__init__(ttl, max_topics)
+        self.path = path
+        self.max_sessions = max_sessions
+        self._connection: Optional["sqlite3.Connection"] = None
+        self._pid: Optional[int] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_pid: Optional[int] = None
+        self.evictions = 0
+        self.expirations = 0
+        self.errors = 0
+
+    @property
+    def connection(self) -> "sqlite3.Connection":
+        if self._connection is None or self._pid != os.getpid():
+            import sqlite3
+
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # check_same_thread=False: executor ka thread use karta hai, ek waqt mein ek hi
+            connection = sqlite3.connect(self.path, isolation_level=None, timeout=1.0, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sessions "
+                "(id TEXT PRIMARY KEY, topics TEXT NOT NULL, expires_at REAL NOT NULL) WITHOUT ROWID"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS sessions_expiry ON sessions (expires_at)")
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    async def _in_thread(self, function, *args):
+        if self._executor is None or self._executor_pid != os.getpid():
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="netpath-sessions")
+            self._executor_pid = os.getpid()
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    async def recent_async(self, session_id: str) -> Tuple[str, ...]:
+        import sqlite3
+
+        try:
+            return await self._in_thread(self.recent, session_id)
+        except sqlite3.Error as exc:
+            self.errors += 1
+            logger.warning("Session lookup failed, answering without history: %s", exc)
+            return ()
+
+    async def remember_async(self, session_id: str, topic: str) -> None:
+        import sqlite3
+
+        try:
+            await self._in_thread(self.remember, session_id, topic)
+        except sqlite3.Error as exc:
+            self.errors += 1
+            logger.warning("Session update failed, topic not remembered: %s", exc)
+
+    async def sweep_async(self, limit: Optional[int] = None) -> int:
+        return await self._in_thread(self.sweep, limit)
+
+    def recent(self, session_id: str) -> Tuple[str, ...]:
+        # Wall clock - monotonic clock processes ke beech comparable nahi hai
+        row = self.connection.execute(
+            "SELECT topics FROM sessions WHERE id = ? AND expires_at > ?", (session_id, time.time())
+        ).fetchone()
+        return tuple(row[0].split("\n")) if row else ()
+
+    def remember(self, session_id: str, topic: str) -> None:
+        topics = self._push(self.recent(session_id), topic)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO sessions (id, topics, expires_at) VALUES (?, ?, ?)",
+            (session_id, "\n".join(topics), time.time() + self.ttl),
+        )
+
+    def sweep(self, limit: Optional[int] = None) -> int:
+        connection = self.connection
+        limit = -1 if limit is None else limit  # SQLite mein LIMIT -1 = koi limit nahi
+        removed = connection.execute(
+            "DELETE FROM sessions WHERE id IN (SELECT id FROM sessions WHERE expires_at <= ? LIMIT ?)",
+            (time.time(), limit),
+        ).rowcount
+        self.expirations += removed
+        if removed == limit:
+            return removed
+        (count,) = connection.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        if count > self.max_sessions:
+            excess = count - self.max_sessions
+            evicted = connection.execute(
+                "DELETE FROM sessions WHERE id IN "
+                "(SELECT id FROM sessions ORDER BY expires_at LIMIT ?)",
+                (excess if limit < 0 else min(excess, limit - removed),),
+            ).rowcount
+            self.evictions += evicted
+            removed += evicted
+        return removed
+
+    def describe(self) -> Dict[str, Any]:
+        info = super().describe()
+        info.update(
+            path=self.path,
+            max_sessions=self.max_sessions,
+            evictions=self.evictions,
+            expirations=self.expirations,
+            errors=self.errors,
+        )
+        return info
+
+
+def store_from_env(environ: Mapping[str, str]) -> Optional[SessionStore]:
+    """SESSION_* se store; "off" par None (follow-ups band)."""
+    spec = environ.get("SESSION_STORE", "memory")
+    ttl = float(environ.get("SESSION_TTL", 1800))
+    if spec == "off":
+        return None
+    if spec == "memory":
+        return MemorySessionStore(int(environ.get("SESSION_MAX_BYTES", 32 * 1024 * 1024)), ttl)
+    if spec.startswith("sqlite:"):
+        return SqliteSessionStore(spec[len("sqlite:"):], ttl, int(environ.get("SESSION_MAX_SESSIONS", 1_000_000)))
+    raise ValueError(f"Unknown SESSION_STORE {spec!r} (expected memory, sqlite:PATH or off)")
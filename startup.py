@@ -0,0 +1,75 @@
+"""Cold start ka hisaab - interpreter, imports aur init phases ka time.
+
+Scale-to-zero host par pehla /ask wahi user dekhta hai jiske liye process
+abhi utha hai. `main.py` sabse pehle yahi module import karta hai, har
+phase ke end par `mark()` karta hai, aur pehla answer jaate hi
+`answered()`. Report /health mein aur startup log mein aata hai.
+"""
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("netpath.startup")
+
+# Optional heavy modules jo ab pehli zaroorat par hi import hote hain
+LAZY_MODULES = ("numpy", "httpx", "sqlite3")
+
+
+def process_age() -> Optional[float]:
+    """Process start se ab tak ke seconds (Linux /proc), warna None."""
+    try:
+        with open("/proc/self/stat") as handle:
+            start_ticks = int(handle.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as handle:
+            uptime = float(handle.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+
+
+class StartupReport:
+    """Phases sequential hain - har `mark(name)` pichle mark se ab tak ka time leta hai."""
+
+    def __init__(self):
+        # Interpreter boot + site imports (main import hone se pehle ka time)
+        self.interpreter = process_age()
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases: List[Tuple[str, float]] = []
+        self.ready_at: Optional[float] = None
+        self.first_answer_at: Optional[float] = None
+
+    def mark(self, name: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    def ready(self) -> None:
+        """Lifespan startup khatam - server requests le sakta hai."""
+        self.mark("lifespan")
+        self.ready_at = self._last
+        logger.info("Startup report: %s", self.summary())
+
+    def answered(self) -> None:
+        if self.first_answer_at is None:
+            self.first_answer_at = time.perf_counter()
+
+    def summary(self) -> str:
+        parts = [f"{name}={seconds * 1000:.1f}ms" for name, seconds in self.phases]
+        if self.interpreter is not None:
+            parts.insert(0, f"interpreter={self.interpreter * 1000:.0f}ms")
+        return " ".join(parts)
+
+    def describe(self) -> Dict[str, Any]:
+        def since_start(moment: Optional[float]) -> Optional[float]:
+            return round((moment - self.started) * 1000, 2) if moment is not None else None
+
+        return {
+            "interpreter_ms": round(self.interpreter * 1000, 1) if self.interpreter is not None else None,
+            "phases_ms": {name: round(seconds * 1000, 2) for name, seconds in self.phases},
+            "ready_ms": since_start(self.ready_at),
+            "first_answer_ms": since_start(self.first_answer_at),
+            "lazy_modules_loaded": [name for name in LAZY_MODULES if name in sys.modules],
+        }
@@ -0,0 +1,117 @@
+"""Chat UI page aur static/ assets ki cacheable delivery.
+
+UI page startup par ek baar encode hota hai aur gzip/brotli variants ke saath
+memory mein rakha jata hai. Har request par sirf Accept-Encoding aur
+If-None-Match dekh kar sahi variant bheja jata hai.
+"""
+import gzip
+import hashlib
+import re
+from typing import Dict, List, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # brotli optional hai, na ho to sirf gzip
+    brotli = None
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Content hash wala filename ("app.3f9a1c2e.js") - content badle to URL bhi badalta hai
+_FINGERPRINT_RE = re.compile(r"\.[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+
+
+def _accepted_encodings(header: str) -> Dict[str, float]:
+    """Accept-Encoding header ko {encoding: q} mein parse karta hai."""
+    accepted: Dict[str, float] = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag or tag == "*":
+            return True
+    return False
+
+
+class PrecompressedPage:
+    """Ek HTML page ke identity/gzip/br variants aur content-hash ETag."""
+
+    def __init__(self, html: str, media_type: str = "text/html; charset=utf-8"):
+        body = html.encode("utf-8")
+        self.media_type = media_type
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:20] + '"'
+        # Preference order: sabse chhota variant pehle
+        self.variants: List[Tuple[str, bytes]] = []
+        if brotli is not None:
+            self.variants.append(("br", brotli.compress(body, quality=11)))
+        self.variants.append(("gzip", gzip.compress(body, compresslevel=9, mtime=0)))
+        self.variants.append(("identity", body))
+
+    def select(self, accept_encoding: str) -> Tuple[str, bytes]:
+        accepted = _accepted_encodings(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        for encoding, body in self.variants:
+            if encoding == "identity":
+                break
+            if accepted.get(encoding, wildcard) > 0:
+                return encoding, body
+        return self.variants[-1]
+
+    def response(self, request: Request) -> Response:
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if _etag_matches(request.headers.get("if-none-match", ""), self.etag):
+            return Response(status_code=304, headers=headers)
+        encoding, body = self.select(request.headers.get("accept-encoding", ""))
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type=self.media_type, headers=headers)
+
+    def sizes(self) -> Dict[str, int]:
+        return {encoding: len(body) for encoding, body in self.variants}
+
+
+class FingerprintedStaticFiles(StaticFiles):
+    """static/ ke non-HTML assets.
+
+    Fingerprinted filenames (`name.<hex hash>.ext`) ko saal bhar ka immutable
+    caching milta hai. Baaki URLs content badalne par bhi wahi rehte hain, isliye
+    unpar `no-cache` hai - browser har baar ETag / Last-Modified se revalidate
+    karta hai aur unchanged file par sirf 304 aata hai. HTML yahan se serve
+    nahi hota - UI page `/` par PrecompressedPage se aata hai.
+    """
+
+    def file_response(self, full_path, stat_result, scope: Scope, status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if _FINGERPRINT_RE.search(str(full_path)):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if path.lower().endswith((".html", ".htm")):
+            return Response(status_code=404)
+        return await super().get_response(path, scope)
@@ -0,0 +1,436 @@
+"""Subnet calculator engine for /subnet aur /subnet/batch.
+
+Sab kuch integers par chalta hai, per-address `ipaddress` objects nahi bante.
+IPv4 poore array par ek saath NumPy se hota hai: CIDR strings ek buffer mein
+jud kar vectorized parse hoti hain (digits -> octets), aur network, broadcast,
+host range, VLSM allocation aur summarization uint32/uint64 array operations
+hain. IPv6 128-bit hai (NumPy ke integers mein nahi aata), isliye uska path
+Python ke arbitrary-precision ints par wahi maths karta hai.
+"""
+import ipaddress
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+IPV4_BITS = 32
+IPV6_BITS = 128
+# /subnet?split= ka ek row ~300 bytes JSON hai - 4096 subnets ~1.2 MB response
+MAX_SPLIT_SUBNETS = 4096
+
+# Har describe result ke fields, isi order mein
+COLUMNS = (
+    "cidr", "version", "prefix", "network", "broadcast", "netmask", "wildcard",
+    "first_host", "last_host", "usable_hosts", "total_addresses",
+)
+
+_OCTETS = tuple(str(value) for value in range(256))
+# Har octet ke ASCII digits, 3 bytes tak NUL se padded (format_ipv4 ke liye)
+_OCTET_BYTES = np.zeros((256, 3), dtype=np.uint8)
+for _value, _text in enumerate(_OCTETS):
+    _OCTET_BYTES[_value, :len(_text)] = np.frombuffer(_text.encode("ascii"), dtype=np.uint8)
+del _value, _text
+# Sirf 33 IPv4 masks hain - prefix se seedha lookup
+_NETMASKS = np.array(
+    [".".join(_OCTETS[((0xFFFFFFFF << (IPV4_BITS - p)) >> s) & 255] for s in (24, 16, 8, 0)) for p in range(33)],
+    dtype=object,
+)
+_WILDCARDS = np.array(
+    [".".join(_OCTETS[(((1 << (IPV4_BITS - p)) - 1) >> s) & 255] for s in (24, 16, 8, 0)) for p in range(33)],
+    dtype=object,
+)
+_SEPARATORS = np.frombuffer(b".../\n", dtype=np.uint8)
+_POW10 = np.array([1, 10, 100], dtype=np.int64)
+_SHIFTS = np.array([24, 16, 8, 0], dtype=np.uint32)
+# Mixed batch mein vectorized path ke candidates ("a.b.c.d/p" ka shape)
+_IPV4_CIDR_RE = re.compile(r"[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}/[0-9]{1,2}\Z")
+# Sirf ASCII digits, leading zero nahi - str.isdigit() "²" / "٣" bhi maan leta hai
+_PREFIX_RE = re.compile(r"(?:0|[1-9][0-9]{0,2})\Z")
+
+
+class SubnetError(ValueError):
+    """CIDR ya request galat hai (message client ko dikhaya jata hai)."""
+
+
+# --- IPv4, vectorized ---------------------------------------------------------
+
+def _parse_ipv4_bulk(cidrs: Sequence[str]) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Saare items "a.b.c.d/p" ke shape mein hon to (addresses uint32, prefixes, valid), warna None.
+
+    `valid` row-wise mask hai: octet > 255, prefix > 32, 4+ digits ya leading
+    zero ("010") wali rows False hain - unhe caller scalar path par bhejta hai
+    (wahan sahi error message banta hai). None tab jab shape hi alag ho (IPv6,
+    bina prefix ke address, extra characters).
+    """
+    count = len(cidrs)
+    try:
+        data = np.frombuffer(("\n".join(cidrs) + "\n").encode("ascii"), dtype=np.uint8)
+    except UnicodeEncodeError:
+        return None
+    digits = (data >= 48) & (data <= 57)
+    separators = data[~digits]
+    if separators.size != 5 * count or not np.array_equal(
+        separators.reshape(count, 5), np.broadcast_to(_SEPARATORS, (count, 5))
+    ):
+        return None
+
+    # Har number ke digits ka contiguous run; Horner ki jagah 10^position ka reduceat
+    positions = np.flatnonzero(digits)
+    previous = np.zeros_like(digits)
+    previous[1:] = digits[:-1]
+    token_starts = np.searchsorted(positions, np.flatnonzero(digits & ~previous))
+    if token_starts.size != 5 * count:
+        return None
+    lengths = np.diff(np.append(token_starts, positions.size))
+    bad_tokens = (lengths > 3) | ((lengths > 1) & (data[positions[token_starts]] == 48))
+    exponents = np.repeat(token_starts + lengths, lengths) - 1 - np.arange(positions.size)
+    values = (data[positions] - 48).astype(np.int64) * _POW10[np.minimum(exponents, 2)]
+    numbers = np.add.reduceat(values, token_starts).reshape(count, 5)
+
+    octets, prefixes = numbers[:, :4], numbers[:, 4]
+    valid = ~bad_tokens.reshape(count, 5).any(axis=1) & (octets.max(axis=1) <= 255) & (prefixes <= IPV4_BITS)
+    addresses = (octets << _SHIFTS.astype(np.int64)).sum(axis=1).astype(np.uint32)
+    return addresses, np.where(valid, prefixes, 0).astype(np.int64), valid
+
+
+def format_ipv4(addresses: np.ndarray, prefixes: Optional[np.ndarray] = None) -> List[str]:
+    """uint32 array -> dotted-quad strings (`prefixes` do to "a.b.c.d/p").
+
+    Har address ek fixed-width byte row mein likha jata hai (padding NUL),
+    phir ek hi decode + split - per-address Python formatting nahi.
+    """
+    octets = (addresses.astype(np.uint32)[:, None] >> _SHIFTS) & 255
+    digits = _OCTET_BYTES[octets]
+    width = 16 if prefixes is None else 19
+    rows = np.zeros((len(addresses), width), dtype=np.uint8)
+    for index in range(4):
+        rows[:, index * 4:index * 4 + 3] = digits[:, index]
+    rows[:, 3:12:4] = ord(".")
+    if prefixes is not None:
+        rows[:, 15] = ord("/")
+        rows[:, 16:18] = _OCTET_BYTES[prefixes, :2]
+    rows[:, width - 1] = ord("\n")
+    text = rows.tobytes().replace(b"\0", b"").decode("ascii")
+    return text.split("\n")[:-1]
+
+
+def _ipv4_ranges(addresses: np.ndarray, prefixes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(network, block size) dono uint64 mein - /0 ka size 2**32 bhi fit hota hai."""
+    sizes = np.left_shift(np.uint64(1), (IPV4_BITS - prefixes).astype(np.uint64))
+    networks = addresses.astype(np.uint64) & ~(sizes - np.uint64(1)) & np.uint64(0xFFFFFFFF)
+    return networks, sizes
+
+
+def _ipv4_columns(addresses: np.ndarray, prefixes: np.ndarray) -> Dict[str, List[Any]]:
+    networks, sizes = _ipv4_ranges(addresses, prefixes)
+    broadcasts = networks + sizes - np.uint64(1)
+    point_to_point = prefixes >= 31  # /31 (RFC 3021) aur /32 mein network/broadcast reserve nahi
+    first_hosts = np.where(point_to_point, networks, networks + np.uint64(1))
+    last_hosts = np.where(point_to_point, broadcasts, broadcasts - np.uint64(1))
+    usable = np.where(point_to_point, sizes, sizes - np.uint64(2))
+
+    prefix_list = prefixes.tolist()
+    return {
+        "cidr": format_ipv4(networks, prefixes),
+        "version": [4] * len(prefix_list),
+        "prefix": prefix_list,
+        "network": format_ipv4(networks),
+        "broadcast": format_ipv4(broadcasts),
+        "netmask": _NETMASKS[prefixes].tolist(),
+        "wildcard": _WILDCARDS[prefixes].tolist(),
+        "first_host": format_ipv4(first_hosts),
+        "last_host": format_ipv4(last_hosts),
+        "usable_hosts": usable.tolist(),
+        "total_addresses": sizes.tolist(),
+    }
+
+
+# --- Scalar path (IPv6 + har galat/alag item) ---------------------------------
+
+def parse_cidr(text: str) -> Tuple[int, int, int]:
+    """"addr/prefix" (ya sirf addr = host route) -> (version, address int, prefix)."""
+    if not isinstance(text, str):
+        raise SubnetError("CIDR must be a string")
+    text = text.strip()
+    address, slash, prefix = text.partition("/")
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        raise SubnetError(f"{text!r} is not a valid IPv4/IPv6 address") from None
+    bits = ip.max_prefixlen
+    if not slash:
+        return ip.version, int(ip), bits
+    if _PREFIX_RE.match(prefix) is None or int(prefix) > bits:
+        raise SubnetError(f"{text!r}: prefix length must be 0-{bits}")
+    return ip.version, int(ip), int(prefix)
+
+
+def _format(version: int, address: int) -> str:
+    if version == 4:
+        return ".".join(_OCTETS[(address >> shift) & 255] for shift in (24, 16, 8, 0))
+    return ipaddress.IPv6Address(address).compressed
+
+
+def _describe_scalar(version: int, address: int, prefix: int) -> Dict[str, Any]:
+    bits = IPV4_BITS if version == 4 else IPV6_BITS
+    size = 1 << (bits - prefix)
+    network = address & ~(size - 1)
+    last = network + size - 1
+    if version == 6:
+        # IPv6 mein broadcast nahi hota; poora block usable hai
+        first_host, last_host, usable, broadcast, netmask, wildcard = network, last, size, None, None, None
+    else:
+        point_to_point = prefix >= 31
+        first_host = network if point_to_point else network + 1
+        last_host = last if point_to_point else last - 1
+        usable = size if point_to_point else size - 2
+        broadcast = _format(4, last)
+        netmask = _format(4, 0xFFFFFFFF ^ (size - 1))
+        wildcard = _format(4, size - 1)
+    return {
+        "cidr": f"{_format(version, network)}/{prefix}",
+        "version": version,
+        "prefix": prefix,
+        "network": _format(version, network),
+        "broadcast": broadcast,
+        "netmask": netmask,
+        "wildcard": wildcard,
+        "first_host": _format(version, first_host),
+        "last_host": _format(version, last_host),
+        "usable_hosts": usable,
+        "total_addresses": size,
+    }
+
+
+# --- Public API ---------------------------------------------------------------
+
+def describe(cidr: str) -> Dict[str, Any]:
+    """Ek CIDR ka network, broadcast, mask, host range aur host count."""
+    return _describe_scalar(*parse_cidr(cidr))
+
+
+def describe_many(cidrs: Sequence[str]) -> Tuple[Dict[str, List[Any]], List[Tuple[int, str]]]:
+    """Bahut saare CIDRs - (columns, errors). Galat items ki columns mein None."""
+    if not cidrs:
+        return {name: [] for name in COLUMNS}, []
+    bulk = _parse_ipv4_bulk(cidrs) if all(isinstance(cidr, str) for cidr in cidrs) else None
+    if bulk is not None and bulk[2].all():
+        return _ipv4_columns(bulk[0], bulk[1]), []
+
+    # Mixed batch: "a.b.c.d/p" rows phir bhi ek saath vectorized, sirf baaki
+    # (IPv6, galat input, whitespace) scalar path par
+    if bulk is not None:
+        vector_rows = np.arange(len(cidrs))
+    else:
+        vector_rows = np.array(
+            [row for row, cidr in enumerate(cidrs) if isinstance(cidr, str) and _IPV4_CIDR_RE.match(cidr)],
+            dtype=np.int64,
+        )
+        bulk = _parse_ipv4_bulk([cidrs[row] for row in vector_rows]) if vector_rows.size else None
+    columns_array = {name: np.full(len(cidrs), None, dtype=object) for name in COLUMNS}
+    scalar = np.ones(len(cidrs), dtype=bool)
+    if bulk is not None:
+        addresses, prefixes, valid = bulk
+        rows = vector_rows[valid]
+        scalar[rows] = False
+        for name, values in _ipv4_columns(addresses[valid], prefixes[valid]).items():
+            columns_array[name][rows] = values
+
+    columns = {name: values.tolist() for name, values in columns_array.items()}
+    errors: List[Tuple[int, str]] = []
+    for row in np.flatnonzero(scalar).tolist():
+        try:
+            described = _describe_scalar(*parse_cidr(cidrs[row]))
+        except SubnetError as exc:
+            errors.append((row, str(exc)))
+            continue
+        for name, value in described.items():
+            columns[name][row] = value
+    return columns, errors
+
+
+def split(cidr: str, new_prefix: int) -> List[Dict[str, Any]]:
+    """CIDR ko `new_prefix` ke barabar subnets mein todta hai ("/22 -> /26")."""
+    version, address, prefix = parse_cidr(cidr)
+    bits = IPV4_BITS if version == 4 else IPV6_BITS
+    if not prefix <= new_prefix <= bits:
+        raise SubnetError(f"split prefix must be between /{prefix} and /{bits}")
+    count = 1 << (new_prefix - prefix)
+    if count > MAX_SPLIT_SUBNETS:
+        raise SubnetError(f"/{prefix} into /{new_prefix} gives {count} subnets (max {MAX_SPLIT_SUBNETS})")
+    size = 1 << (bits - new_prefix)
+    network = address & ~((1 << (bits - prefix)) - 1)
+    if version == 6:
+        return [_describe_scalar(6, network + index * size, new_prefix) for index in range(count)]
+    starts = np.uint64(network) + np.arange(count, dtype=np.uint64) * np.uint64(size)
+    columns = _ipv4_columns(starts, np.full(count, new_prefix, dtype=np.int64))
+    return rows_from_columns(columns)
+
+
+def _block_bits(hosts: np.ndarray) -> np.ndarray:
+    """Itne hosts + network + broadcast ke liye sabse chhote power-of-two block ke host bits."""
+    _, exponents = np.frexp((hosts + 1).astype(np.float64))
+    return exponents.astype(np.int64)
+
+
+def allocate_vlsm(cidr: str, requirements: Sequence[Tuple[str, int]]) -> Dict[str, Any]:
+    """VLSM: sabse bade requirement se shuru karke parent network mein aligned blocks.
+
+    IPv4 mein har block ko hosts + 2 (network, broadcast) chahiye; IPv6 mein
+    poora block usable hai. Blocks size ke ghatte order mein lagate hain, isliye
+    har offset apne size ka multiple rehta hai aur alag alignment check nahi chahiye.
+    """
+    version, address, prefix = parse_cidr(cidr)
+    bits = IPV4_BITS if version == 4 else IPV6_BITS
+    parent_size = 1 << (bits - prefix)
+    parent = address & ~(parent_size - 1)
+    if not requirements:
+        raise SubnetError("VLSM needs at least one host requirement")
+    names = [name for name, _ in requirements]
+    hosts = [count for _, count in requirements]
+    if min(hosts) < 1:
+        raise SubnetError("host counts must be at least 1")
+    # Python int par hi check - bahut bade count int64 array mein OverflowError dete.
+    # IPv4 ko network + broadcast bhi chahiye, IPv6 mein poora block usable hai
+    if max(hosts) > (parent_size - 1 if version == 4 else parent_size):
+        raise SubnetError(f"{max(hosts)} hosts do not fit in /{prefix}")
+
+    if version == 4:
+        host_array = np.array(hosts, dtype=np.int64)
+        block_bits = _block_bits(host_array)
+        sizes = np.left_shift(np.uint64(1), block_bits.astype(np.uint64))
+        order = np.argsort(-block_bits, kind="stable")
+        offsets = np.empty_like(sizes)
+        offsets[order] = np.cumsum(sizes[order]) - sizes[order]
+        used = int(sizes.sum())
+        if used > parent_size:
+            raise SubnetError(f"requirements need {used} addresses but /{prefix} has {parent_size}")
+        rows = rows_from_columns(_ipv4_columns(np.uint64(parent) + offsets, IPV4_BITS - block_bits))
+    else:
+        block_bits_list = [max(count - 1, 0).bit_length() for count in hosts]
+        order_list = sorted(range(len(hosts)), key=lambda index: -block_bits_list[index])
+        starts = [0] * len(hosts)
+        used = 0
+        for index in order_list:
+            starts[index] = used
+            used += 1 << block_bits_list[index]
+        if used > parent_size:
+            raise SubnetError(f"requirements need {used} addresses but /{prefix} has {parent_size}")
+        rows = [
+            _describe_scalar(6, parent + start, IPV6_BITS - block)
+            for start, block in zip(starts, block_bits_list)
+        ]
+
+    for row, name, count in zip(rows, names, hosts):
+        row["name"] = name
+        row["hosts_requested"] = count
+    return {
+        "network": f"{_format(version, parent)}/{prefix}",
+        "allocations": rows,
+        "used_addresses": used,
+        "free_addresses": parent_size - used,
+        "utilization": round(used / parent_size, 4),
+    }
+
+
+def _ipv4_blocks(starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """[start, end) ranges ko minimum aligned CIDR blocks mein (sab ranges ek saath)."""
+    out_starts, out_bits = [], []
+    while starts.size:
+        # Start ka alignment (lowest set bit) aur bachi range mein fit hone wala sabse bada block
+        alignment = np.where(starts == 0, np.uint64(1 << IPV4_BITS), starts & (~starts + np.uint64(1)))
+        _, align_bits = np.frexp(alignment.astype(np.float64))
+        _, room_bits = np.frexp((ends - starts).astype(np.float64))
+        block_bits = np.minimum(align_bits, room_bits).astype(np.int64) - 1
+        out_starts.append(starts)
+        out_bits.append(block_bits)
+        starts = starts + np.left_shift(np.uint64(1), block_bits.astype(np.uint64))
+        remaining = starts < ends
+        starts, ends = starts[remaining], ends[remaining]
+    if not out_starts:
+        return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+    starts, bits = np.concatenate(out_starts), np.concatenate(out_bits)
+    order = np.argsort(starts, kind="stable")
+    return starts[order], bits[order]
+
+
+def _scalar_blocks(ranges: Iterable[Tuple[int, int]], bits: int) -> List[Tuple[int, int]]:
+    """Sorted [start, end) ranges ko merge karke (start, prefix) blocks."""
+    merged: List[List[int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    blocks = []
+    for start, end in merged:
+        while start < end:
+            alignment = (start & -start) if start else 1 << bits
+            block = min(alignment.bit_length(), (end - start).bit_length()) - 1
+            blocks.append((start, bits - block))
+            start += 1 << block
+    return blocks
+
+
+def _supernet(version: int, low: int, high: int) -> str:
+    """Sabse chhota ek prefix jo [low, high] dono ko cover kare."""
+    bits = IPV4_BITS if version == 4 else IPV6_BITS
+    prefix = bits - (low ^ high).bit_length()
+    network = low & ~((1 << (bits - prefix)) - 1)
+    return f"{_format(version, network)}/{prefix}"
+
+
+def summarize(cidrs: Sequence[str]) -> Dict[str, Any]:
+    """Route summarization: overlapping/adjacent CIDRs ka minimum covering set.
+
+    `routes` exact hai (koi extra address nahi); `supernets` har IP version ka
+    ek single summary route hai jo saare inputs ko cover karta hai.
+    """
+    if not cidrs:
+        raise SubnetError("summarize needs at least one CIDR")
+    parsed = _parse_ipv4_bulk(cidrs) if all(isinstance(cidr, str) for cidr in cidrs) else None
+    bulk = parsed[:2] if parsed is not None and parsed[2].all() else None
+    ipv6_ranges: List[Tuple[int, int]] = []
+    if bulk is None:
+        ipv4_addresses, ipv4_prefixes = [], []
+        for cidr in cidrs:
+            version, address, prefix = parse_cidr(cidr)
+            if version == 4:
+                ipv4_addresses.append(address)
+                ipv4_prefixes.append(prefix)
+            else:
+                size = 1 << (IPV6_BITS - prefix)
+                network = address & ~(size - 1)
+                ipv6_ranges.append((network, network + size))
+        bulk = np.array(ipv4_addresses, dtype=np.uint32), np.array(ipv4_prefixes, dtype=np.int64)
+
+    routes: List[str] = []
+    supernets: List[str] = []
+    if bulk[0].size:
+        networks, sizes = _ipv4_ranges(*bulk)
+        order = np.argsort(networks, kind="stable")
+        starts, ends = networks[order], (networks + sizes)[order]
+        # Naya group tab jab start pichhle sab ends ke max se aage ho (adjacent bhi merge)
+        reach = np.maximum.accumulate(ends)
+        boundaries = np.flatnonzero(starts[1:] > reach[:-1]) + 1
+        group_starts = starts[np.concatenate(([0], boundaries))]
+        group_ends = reach[np.concatenate((boundaries - 1, [starts.size - 1]))]
+        block_starts, block_bits = _ipv4_blocks(group_starts, group_ends)
+        routes.extend(format_ipv4(block_starts, IPV4_BITS - block_bits))
+        supernets.append(_supernet(4, int(group_starts[0]), int(group_ends[-1]) - 1))
+    if ipv6_ranges:
+        blocks = _scalar_blocks(ipv6_ranges, IPV6_BITS)
+        routes.extend(f"{_format(6, start)}/{prefix}" for start, prefix in blocks)
+        last = max(end for _, end in ipv6_ranges)
+        supernets.append(_supernet(6, min(start for start, _ in ipv6_ranges), last - 1))
+    return {
+        "input_count": len(cidrs),
+        "route_count": len(routes),
+        "routes": routes,
+        "supernets": supernets,
+    }
+
+
+def rows_from_columns(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
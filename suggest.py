@@ -0,0 +1,210 @@
+"""Typeahead suggestions for the chat input (`GET /suggest?q=`).
+
+Topic keys, keywords aur popular past questions ek sorted array mein rehte
+hain; prefix ki range do `bisect` se milti hai aur usme se popularity ke
+hisaab se top-N nikalte hain. Chhote prefixes (har keystroke ke pehle do-teen
+letters, jahan range sabse badi hoti hai) ke results build ke waqt hi encoded
+bytes mein ban jaate hain, isliye hot path ek dict lookup hai.
+
+Popularity /ask traffic se aati hai; index immutable hai aur background
+refresh mein naya bana kar ek assignment se swap hota hai.
+"""
+import asyncio
+import heapq
+import json
+import logging
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set, Tuple
+
+from knowledge import KnowledgeStore
+
+logger = logging.getLogger("netpath.suggest")
+
+# Itne lambe sawal suggestion nahi bante (paste kiye hue tickets waghera)
+MAX_QUESTION_LENGTH = 80
+
+
+def normalize_prefix(text: str) -> str:
+    """Lowercase, whitespace collapse - aakhri space rakha jata hai ("what is ")."""
+    collapsed = " ".join(text.lower().split())
+    if collapsed and text[-1:].isspace():
+        collapsed += " "
+    return collapsed
+
+
+def encode_suggestions(query: str, suggestions: List[Tuple[str, int]]) -> bytes:
+    payload = {"query": query, "suggestions": [{"text": text, "popularity": score} for text, score in suggestions]}
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class SuggestIndex:
+    """Phrases ka sorted array + chhote prefixes ke precomputed results."""
+
+    __slots__ = ("phrases", "weights", "max_results", "precompute_depth", "_precomputed", "_encoded")
+
+    def __init__(self, phrases: Dict[str, int], max_results: int = 20, precompute_depth: int = 3):
+        ordered = sorted(phrases.items())
+        self.phrases: Tuple[str, ...] = tuple(phrase for phrase, _ in ordered)
+        self.weights: Tuple[int, ...] = tuple(weight for _, weight in ordered)
+        self.max_results = max_results
+        self.precompute_depth = precompute_depth
+
+        prefixes = {phrase[:n] for phrase in self.phrases for n in range(1, precompute_depth + 1)}
+        self._precomputed: Dict[str, List[Tuple[str, int]]] = {
+            prefix: self._rank(prefix, max_results) for prefix in prefixes
+        }
+        # Chhote prefixes ke encoded bodies pehli request par cache - har keystroke par JSON encode nahi
+        self._encoded: Dict[Tuple[str, int], bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def _rank(self, prefix: str, limit: int) -> List[Tuple[str, int]]:
+        start = bisect_left(self.phrases, prefix)
+        end = bisect_left(self.phrases, prefix + "\uffff", start)
+        # Zyada popular pehle, barabar ho to chhota phrase pehle
+        best = heapq.nsmallest(
+            limit, range(start, end), key=lambda i: (-self.weights[i], len(self.phrases[i]), self.phrases[i])
+        )
+        return [(self.phrases[i], self.weights[i]) for i in best]
+
+    def complete(self, prefix: str, limit: int = 8) -> List[Tuple[str, int]]:
+        """Prefix se shuru hone wale top `limit` phrases (text, popularity)."""
+        if not prefix:
+            return []
+        if len(prefix) <= self.precompute_depth and limit <= self.max_results:
+            return self._precomputed.get(prefix, [])[:limit]
+        return self._rank(prefix, limit)
+
+    def encoded(self, prefix: str, limit: int = 8) -> bytes:
+        """complete() ka JSON body; precomputed prefixes ke bytes cache hote hain."""
+        if len(prefix) > self.precompute_depth:
+            return encode_suggestions(prefix, self.complete(prefix, limit))
+        key = (prefix, limit)
+        body = self._encoded.get(key)
+        if body is None:
+            body = encode_suggestions(prefix, self.complete(prefix, limit))
+            if prefix in self._precomputed or len(self._encoded) < 4096:
+                self._encoded[key] = body
+        return body
+
+
+class PopularQuestions:
+    """Bounded question counter - bhar jaane par kam count wale aadhe hat jaate hain.
+
+    Raw user text sabko dikhta hai, isliye sawal tabhi `top()` mein aata hai
+    jab `min_sources` alag clients ne use poocha ho - ek insaan ka likha
+    (password, naam, gaali) kabhi suggestion nahi banta. Sources sirf
+    threshold tak yaad rakhe jaate hain (client key ka hash), uske baad nahi.
+    """
+
+    def __init__(self, max_entries: int = 10000, min_sources: int = 3):
+        self.max_entries = max_entries
+        self.min_sources = max(1, min_sources)
+        self._counts: Dict[str, int] = {}
+        # Threshold tak pahunchne se pehle ke distinct sources
+        self._sources: Dict[str, Set[int]] = {}
+        self._surfaced: Set[str] = set()
+        self._lock = threading.Lock()
+        # Har surfaced record par badhta hai - rebuild tabhi jab dikhne wala kuch badla ho
+        self.changes = 0
+
+    def record(self, question: str, source: str) -> None:
+        if not question or len(question) > MAX_QUESTION_LENGTH:
+            return
+        with self._lock:
+            counts = self._counts
+            counts[question] = counts.get(question, 0) + 1
+            if question in self._surfaced:
+                self.changes += 1
+            else:
+                sources = self._sources.setdefault(question, set())
+                sources.add(hash(source))
+                if len(sources) >= self.min_sources:
+                    del self._sources[question]
+                    self._surfaced.add(question)
+                    self.changes += 1
+            if len(counts) > self.max_entries:
+                keep = heapq.nlargest(self.max_entries // 2, counts.items(), key=lambda item: item[1])
+                self._counts = dict(keep)
+                self._sources = {q: self._sources[q] for q in self._counts if q in self._sources}
+                self._surfaced &= self._counts.keys()
+
+    def top(self, limit: int) -> List[Tuple[str, int]]:
+        with self._lock:
+            surfaced = ((question, self._counts[question]) for question in self._surfaced)
+            return heapq.nlargest(limit, surfaced, key=lambda item: item[1])
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    @property
+    def surfaced(self) -> int:
+        return len(self._surfaced)
+
+
+class SuggestService:
+    """Live SuggestIndex rakhta hai aur popularity badalne par use rebuild karta hai."""
+
+    def __init__(
+        self,
+        knowledge: KnowledgeStore,
+        max_popular: int = 2000,
+        max_tracked: int = 10000,
+        precompute_depth: int = 3,
+        min_sources: int = 3,
+    ):
+        self.knowledge = knowledge
+        self.max_popular = max_popular
+        self.precompute_depth = precompute_depth
+        self.popular = PopularQuestions(max_tracked, min_sources)
+        self.rebuilds = 0
+        self._built_from: Optional[Tuple[int, int]] = None
+        self._current = self._build()
+
+    @property
+    def current(self) -> SuggestIndex:
+        return self._current
+
+    def _build(self) -> SuggestIndex:
+        snapshot = self.knowledge.current
+        self._built_from = (snapshot.version, self.popular.changes)
+        phrases: Dict[str, int] = {}
+        for term in (*snapshot.entries, *snapshot.keywords):
+            term = normalize_prefix(term).strip()
+            if term:
+                phrases[term] = 1
+        for question, count in self.popular.top(self.max_popular):
+            phrases[question] = phrases.get(question, 0) + count
+        return SuggestIndex(phrases, precompute_depth=self.precompute_depth)
+
+    def record(self, question: str, source: str) -> None:
+        """Jawab mila hua sawal popularity mein jodta hai; `source` poochne wala client (IP)."""
+        self.popular.record(normalize_prefix(question).strip(), source)
+
+    def rebuild(self) -> bool:
+        """Naya sawal aaya ho ya knowledge snapshot badla ho to index dobara banata hai."""
+        if self._built_from == (self.knowledge.current.version, self.popular.changes):
+            return False
+        self._current = self._build()
+        self.rebuilds += 1
+        return True
+
+    async def refresh(self, interval: float) -> None:
+        """Har `interval` second rebuild check; build event loop ke bahar hota hai."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.rebuild)
+            except Exception:
+                logger.exception("Suggest index rebuild failed")
+
+    def describe(self) -> Dict[str, int]:
+        return {
+            "phrases": len(self._current),
+            "tracked_questions": len(self.popular),
+            "surfaced_questions": self.popular.surfaced,
+            "min_sources": self.popular.min_sources,
+            "rebuilds": self.rebuilds,
+        }